@@ -0,0 +1,174 @@
+"""
+Console reporting helpers shared by the negotiation and reverse auction examples.
+
+Each helper builds its output as a list of lines and writes it to the
+underlying stdout buffer in one go rather than issuing a print() per line.
+"""
+
+import sys
+
+
+def write_lines(lines):
+    """Encode lines once and write them to stdout with a single call."""
+    payload = "\n".join(lines) + "\n"
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:  # e.g. a StringIO replacement or a notebook stream
+        out.write(payload)
+        return
+    # Flush pending text first so earlier print() output stays in order
+    out.flush()
+    buffer.write(payload.encode(out.encoding or "utf-8", errors="replace"))
+    buffer.flush()
+
+
+def format_time(ts, millis: bool = True) -> str:
+    """Format a timestamp as HH:MM:SS[.mmm] without going through strftime."""
+    hms = f"{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}"
+    return f"{hms}.{ts.microsecond // 1000:03d}" if millis else hms
+
+
+def print_event_log(events, label: str):
+    """Print formatted event log."""
+    lines = [f"\n{label} EVENTS ({len(events)}):"]
+    for i, event in enumerate(events, 1):
+        data = event.data
+        context = (
+            f" (context: {event.context_id[:8]}...)" if event.context_id else ""
+        )
+        if "offer" in data:
+            detail = f" - ${data['offer'].get('price', 'N/A')}"
+        elif "offer_id" in data:
+            detail = f" - offer_id: {data['offer_id'][:12]}..."
+        elif "round_number" in data:
+            detail = f" - round {data['round_number']}"
+        else:
+            detail = ""
+        timestamp = format_time(event.timestamp)
+        lines.append(
+            f"  {i}. [{timestamp}] {event.event_type.value}{context}{detail}"
+        )
+    lines.append("")
+    write_lines(lines)
+
+
+def _offer_lines(offers):
+    return [
+        f"  {i}. ${offer.price} (ID: {offer.offer_id[:8]}..., at {format_time(offer.timestamp, millis=False)})"
+        for i, offer in enumerate(offers, 1)
+    ]
+
+
+def _counterparty_lines(counterparties):
+    return [
+        f"  - {context_id[:8]}...: {info['endpoint']}"
+        + (f" ({info['name']})" if info.get("name") else "")
+        for context_id, info in counterparties.items()
+    ]
+
+
+def print_state_summary(state, label: str):
+    """Print a summary of the session state."""
+    rule = "─" * 60
+    lines = [
+        f"\n{rule}",
+        f"{label} STATE",
+        rule,
+        f"Session ID: {state.session_id}",
+        f"Role: {state.role.value}",
+        f"Status: {state.status}",
+        f"Current Round: {state.current_round}",
+        f"\nOffers Sent ({len(state.offers_sent)}):",
+        *_offer_lines(state.offers_sent.values()),
+        f"\nOffers Received ({len(state.offers_received)}):",
+        *_offer_lines(state.offers_received.values()),
+    ]
+
+    if state.last_offer_sent:
+        lines.append(f"\nLast Offer Sent: ${state.last_offer_sent.price}")
+    if state.last_offer_received:
+        lines.append(f"Last Offer Received: ${state.last_offer_received.price}")
+
+    lines.append(f"\nCounterparties ({len(state.counterparties)}):")
+    lines.extend(_counterparty_lines(state.counterparties))
+
+    lines.append(f"{rule}\n")
+    write_lines(lines)
+
+
+def print_detailed_state(client, server, session_id: str):
+    """Print state and events from both client and server."""
+    # Buyer (client) state
+    client_state = client.state_manager.get_session(session_id)
+    if client_state:
+        print_state_summary(client_state, "BUYER (CLIENT)")
+        events = client.state_manager.get_events(session_id)
+        print_event_log(events, "BUYER")
+
+    # Seller (server) state
+    server_sessions = server.state_manager.list_sessions()
+    if server_sessions:
+        server_state = server_sessions[0]
+        server_session_id = server_state.session_id
+        print_state_summary(server_state, "SELLER (SERVER)")
+        events = server.state_manager.get_events(server_session_id)
+        print_event_log(events, "SELLER")
+
+
+def print_reverse_auction_state(state, label: str):
+    """Print a summary of the reverse auction state."""
+    rule = "─" * 70
+    lines = [
+        f"\n{rule}",
+        f"{label} STATE",
+        rule,
+        f"Session ID: {state.session_id}",
+        f"Role: {state.role.value}",
+        f"Status: {state.status}",
+        f"Current Round: {state.current_round}/{state.total_rounds}",
+        f"Round Duration: {state.round_duration}s",
+        "\nOffers by Round:",
+    ]
+    for round_num in sorted(state.offers_by_round):
+        offers = state.offers_by_round[round_num]
+        lines.append(f"  Round {round_num}: {len(offers)} offers")
+        lines.extend(
+            f"    - ${offer.price:.2f} at {format_time(offer.timestamp, millis=False)}"
+            for offer in offers
+        )
+
+    lines.append(f"\nTotal Offers Received: {len(state.all_offers)}")
+
+    lines.append(f"\nCounterparties ({len(state.counterparties)}):")
+    lines.extend(_counterparty_lines(state.counterparties))
+
+    lines.append(f"\nDiscovery Messages ({len(state.discovery_messages)}):")
+    lines.extend(
+        f"  {i}. {disc.get('data', {}).get('message', 'N/A')[:80]}..."
+        for i, disc in enumerate(state.discovery_messages[-3:], 1)  # Show last 3
+    )
+
+    lines.append(f"{rule}\n")
+    write_lines(lines)
+
+
+def print_reverse_auction_details(client, servers):
+    """Print state and events from the buyer client and all seller servers."""
+    # Buyer (client) state
+    client_sessions = client.state_manager.list_sessions()
+    if client_sessions:
+        buyer_state = client_sessions[0]
+        print_reverse_auction_state(buyer_state, "BUYER (CLIENT)")
+        events = client.state_manager.get_events(buyer_state.session_id)
+        print_event_log(events, "BUYER")
+
+    # Seller (server) states
+    for idx, server in enumerate(servers, 1):
+        server_sessions = server.state_manager.list_sessions()
+        if server_sessions:
+            server_state = server_sessions[0]
+            print_reverse_auction_state(
+                server_state, f"SELLER {server.name} (SERVER {idx})"
+            )
+            events = server.state_manager.get_events(server_state.session_id)
+            print_event_log(events, f"SELLER {server.name}")
@@ -8,10 +8,20 @@ import logging
 import sys
 import argparse
 from pathlib import Path
-from threading import Thread
 
 import uvicorn
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional - fall back to the stdlib event loop
+    uvloop = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain Python arithmetic
+    njit = None
+
+from _pretty import print_detailed_state
 from shaket.core.types import Item, SessionType, AgentRole
 from shaket.client import ShaketClient
 from shaket.server import ShaketServer
@@ -22,75 +32,18 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
-def print_event_log(events, label: str):
-    """Print formatted event log."""
-    print(f"\n{label} EVENTS ({len(events)}):")
-    for i, event in enumerate(events, 1):
-        timestamp = event.timestamp.strftime("%H:%M:%S.%f")[:-3]
-        event_info = f"  {i}. [{timestamp}] {event.event_type.value}"
-        if event.context_id:
-            event_info += f" (context: {event.context_id[:8]}...)"
-        if "offer" in event.data:
-            offer_data = event.data["offer"]
-            event_info += f" - ${offer_data.get('price', 'N/A')}"
-        elif "offer_id" in event.data:
-            event_info += f" - offer_id: {event.data['offer_id'][:12]}..."
-        print(event_info)
-    print()
-
-
-def print_state_summary(state, label: str):
-    """Print a summary of the session state."""
-    print(f"\n{'─'*60}")
-    print(f"{label} STATE")
-    print(f"{'─'*60}")
-    print(f"Session ID: {state.session_id}")
-    print(f"Role: {state.role.value}")
-    print(f"Status: {state.status}")
-    print(f"Current Round: {state.current_round}")
-
-    print(f"\nOffers Sent ({len(state.offers_sent)}):")
-    for i, offer in enumerate(state.offers_sent.values(), 1):
-        print(
-            f"  {i}. ${offer.price} (ID: {offer.offer_id[:8]}..., at {offer.timestamp.strftime('%H:%M:%S')})"
-        )
-
-    print(f"\nOffers Received ({len(state.offers_received)}):")
-    for i, offer in enumerate(state.offers_received.values(), 1):
-        print(
-            f"  {i}. ${offer.price} (ID: {offer.offer_id[:8]}..., at {offer.timestamp.strftime('%H:%M:%S')})"
-        )
-
-    if state.last_offer_sent:
-        print(f"\nLast Offer Sent: ${state.last_offer_sent.price}")
-    if state.last_offer_received:
-        print(f"Last Offer Received: ${state.last_offer_received.price}")
-
-    print(f"\nCounterparties ({len(state.counterparties)}):")
-    for context_id, info in state.counterparties.items():
-        name_str = f" ({info['name']})" if info.get("name") else ""
-        print(f"  - {context_id[:8]}...: {info['endpoint']}{name_str}")
-
-    print(f"{'─'*60}\n")
+def _counter(
+    our_last: float, theirs: float, step_denom: float, clamp: float, is_buyer: bool
+) -> float:
+    """Move 1/step_denom of the way toward their offer, clamped to our limit."""
+    counter = round(our_last + (theirs - our_last) / step_denom, 2)
+    if is_buyer:
+        return min(counter, clamp)
+    return max(counter, clamp)
 
 
-def print_detailed_state(client, server, session_id: str):
-    """Print state and events from both client and server."""
-    # Buyer (client) state
-    client_state = client.state_manager.get_session(session_id)
-    if client_state:
-        print_state_summary(client_state, "BUYER (CLIENT)")
-        events = client.state_manager.get_events(session_id)
-        print_event_log(events, "BUYER")
-
-    # Seller (server) state
-    server_sessions = server.state_manager.list_sessions()
-    if server_sessions:
-        server_state = server_sessions[0]
-        server_session_id = server_state.session_id
-        print_state_summary(server_state, "SELLER (SERVER)")
-        events = server.state_manager.get_events(server_session_id)
-        print_event_log(events, "SELLER")
+if njit is not None:
+    _counter = njit(cache=True, fastmath=True)(_counter)
 
 
 class PowerBankBuyerAgent:
@@ -101,31 +54,27 @@ class PowerBankBuyerAgent:
         self.max_price = max_price
 
     async def decide_next_action(self, session_id: str, state):
-        last_offer = state.last_offer_received
+        last_recv = state.last_offer_received
+        target = self.target_price
+        maxp = self.max_price
 
         # Opening offer
-        if not last_offer:
-            logger.info(f"🔵 BUYER: Making first offer → ${self.target_price}")
-            return SendOfferAction(
-                price=self.target_price, message=f"How about ${self.target_price}?"
-            )
+        if not last_recv:
+            logger.info(f"🔵 BUYER: Making first offer → ${target}")
+            return SendOfferAction(price=target, message=f"How about ${target}?")
 
-        logger.info(
-            f"🔵 BUYER (Round {state.current_round}): Received ${last_offer.price}"
-        )
+        their_price = last_recv.price
+        logger.info(f"🔵 BUYER (Round {state.current_round}): Received ${their_price}")
 
         # Accept if within budget
-        if last_offer.price <= self.max_price:
-            logger.info(f"🔵 BUYER: ✅ ACCEPTING ${last_offer.price}!")
-            return AcceptOfferAction(offer_id=last_offer.offer_id, message="Deal!")
+        if their_price <= maxp:
+            logger.info(f"🔵 BUYER: ✅ ACCEPTING ${their_price}!")
+            return AcceptOfferAction(offer_id=last_recv.offer_id, message="Deal!")
 
         # Counter: move 1/3 of the way from our last offer toward their offer
-        our_last_price = (
-            state.last_offer_sent.price if state.last_offer_sent else self.target_price
-        )
-        gap = last_offer.price - our_last_price
-        counter = round(our_last_price + (gap / 3), 2)
-        counter = min(counter, self.max_price)
+        last_sent = state.last_offer_sent
+        our_last_price = last_sent.price if last_sent else target
+        counter = _counter(our_last_price, their_price, 3.0, maxp, True)
         logger.info(f"🔵 BUYER: Counter offer → ${counter} (from ${our_last_price})")
         return SendOfferAction(price=counter, message=f"I can do ${counter}")
 
@@ -138,26 +87,23 @@ class PowerBankSellerAgent:
         self.min_price = min_price
 
     async def decide_next_action(self, session_id: str, state):
-        last_offer = state.last_offer_received
+        last_recv = state.last_offer_received
 
         # Respond to offer
-        if last_offer:
-            logger.info(f"🔴 SELLER: Received ${last_offer.price}")
+        if last_recv:
+            their_price = last_recv.price
+            minp = self.min_price
+            logger.info(f"🔴 SELLER: Received ${their_price}")
 
             # Accept if above minimum
-            if last_offer.price >= self.min_price:
-                logger.info(f"🔴 SELLER: ✅ ACCEPTING ${last_offer.price}!")
-                return AcceptOfferAction(offer_id=last_offer.offer_id, message="Sold!")
+            if their_price >= minp:
+                logger.info(f"🔴 SELLER: ✅ ACCEPTING ${their_price}!")
+                return AcceptOfferAction(offer_id=last_recv.offer_id, message="Sold!")
 
             # Counter: move halfway from our last offer toward their offer
-            our_last_price = (
-                state.last_offer_sent.price
-                if state.last_offer_sent
-                else self.target_price
-            )
-            gap = last_offer.price - our_last_price
-            counter = round(our_last_price + (gap / 2), 2)
-            counter = max(counter, self.min_price)
+            last_sent = state.last_offer_sent
+            our_last_price = last_sent.price if last_sent else self.target_price
+            counter = _counter(our_last_price, their_price, 2.0, minp, False)
             logger.info(
                 f"🔴 SELLER: Counter offer → ${counter} (from ${our_last_price})"
             )
@@ -173,16 +119,32 @@ class PowerBankSellerAgent:
         )
 
 
-def start_server_background(server):
-    """Start the Shaket server in a background thread."""
+async def start_server_background(server, startup_timeout: float = 5.0):
+    """Start the Shaket server as a task on the running event loop.
 
-    def run_server():
-        uvicorn.run(
-            server.app.build(), host="localhost", port=8001, log_level="warning"
-        )
+    Returns:
+        (uvicorn_server, server_task) - set uvicorn_server.should_exit and
+        await server_task to shut it down
+    """
+    # ShaketServer registers no startup/shutdown hooks, so skip the ASGI
+    # lifespan handshake
+    config = uvicorn.Config(
+        server.app.build(),
+        host="localhost",
+        port=8001,
+        log_level="warning",
+        lifespan="off",
+    )
+    uvicorn_server = uvicorn.Server(config)
+    server_task = asyncio.create_task(uvicorn_server.serve())
+
+    # Wait for uvicorn to bind the socket instead of sleeping a fixed time
+    async def wait_started():
+        while not uvicorn_server.started:
+            await asyncio.sleep(0.01)
 
-    server_thread = Thread(target=run_server, daemon=True)
-    server_thread.start()
+    await asyncio.wait_for(wait_started(), timeout=startup_timeout)
+    return uvicorn_server, server_task
 
 
 async def main(show_state: bool = False):
@@ -228,57 +190,64 @@ async def main(show_state: bool = False):
         port=8001,
     )
 
-    start_server_background(server)
-    await asyncio.sleep(2)
+    uvicorn_server, server_task = await start_server_background(server)
     print("✅ Server started\n")
 
-    # Create client (buyer side) with completion callback
-    async def on_complete(result):
-        """Callback when negotiation completes."""
-        print("\n" + "=" * 60)
-        print("NEGOTIATION COMPLETE!")
-        print("=" * 60)
-        if result.data.get("agreed"):
-            print(f"✅ Deal reached at ${result.data.get('final_price')}")
-        else:
-            print(f"❌ No deal reached (deadlock)")
-        print(f"Total rounds: {result.data.get('rounds', 0)}")
-        print("=" * 60 + "\n")
-
-    client = await ShaketClient.create(
-        name="PowerBank Buyer",
-        description="Buyer looking for power bank deals",
-        remote_agent_urls=["http://localhost:8001"],
-        negotiation_agent=buyer_agent,
-        on_session_complete=on_complete,
-    )
+    client = None
+    try:
+        # Create client (buyer side) with completion callback
+        async def on_complete(result):
+            """Callback when negotiation completes."""
+            print("\n" + "=" * 60)
+            print("NEGOTIATION COMPLETE!")
+            print("=" * 60)
+            if result.data.get("agreed"):
+                print(f"✅ Deal reached at ${result.data.get('final_price')}")
+            else:
+                print(f"❌ No deal reached (deadlock)")
+            print(f"Total rounds: {result.data.get('rounds', 0)}")
+            print("=" * 60 + "\n")
+
+        client = await ShaketClient.create(
+            name="PowerBank Buyer",
+            description="Buyer looking for power bank deals",
+            remote_agent_urls=["http://localhost:8001"],
+            negotiation_agent=buyer_agent,
+            on_session_complete=on_complete,
+        )
 
-    # Start negotiation
-    print("Starting negotiation...")
-    print(f"   Item: {power_bank.name}")
-    print(
-        f"   🔵 Buyer: Target ${buyer_agent.target_price}, will pay up to ${buyer_agent.max_price}"
-    )
-    print(
-        f"   🔴 Seller: Target ${seller_agent.target_price}, will accept down to ${seller_agent.min_price}"
-    )
-    print(f"\n{'='*60}\n")
+        # Start negotiation
+        print("Starting negotiation...")
+        print(f"   Item: {power_bank.name}")
+        print(
+            f"   🔵 Buyer: Target ${buyer_agent.target_price}, will pay up to ${buyer_agent.max_price}"
+        )
+        print(
+            f"   🔴 Seller: Target ${seller_agent.target_price}, will accept down to ${seller_agent.min_price}"
+        )
+        print(f"\n{'='*60}\n")
 
-    result = await client.start_negotiation(
-        counterparty_endpoint="http://localhost:8001",
-        item=power_bank,
-        role="buyer",
-        max_rounds=10,
-    )
+        result = await client.start_negotiation(
+            counterparty_endpoint="http://localhost:8001",
+            item=power_bank,
+            role="buyer",
+            max_rounds=10,
+        )
 
-    if not result["success"]:
-        logger.error(f"❌ Failed to start negotiation: {result.get('error')}")
-        return
+        if not result.success:
+            logger.error(f"❌ Failed to start negotiation: {result.error}")
+            return
 
-    if show_state:
-        session_id = result.get("session_id")
-        if session_id:
-            print_detailed_state(client, server, session_id)
+        if show_state:
+            session_id = result.session_id
+            if session_id:
+                print_detailed_state(client, server, session_id)
+    finally:
+        if client:
+            await client.close()
+        await ShaketClient.aclose_shared()
+        uvicorn_server.should_exit = True
+        await server_task
 
 
 if __name__ == "__main__":
@@ -290,4 +259,7 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    asyncio.run(main(show_state=args.show_state))
+    if uvloop:
+        uvloop.run(main(show_state=args.show_state))
+    else:
+        asyncio.run(main(show_state=args.show_state))
@@ -11,104 +11,141 @@ The agents use structured function calling to decide actions:
 """
 
 import asyncio
-import json
+import functools
 import logging
 import os
 import sys
 import argparse
+from itertools import islice
 from pathlib import Path
-from threading import Thread
 from typing import Optional
 
 import uvicorn
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional - fall back to the stdlib event loop
+    uvloop = None
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional - fall back to the stdlib parser
+    from json import loads as json_loads
+
 from dotenv import load_dotenv
 
+from _pretty import print_detailed_state
 from shaket.core.types import Item, SessionType, AgentRole
-from shaket.client import ShaketClient
+from shaket.client import ShaketClient, StartResult
 from shaket.server import ShaketServer
 from shaket.agents import (
     SendOfferAction,
     AcceptOfferAction,
-    SendDiscoveryAction,
     get_action_schemas_for_llm,
+    parse_action,
 )
 
-load_dotenv(override=True)
-
 logging.basicConfig(level=logging.WARNING, format="%(message)s")
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
-def print_event_log(events, label: str):
-    """Print formatted event log."""
-    print(f"\n{label} EVENTS ({len(events)}):")
-    for i, event in enumerate(events, 1):
-        timestamp = event.timestamp.strftime("%H:%M:%S.%f")[:-3]
-        event_info = f"  {i}. [{timestamp}] {event.event_type.value}"
-        if event.context_id:
-            event_info += f" (context: {event.context_id[:8]}...)"
-        if "offer" in event.data:
-            offer_data = event.data["offer"]
-            event_info += f" - ${offer_data.get('price', 'N/A')}"
-        elif "offer_id" in event.data:
-            event_info += f" - offer_id: {event.data['offer_id'][:12]}..."
-        print(event_info)
-    print()
-
-
-def print_state_summary(state, label: str):
-    """Print a summary of the session state."""
-    print(f"\n{'─'*60}")
-    print(f"{label} STATE")
-    print(f"{'─'*60}")
-    print(f"Session ID: {state.session_id}")
-    print(f"Role: {state.role.value}")
-    print(f"Status: {state.status}")
-    print(f"Current Round: {state.current_round}")
-
-    print(f"\nOffers Sent ({len(state.offers_sent)}):")
-    for i, offer in enumerate(state.offers_sent.values(), 1):
-        print(
-            f"  {i}. ${offer.price} (ID: {offer.offer_id[:8]}..., at {offer.timestamp.strftime('%H:%M:%S')})"
-        )
+# Tool schemas are identical for every agent and round - build the litellm
+# wrapper once at import time instead of on every LLM call.
+_LITELLM_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": tool["name"],
+            "description": tool["description"],
+            "parameters": tool["parameters"],
+        },
+    }
+    for tool in get_action_schemas_for_llm()
+]
 
-    print(f"\nOffers Received ({len(state.offers_received)}):")
-    for i, offer in enumerate(state.offers_received.values(), 1):
-        print(
-            f"  {i}. ${offer.price} (ID: {offer.offer_id[:8]}..., at {offer.timestamp.strftime('%H:%M:%S')})"
-        )
 
-    if state.last_offer_sent:
-        print(f"\nLast Offer Sent: ${state.last_offer_sent.price}")
-    if state.last_offer_received:
-        print(f"Last Offer Received: ${state.last_offer_received.price}")
+# Appended after the static prompt so the prefix stays byte-identical across
+# rounds (cheaper to build, and eligible for provider-side prompt caching)
+_ROUND_SUFFIX = "\n\nCURRENT ROUND: {}"
 
-    print(f"\nCounterparties ({len(state.counterparties)}):")
-    for context_id, info in state.counterparties.items():
-        name_str = f" ({info['name']})" if info.get("name") else ""
-        print(f"  - {context_id[:8]}...: {info['endpoint']}{name_str}")
 
-    print(f"{'─'*60}\n")
+@functools.lru_cache(maxsize=256)
+def _system_prompt(
+    role: str,
+    target_price: float,
+    limit_price: float,
+    item_name: str,
+    item_description: str,
+) -> str:
+    """Render the round-independent system prompt, once per agent and item."""
+    if role == "buyer":
+        return f"""You are an intelligent negotiation agent acting as a BUYER.
 
+NEGOTIATION CONTEXT:
+- Item: {item_name}
+- Description: {item_description}
+- Your target price: ${target_price} (what you'd like to pay)
+- Your maximum budget: ${limit_price} (absolute max you can spend)
 
-def print_detailed_state(client, server, session_id: str):
-    """Print state and events from both client and server."""
-    # Buyer (client) state
-    client_state = client.state_manager.get_session(session_id)
-    if client_state:
-        print_state_summary(client_state, "BUYER (CLIENT)")
-        events = client.state_manager.get_events(session_id)
-        print_event_log(events, "BUYER")
+STRATEGY:
+- Try to get the best price possible, ideally close to ${target_price}
+- Never exceed ${limit_price} - this is your hard limit
+- Be strategic: don't immediately reveal your maximum price
+- Counter offers should move gradually toward your limit
+- Accept offers that are at or below your limit
+- Use discovery messages to gather information if needed
+- Be professional but firm in your negotiations
 
-    # Seller (server) state
-    server_sessions = server.state_manager.list_sessions()
-    if server_sessions:
-        server_state = server_sessions[0]
-        server_session_id = server_state.session_id
-        print_state_summary(server_state, "SELLER (SERVER)")
-        events = server.state_manager.get_events(server_session_id)
-        print_event_log(events, "SELLER")
+AVAILABLE ACTIONS:
+1. send_offer: Propose a price (with optional message)
+2. accept: Accept the seller's offer (only if price <= ${limit_price})
+3. send_discovery: Ask questions or share information (no price commitment)
+
+Make smart decisions based on the negotiation history and current offers."""
+
+    return f"""You are an intelligent negotiation agent acting as a SELLER.
+
+NEGOTIATION CONTEXT:
+- Item: {item_name}
+- Description: {item_description}
+- Your target price: ${target_price} (what you'd like to get)
+- Your minimum price: ${limit_price} (lowest you'll accept)
+
+STRATEGY:
+- Try to sell at the best price possible, ideally close to ${target_price}
+- Never go below ${limit_price} - this is your hard limit
+- Be strategic: don't immediately reveal your minimum price
+- Counter offers should move gradually toward your limit
+- Accept offers that are at or above your limit
+- Use discovery messages to build rapport if needed
+- Be professional and persuasive in your negotiations
+
+AVAILABLE ACTIONS:
+1. send_offer: Propose a price (with optional message)
+2. accept: Accept the buyer's offer (only if price >= ${limit_price})
+3. send_discovery: Ask questions or share information (no price commitment)
+
+Make smart decisions based on the negotiation history and current offers."""
+
+
+# Tool name -> fields accepted from the LLM's arguments (tool names match the
+# actions' "action" tags, so parse_action picks the model from the name)
+_ACTION_FIELDS = {
+    "send_offer": ("price", "message", "metadata"),
+    "accept": ("offer_id", "message"),
+    "send_discovery": ("message", "discovery_data"),
+}
+
+
+# Number of past offers per side included in the LLM prompt
+_PROMPT_HISTORY = 5
+
+
+def _recent_prices(offers: dict, limit: int = _PROMPT_HISTORY) -> str:
+    """Format the last ``limit`` offer prices, oldest first."""
+    recent = list(islice(reversed(offers.values()), limit))
+    return ", ".join(f"${o.price}" for o in reversed(recent))
 
 
 class LLMNegotiationAgent:
@@ -153,57 +190,10 @@ class LLMNegotiationAgent:
 
     def _build_system_prompt(self, state, item: Item) -> str:
         """Build the system prompt for the LLM based on role and state."""
-        if self.role == "buyer":
-            return f"""You are an intelligent negotiation agent acting as a BUYER.
-
-NEGOTIATION CONTEXT:
-- Item: {item.name}
-- Description: {item.description}
-- Your target price: ${self.target_price} (what you'd like to pay)
-- Your maximum budget: ${self.limit_price} (absolute max you can spend)
-- Current round: {state.current_round}
-
-STRATEGY:
-- Try to get the best price possible, ideally close to ${self.target_price}
-- Never exceed ${self.limit_price} - this is your hard limit
-- Be strategic: don't immediately reveal your maximum price
-- Counter offers should move gradually toward your limit
-- Accept offers that are at or below your limit
-- Use discovery messages to gather information if needed
-- Be professional but firm in your negotiations
-
-AVAILABLE ACTIONS:
-1. send_offer: Propose a price (with optional message)
-2. accept: Accept the seller's offer (only if price <= ${self.limit_price})
-3. send_discovery: Ask questions or share information (no price commitment)
-
-Make smart decisions based on the negotiation history and current offers."""
-
-        else:  # seller
-            return f"""You are an intelligent negotiation agent acting as a SELLER.
-
-NEGOTIATION CONTEXT:
-- Item: {item.name}
-- Description: {item.description}
-- Your target price: ${self.target_price} (what you'd like to get)
-- Your minimum price: ${self.limit_price} (lowest you'll accept)
-- Current round: {state.current_round}
-
-STRATEGY:
-- Try to sell at the best price possible, ideally close to ${self.target_price}
-- Never go below ${self.limit_price} - this is your hard limit
-- Be strategic: don't immediately reveal your minimum price
-- Counter offers should move gradually toward your limit
-- Accept offers that are at or above your limit
-- Use discovery messages to build rapport if needed
-- Be professional and persuasive in your negotiations
-
-AVAILABLE ACTIONS:
-1. send_offer: Propose a price (with optional message)
-2. accept: Accept the buyer's offer (only if price >= ${self.limit_price})
-3. send_discovery: Ask questions or share information (no price commitment)
-
-Make smart decisions based on the negotiation history and current offers."""
+        static = _system_prompt(
+            self.role, self.target_price, self.limit_price, item.name, item.description
+        )
+        return static + _ROUND_SUFFIX.format(state.current_round)
 
     def _build_state_context(self, state) -> str:
         """Build a description of the current negotiation state."""
@@ -225,14 +215,16 @@ Make smart decisions based on the negotiation history and current offers."""
         if state.last_offer_sent:
             context_parts.append(f"Your last offer: ${state.last_offer_sent.price}")
 
-        # Offer history
+        # Offer history (only the most recent offers, to keep the prompt bounded)
         if state.offers_received:
-            prices = [o.price for o in state.offers_received.values()]
-            context_parts.append(f"Their offer history: {[f'${p}' for p in prices]}")
+            context_parts.append(
+                f"Their offer history: {_recent_prices(state.offers_received)}"
+            )
 
         if state.offers_sent:
-            prices = [o.price for o in state.offers_sent.values()]
-            context_parts.append(f"Your offer history: {[f'${p}' for p in prices]}")
+            context_parts.append(
+                f"Your offer history: {_recent_prices(state.offers_sent)}"
+            )
 
         return "\n".join(context_parts)
 
@@ -241,7 +233,35 @@ Make smart decisions based on the negotiation history and current offers."""
         Use LLM to decide the next negotiation action.
 
         The LLM will analyze the state and return a structured action using function calling.
+        Decisions fixed by the agent's hard rules (opening at the target price,
+        accepting an offer within the limit) are made without an LLM call.
         """
+        role_emoji = "🔵" if self.role == "buyer" else "🔴"
+        role_name = self.role.upper()
+        last = state.last_offer_received
+
+        # Opening move: nothing to reason about yet
+        if last is None:
+            logger.info(
+                f"{role_emoji} {role_name}: Making first offer → ${self.target_price}"
+            )
+            return SendOfferAction(
+                price=self.target_price, message=f"How about ${self.target_price}?"
+            )
+
+        # Offer already within our limit: the prompt mandates accepting it
+        within_limit = (
+            last.price <= self.limit_price
+            if self.role == "buyer"
+            else last.price >= self.limit_price
+        )
+        if within_limit:
+            logger.info(f"{role_emoji} {role_name}: ✅ ACCEPTING ${last.price}!")
+            return AcceptOfferAction(
+                offer_id=last.offer_id,
+                message="Deal!" if self.role == "buyer" else "Sold!",
+            )
+
         system_prompt = self._build_system_prompt(state, state.item)
         state_context = self._build_state_context(state)
 
@@ -252,35 +272,20 @@ CURRENT STATE:
 
 What action do you take? Respond using one of the available function calls."""
 
-        tools = get_action_schemas_for_llm()
-
-        litellm_tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool["name"],
-                    "description": tool["description"],
-                    "parameters": tool["parameters"],
-                },
-            }
-            for tool in tools
-        ]
-
-        role_emoji = "🔵" if self.role == "buyer" else "🔴"
-        role_name = self.role.upper()
         logger.info(
             f"{role_emoji} {role_name} (Round {state.current_round}): Thinking..."
         )
 
         try:
-            # Call LLM with function calling
-            response = self.litellm.completion(
+            # Call LLM with function calling (async so the event loop - and the
+            # in-process server - keep running during the round-trip)
+            response = await self.litellm.acompletion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt},
                 ],
-                tools=litellm_tools,
+                tools=_LITELLM_TOOLS,
                 tool_choice="auto",
             )
 
@@ -292,48 +297,72 @@ What action do you take? Respond using one of the available function calls."""
 
             tool_call = message.tool_calls[0]
             function_name = tool_call.function.name
-            function_args = json.loads(tool_call.function.arguments)
+            function_args = json_loads(tool_call.function.arguments)
 
-            # Log the decision
-            if function_name == "send_offer":
-                logger.info(
-                    f"{role_emoji} {role_name}: Offering ${function_args['price']} - \"{function_args.get('message', '')}\""
-                )
-                return SendOfferAction(**function_args)
+            try:
+                keys = _ACTION_FIELDS[function_name]
+            except KeyError:
+                raise ValueError(f"Unknown action type from LLM: {function_name}")
 
-            elif function_name == "accept":
-                logger.info(
-                    f"{role_emoji} {role_name}: ✅ ACCEPTING ${state.last_offer_received.price}!"
-                )
+            # Keep only the fields the action accepts (drop hallucinated keys)
+            fields = {k: function_args[k] for k in keys if k in function_args}
+            fields["action"] = function_name
+            if function_name == "accept":
                 # Use the actual offer_id from state, not what LLM generated
-                if state.last_offer_received:
-                    function_args["offer_id"] = state.last_offer_received.offer_id
-                return AcceptOfferAction(**function_args)
+                fields["offer_id"] = last.offer_id
+            action = parse_action(fields)
 
-            elif function_name == "send_discovery":
+            # Log the decision
+            if isinstance(action, SendOfferAction):
                 logger.info(
-                    f"{role_emoji} {role_name}: Sending discovery - \"{function_args.get('message', '')}\""
+                    f"{role_emoji} {role_name}: Offering ${action.price} - \"{action.message or ''}\""
                 )
-                return SendDiscoveryAction(**function_args)
-
+            elif isinstance(action, AcceptOfferAction):
+                logger.info(f"{role_emoji} {role_name}: ✅ ACCEPTING ${last.price}!")
             else:
-                raise ValueError(f"Unknown action type from LLM: {function_name}")
+                logger.info(
+                    f"{role_emoji} {role_name}: Sending discovery - \"{action.message}\""
+                )
+            return action
 
         except Exception as e:
             logger.error(f"{role_emoji} {role_name}: Error calling LLM: {e}")
             raise
 
 
-def start_server_background(server):
-    """Start the Shaket server in a background thread."""
+def has_api_key() -> bool:
+    """Check for OPENAI_API_KEY, reading .env only if it is not already set."""
+    if not os.getenv("OPENAI_API_KEY"):
+        load_dotenv(override=False)
+    return bool(os.getenv("OPENAI_API_KEY"))
 
-    def run_server():
-        uvicorn.run(
-            server.app.build(), host="localhost", port=8001, log_level="warning"
-        )
 
-    server_thread = Thread(target=run_server, daemon=True)
-    server_thread.start()
+async def start_server_background(server, startup_timeout: float = 5.0):
+    """Start the Shaket server as a task on the running event loop.
+
+    Returns:
+        (uvicorn_server, server_task) - set uvicorn_server.should_exit and
+        await server_task to shut it down
+    """
+    # ShaketServer registers no startup/shutdown hooks, so skip the ASGI
+    # lifespan handshake
+    config = uvicorn.Config(
+        server.app.build(),
+        host=server.host,
+        port=server.port,
+        log_level="warning",
+        lifespan="off",
+    )
+    uvicorn_server = uvicorn.Server(config)
+    server_task = asyncio.create_task(uvicorn_server.serve())
+
+    # Wait for uvicorn to bind the socket instead of sleeping a fixed time
+    async def wait_started():
+        while not uvicorn_server.started:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait_started(), timeout=startup_timeout)
+    return uvicorn_server, server_task
 
 
 async def main(show_state: bool = False):
@@ -349,7 +378,7 @@ async def main(show_state: bool = False):
     print("=" * 60 + "\n")
 
     # Check for API key
-    if not os.getenv("OPENAI_API_KEY"):
+    if not has_api_key():
         print(" ⚠️ Set OPENAI_API_KEY in your .env file")
         return
 
@@ -388,59 +417,143 @@ async def main(show_state: bool = False):
         port=8001,
     )
 
-    start_server_background(server)
-    await asyncio.sleep(2)
+    uvicorn_server, server_task = await start_server_background(server)
     print("✅ Server started\n")
 
-    # Create client (buyer side) with completion callback
-    async def on_complete(result):
-        """Callback when negotiation completes."""
-        print("\n" + "=" * 60)
-        print("NEGOTIATION COMPLETE!")
-        print("=" * 60)
+    client = None
+    try:
+        # Create client (buyer side) with completion callback
+        async def on_complete(result):
+            """Callback when negotiation completes."""
+            print("\n" + "=" * 60)
+            print("NEGOTIATION COMPLETE!")
+            print("=" * 60)
+
+            if result.data.get("agreed"):
+                print(f"✅ Deal reached at ${result.data.get('final_price')}")
+            else:
+                print(f"❌ No deal reached (deadlock)")
+            print(f"Total rounds: {result.data.get('rounds', 0)}")
+            print("=" * 60 + "\n")
+
+        client = await ShaketClient.create(
+            name="PowerBank Buyer (LLM)",
+            description="AI-powered buyer looking for power bank deals",
+            remote_agent_urls=["http://localhost:8001"],
+            negotiation_agent=buyer_agent,
+            on_session_complete=on_complete,
+        )
 
-        if result.data.get("agreed"):
-            print(f"✅ Deal reached at ${result.data.get('final_price')}")
-        else:
-            print(f"❌ No deal reached (deadlock)")
-        print(f"Total rounds: {result.data.get('rounds', 0)}")
-        print("=" * 60 + "\n")
-
-    client = await ShaketClient.create(
-        name="PowerBank Buyer (LLM)",
-        description="AI-powered buyer looking for power bank deals",
-        remote_agent_urls=["http://localhost:8001"],
-        negotiation_agent=buyer_agent,
-        on_session_complete=on_complete,
-    )
+        # Start negotiation
+        print("Starting LLM-powered negotiation...")
+        print(f"   Item: {power_bank.name}")
+        print(
+            f"   🔵 Buyer (LLM): Target ${buyer_agent.target_price}, max ${buyer_agent.limit_price}"
+        )
+        print(
+            f"   🔴 Seller (LLM): Target ${seller_agent.target_price}, min ${seller_agent.limit_price}"
+        )
+        print(f"   Overlap zone: $78-$80 (should reach agreement here)")
+        print(f"\n{'='*60}\n")
+
+        result = await client.start_negotiation(
+            counterparty_endpoint="http://localhost:8001",
+            item=power_bank,
+            role="buyer",
+            max_rounds=10,
+        )
 
-    # Start negotiation
-    print("Starting LLM-powered negotiation...")
-    print(f"   Item: {power_bank.name}")
-    print(
-        f"   🔵 Buyer (LLM): Target ${buyer_agent.target_price}, max ${buyer_agent.limit_price}"
-    )
-    print(
-        f"   🔴 Seller (LLM): Target ${seller_agent.target_price}, min ${seller_agent.limit_price}"
+        if not result.success:
+            logger.error(f"❌ Failed to start negotiation: {result.error}")
+            return
+
+        if show_state:
+            session_id = result.session_id
+            if session_id:
+                print_detailed_state(client, server, session_id)
+    finally:
+        if client:
+            await client.close()
+        await ShaketClient.aclose_shared()
+        uvicorn_server.should_exit = True
+        await server_task
+
+
+async def run_session(index: int, port: int) -> StartResult:
+    """Run one independent buyer/seller negotiation against its own server."""
+    endpoint = f"http://localhost:{port}"
+    item = Item(
+        id=f"pb-anker-20k-{index}",
+        name="Anker PowerCore 20000mAh Power Bank",
+        description="High-capacity portable charger with dual USB ports, fast charging",
+        category="electronics",
+        seller_endpoint=endpoint,
     )
-    print(f"   Overlap zone: $78-$80 (should reach agreement here)")
-    print(f"\n{'='*60}\n")
-
-    result = await client.start_negotiation(
-        counterparty_endpoint="http://localhost:8001",
-        item=power_bank,
-        role="buyer",
-        max_rounds=10,
+    server = ShaketServer(
+        name=f"PowerBank Seller (LLM) #{index}",
+        description="AI-powered seller of used Anker power bank",
+        supported_session_types=[SessionType.NEGOTIATION],
+        supported_roles=[AgentRole.SELLER],
+        negotiation_agent=LLMNegotiationAgent(
+            role="seller", target_price=95, limit_price=78
+        ),
+        host="localhost",
+        port=port,
     )
 
-    if not result["success"]:
-        logger.error(f"❌ Failed to start negotiation: {result.get('error')}")
+    uvicorn_server, server_task = await start_server_background(server)
+    try:
+        client = await ShaketClient.create(
+            name=f"PowerBank Buyer (LLM) #{index}",
+            description="AI-powered buyer looking for power bank deals",
+            remote_agent_urls=[endpoint],
+            negotiation_agent=LLMNegotiationAgent(
+                role="buyer", target_price=70, limit_price=80
+            ),
+        )
+        async with client:
+            return await client.start_negotiation(
+                counterparty_endpoint=endpoint, item=item, role="buyer", max_rounds=10
+            )
+    finally:
+        uvicorn_server.should_exit = True
+        await server_task
+
+
+async def main_batch(sessions: int, base_port: int = 8101):
+    """
+    Run several independent LLM negotiations concurrently.
+
+    Sessions share nothing, so their LLM round-trips overlap on the event loop
+    and the batch takes roughly as long as its slowest negotiation.
+
+    Args:
+        sessions: Number of negotiations to run
+        base_port: Port of the first seller server (one port per session)
+    """
+    if not has_api_key():
+        print(" ⚠️ Set OPENAI_API_KEY in your .env file")
         return
 
-    if show_state:
-        session_id = result.get("session_id")
-        if session_id:
-            print_detailed_state(client, server, session_id)
+    print(f"\nRunning {sessions} LLM negotiations concurrently...\n")
+    try:
+        results = await asyncio.gather(
+            *(run_session(i, base_port + i) for i in range(sessions))
+        )
+    finally:
+        await ShaketClient.aclose_shared()
+
+    for i, result in enumerate(results):
+        if not result.success:
+            print(f"  #{i}: ❌ failed to start ({result.error})")
+            continue
+        data = result.result.data
+        if data.get("agreed"):
+            print(
+                f"  #{i}: ✅ deal at ${data.get('final_price')} in {data.get('rounds', 0)} rounds"
+            )
+        else:
+            print(f"  #{i}: ❌ no deal after {data.get('rounds', 0)} rounds")
 
 
 if __name__ == "__main__":
@@ -452,6 +565,21 @@ if __name__ == "__main__":
         action="store_true",
         help="Show detailed state information and events after negotiation",
     )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        default=1,
+        metavar="K",
+        help="Run K independent negotiations concurrently (summary output only)",
+    )
     args = parser.parse_args()
 
-    asyncio.run(main(show_state=args.show_state))
+    if args.sessions > 1:
+        entry = main_batch(args.sessions)
+    else:
+        entry = main(show_state=args.show_state)
+
+    if uvloop:
+        uvloop.run(entry)
+    else:
+        asyncio.run(entry)
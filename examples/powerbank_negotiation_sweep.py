@@ -0,0 +1,142 @@
+"""
+Power Bank Negotiation Strategy Sweep
+
+Evaluates the rule-based buyer/seller strategies from powerbank_negotiation.py
+over a grid of price limits, without servers or HTTP. The protocol is
+replayed in-process with the same decision rules, so thousands of
+negotiations run in well under a second.
+
+Each (price limit, step) configuration gets its own decision function
+generated at runtime, with the constants inlined as literals. When numba is
+installed, the generated functions are additionally JIT-compiled.
+"""
+
+import argparse
+import time
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - the generated Python code is used as-is
+    njit = None
+
+
+# A decision returns the counter-offer price, or ACCEPT to take their offer
+ACCEPT = -1.0
+
+_BUYER_SOURCE = """
+def buyer_decide(our_last, theirs):
+    if theirs <= {maxp!r}:
+        return {accept!r}
+    counter = round(our_last + (theirs - our_last) / {step!r}, 2)
+    return counter if counter < {maxp!r} else {maxp!r}
+"""
+
+_SELLER_SOURCE = """
+def seller_decide(our_last, theirs):
+    if theirs >= {minp!r}:
+        return {accept!r}
+    counter = round(our_last + (theirs - our_last) / {step!r}, 2)
+    return counter if counter > {minp!r} else {minp!r}
+"""
+
+
+def _specialize(source: str, name: str, **constants):
+    """Compile ``source`` with ``constants`` inlined and return function ``name``."""
+    namespace = {}
+    code = compile(
+        source.format(accept=ACCEPT, **constants), f"<{name}:{constants}>", "exec"
+    )
+    exec(code, namespace)
+    func = namespace[name]
+    return njit(func) if njit is not None else func
+
+
+def make_buyer(max_price: float, step: float = 3.0):
+    """Build a buyer decision function with its budget and step folded in."""
+    return _specialize(
+        _BUYER_SOURCE, "buyer_decide", maxp=float(max_price), step=float(step)
+    )
+
+
+def make_seller(min_price: float, step: float = 2.0):
+    """Build a seller decision function with its floor and step folded in."""
+    return _specialize(
+        _SELLER_SOURCE, "seller_decide", minp=float(min_price), step=float(step)
+    )
+
+
+def simulate(
+    buyer,
+    seller,
+    buyer_target: float,
+    seller_target: float,
+    max_rounds: int = 10,
+):
+    """
+    Replay one negotiation the way the example plays it over the protocol.
+
+    The buyer opens at its target, then the seller and buyer alternate
+    counter-offers until one side accepts or max_rounds is reached.
+
+    Returns:
+        (agreed, final_price, rounds)
+    """
+    buyer_last = float(buyer_target)
+    seller_last = float(seller_target)
+    offer = buyer_last
+
+    for rounds in range(1, max_rounds + 1):
+        decision = seller(seller_last, offer)
+        if decision == ACCEPT:
+            return True, offer, rounds - 1
+        seller_last = offer = decision
+
+        decision = buyer(buyer_last, offer)
+        if decision == ACCEPT:
+            return True, offer, rounds
+        buyer_last = offer = decision
+
+    return False, None, max_rounds
+
+
+def main(buyer_target: float, seller_target: float, max_rounds: int):
+    """Sweep buyer budgets against seller floors and print the outcome grid."""
+    budgets = range(72, 92, 2)
+    floors = range(70, 90, 2)
+
+    buyers = {b: make_buyer(b) for b in budgets}
+    sellers = {f: make_seller(f) for f in floors}
+
+    start = time.perf_counter()
+    results = {
+        (b, f): simulate(buyers[b], sellers[f], buyer_target, seller_target, max_rounds)
+        for b in budgets
+        for f in floors
+    }
+    elapsed = time.perf_counter() - start
+
+    print(f"\nBuyer target ${buyer_target}, seller target ${seller_target}")
+    print("Rows: buyer max price, columns: seller min price ('-' = no deal)\n")
+    print("       " + "".join(f"{f:>8}" for f in floors))
+    for b in budgets:
+        cells = []
+        for f in floors:
+            agreed, price, _ = results[(b, f)]
+            cells.append(f"{price:>8.2f}" if agreed else f"{'-':>8}")
+        print(f"{b:>6} " + "".join(cells))
+
+    deals = sum(1 for agreed, _, _ in results.values() if agreed)
+    print(
+        f"\n{deals}/{len(results)} deals, {len(results)} negotiations in "
+        f"{elapsed * 1000:.1f} ms ({'numba' if njit else 'python'} kernels)\n"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Power Bank Negotiation Sweep")
+    parser.add_argument("--buyer-target", type=float, default=70)
+    parser.add_argument("--seller-target", type=float, default=95)
+    parser.add_argument("--max-rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    main(args.buyer_target, args.seller_target, args.max_rounds)
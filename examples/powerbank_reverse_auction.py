@@ -11,12 +11,21 @@ This demonstrates a reverse auction where:
 import asyncio
 import argparse
 import logging
+import queue
 import sys
 from pathlib import Path
-from threading import Thread
+from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from random import Random
 
 import uvicorn
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional - fall back to the stdlib event loop
+    uvloop = None
+
+from _pretty import print_reverse_auction_details
 from shaket.core.types import Item, SessionType, AgentRole
 from shaket.client import ShaketClient
 from shaket.server import ShaketServer
@@ -38,77 +47,20 @@ logging.getLogger("httpcore").setLevel(logging.WARNING)
 logging.getLogger("a2a").setLevel(logging.WARNING)
 
 
-def print_event_log(events, label: str):
-    """Print formatted event log."""
-    print(f"\n{label} EVENTS ({len(events)}):")
-    for i, event in enumerate(events, 1):
-        timestamp = event.timestamp.strftime("%H:%M:%S.%f")[:-3]
-        event_info = f"  {i}. [{timestamp}] {event.event_type.value}"
-        if event.context_id:
-            event_info += f" (context: {event.context_id[:8]}...)"
-        if "offer" in event.data:
-            offer_data = event.data["offer"]
-            event_info += f" - ${offer_data.get('price', 'N/A')}"
-        elif "round_number" in event.data:
-            event_info += f" - round {event.data['round_number']}"
-        print(event_info)
-    print()
-
-
-def print_reverse_auction_state(state, label: str):
-    """Print a summary of the reverse auction state."""
-    print(f"\n{'─'*70}")
-    print(f"{label} STATE")
-    print(f"{'─'*70}")
-    print(f"Session ID: {state.session_id}")
-    print(f"Role: {state.role.value}")
-    print(f"Status: {state.status}")
-    print(f"Current Round: {state.current_round}/{state.total_rounds}")
-    print(f"Round Duration: {state.round_duration}s")
-
-    print(f"\nOffers by Round:")
-    for round_num in sorted(state.offers_by_round.keys()):
-        offers = state.offers_by_round[round_num]
-        print(f"  Round {round_num}: {len(offers)} offers")
-        for offer in offers:
-            print(f"    - ${offer.price:.2f} at {offer.timestamp.strftime('%H:%M:%S')}")
-
-    print(f"\nTotal Offers Received: {len(state.all_offers)}")
-
-    print(f"\nCounterparties ({len(state.counterparties)}):")
-    for context_id, info in state.counterparties.items():
-        name_str = f" ({info['name']})" if info.get("name") else ""
-        print(f"  - {context_id[:8]}...: {info['endpoint']}{name_str}")
-
-    print(f"\nDiscovery Messages ({len(state.discovery_messages)}):")
-    for i, disc in enumerate(state.discovery_messages[-3:], 1):  # Show last 3
-        print(f"  {i}. {disc.get('data', {}).get('message', 'N/A')[:80]}...")
-
-    print(f"{'─'*70}\n")
-
-
-def print_detailed_state(client, servers):
-    """Print state and events from buyer client and all seller servers."""
-    # Buyer (client) state
-    client_sessions = client.state_manager.list_sessions()
-    if client_sessions:
-        buyer_state = client_sessions[0]
-        session_id = buyer_state.session_id
-        print_reverse_auction_state(buyer_state, "BUYER (CLIENT)")
-        events = client.state_manager.get_events(session_id)
-        print_event_log(events, "BUYER")
-
-    # Seller (server) states
-    for idx, server in enumerate(servers):
-        server_sessions = server.state_manager.list_sessions()
-        if server_sessions:
-            server_state = server_sessions[0]
-            server_session_id = server_state.session_id
-            print_reverse_auction_state(
-                server_state, f"SELLER {server.name} (SERVER {idx+1})"
-            )
-            events = server.state_manager.get_events(server_session_id)
-            print_event_log(events, f"SELLER {server.name}")
+def start_queue_logging() -> QueueListener:
+    """
+    Route log records through a queue to a background listener thread.
+
+    Handlers configured above (formatting + stream writes) then run on the
+    listener thread, so logging from agents only enqueues a record on the
+    event loop. Call .stop() on the returned listener to flush on exit.
+    """
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
 
 
 class SimpleBuyerAgent:
@@ -120,6 +72,8 @@ class SimpleBuyerAgent:
     - state.offers_by_round contains offers from rounds 1..N-1
     """
 
+    __slots__ = ("target_price",)
+
     def __init__(self, target_price: float = 70):
         self.target_price = target_price
 
@@ -133,10 +87,10 @@ class SimpleBuyerAgent:
         current_round = state.current_round
         prev_round = current_round - 1
 
-        # Get offers from previous round (current round just started, no offers yet)
-        prev_offers = state.offers_by_round.get(prev_round, []) if prev_round > 0 else []
+        # Aggregates for the previous round (current round just started, no offers yet)
+        prev_stats = state.round_stats.get(prev_round) if prev_round > 0 else None
 
-        if not prev_offers:
+        if not prev_stats:
             # Round 1 - no previous offers, send opening message
             return SendDiscoveryAction(
                 message=f"Round {current_round} starting. Looking for competitive offers! Target budget: ${self.target_price:.0f}",
@@ -146,10 +100,9 @@ class SimpleBuyerAgent:
             )
 
         # Have previous round data - provide market feedback
-        prices = [o.price for o in prev_offers]
-        min_price = min(prices)
-        max_price = max(prices)
-        avg_price = sum(prices) / len(prices)
+        min_price = prev_stats.min
+        max_price = prev_stats.max
+        avg_price = prev_stats.avg
 
         # Craft strategic feedback based on how close to target
         if min_price > self.target_price * 1.2:
@@ -159,13 +112,13 @@ class SimpleBuyerAgent:
         else:
             urgency = "Good progress!"
 
-        # Format message to include "Lowest offer: $X" so seller agents can parse it
-        # (SimpleSellerAgent looks for this pattern to adjust prices)
+        # Readable summary for humans/LLM sellers; SimpleSellerAgent reads the
+        # structured prev_round_* fields in discovery_data instead
         return SendDiscoveryAction(
             message=(
                 f"Round {current_round} starting. {urgency}\n\n"
                 f"Previous round (Round {prev_round}) market info:\n"
-                f"- {len(prices)} offers received\n"
+                f"- {prev_stats.n} offers received\n"
                 f"- Lowest offer: ${min_price:.2f}\n"
                 f"- Highest offer: ${max_price:.2f}\n"
                 f"- Average offer: ${avg_price:.2f}\n\n"
@@ -183,6 +136,16 @@ class SimpleBuyerAgent:
 class SimpleSellerAgent:
     """Seller agent: submits competitive offers based on market feedback."""
 
+    __slots__ = (
+        "seller_id",
+        "current_price",
+        "min_price",
+        "aggressiveness",
+        "strategy",
+        "_rng",
+        "_undercut_fn",
+    )
+
     def __init__(
         self,
         seller_id: str,
@@ -190,6 +153,7 @@ class SimpleSellerAgent:
         min_price: float,
         aggressiveness: float = 2.0,
         strategy: str = "balanced",
+        seed: Optional[int] = None,
     ):
         """
         Initialize seller agent with pricing strategy.
@@ -200,12 +164,21 @@ class SimpleSellerAgent:
             min_price: Minimum acceptable price (floor)
             aggressiveness: Base amount to undercut (higher = more aggressive)
             strategy: Pricing strategy - "aggressive", "conservative", "last_minute", "balanced"
+            seed: Optional seed for this seller's private random generator
         """
         self.seller_id = seller_id
         self.current_price = initial_price
         self.min_price = min_price
         self.aggressiveness = aggressiveness
         self.strategy = strategy
+        self._rng = Random(seed)
+
+        # Resolve the strategy once instead of comparing strings every round
+        self._undercut_fn = {
+            "aggressive": self._undercut_aggressive,
+            "conservative": self._undercut_conservative,
+            "last_minute": self._undercut_last_minute,
+        }.get(strategy, self._undercut_balanced)
 
     def calculate_undercut_amount(self, current_round: int, total_rounds: int) -> float:
         """
@@ -214,89 +187,70 @@ class SimpleSellerAgent:
         Returns:
             Dollar amount to undercut the market's lowest offer
         """
-        import random
-
-        is_final_round = current_round == total_rounds
+        return self._undercut_fn(current_round, total_rounds)
 
-        if self.strategy == "aggressive":
-            # Always aggressive: base + random(0, 2)
-            return self.aggressiveness + random.uniform(0, 2)
+    def _undercut_aggressive(self, current_round: int, total_rounds: int) -> float:
+        # Always aggressive: base + random(0, 2)
+        return self.aggressiveness + self._rng.uniform(0, 2)
 
-        elif self.strategy == "conservative":
-            # Conservative: preserve profit, small undercuts
-            return self.aggressiveness * 0.5 + random.uniform(0, 1)
+    def _undercut_conservative(self, current_round: int, total_rounds: int) -> float:
+        # Conservative: preserve profit, small undercuts
+        return self.aggressiveness * 0.5 + self._rng.uniform(0, 1)
 
-        elif self.strategy == "last_minute":
-            # Hold back early, then go all-in on final round
-            if is_final_round:
-                # Final round: very aggressive!
-                return self.aggressiveness * 2.0 + random.uniform(0, 3)
-            else:
-                # Early rounds: conservative
-                return self.aggressiveness * 0.3 + random.uniform(0, 1)
+    def _undercut_last_minute(self, current_round: int, total_rounds: int) -> float:
+        # Hold back early, then go all-in on final round
+        if current_round == total_rounds:
+            # Final round: very aggressive!
+            return self.aggressiveness * 2.0 + self._rng.uniform(0, 3)
+        # Early rounds: conservative
+        return self.aggressiveness * 0.3 + self._rng.uniform(0, 1)
 
-        else:  # "balanced" or default
-            # Balanced: randomized undercut based on aggressiveness
-            return self.aggressiveness + random.uniform(0, 3)
+    def _undercut_balanced(self, current_round: int, total_rounds: int) -> float:
+        # Balanced: randomized undercut based on aggressiveness
+        return self.aggressiveness + self._rng.uniform(0, 3)
 
     async def decide_next_action(self, session_id: str, state):
         """
         Seller submits offers and adjusts based on market feedback.
         """
-        # Get current round and total rounds from discovery message
+        # Skip building log lines entirely when INFO is filtered out
+        verbose = logger.isEnabledFor(logging.INFO)
+
+        # Get current round and total rounds from the latest round announcement
         current_round = state.current_round
         total_rounds = state.total_rounds
 
-        if state.discovery_messages:
-            last_discovery = state.discovery_messages[-1]
-            market_data = last_discovery.get("data", {})
-
-            # Extract round info from discovery message
-            round_num = market_data.get("round_number", current_round)
-            current_round = round_num
-            total_rounds = market_data.get("total_rounds", total_rounds)
-
-            # Parse market info from the message text
-            message_text = market_data.get("message", "")
-            if "Lowest offer: $" in message_text:
-                # Extract the lowest offer price from the message
-                import re
-
-                match = re.search(r"Lowest offer: \$(\d+\.?\d*)", message_text)
-                if match:
-                    min_offer = float(match.group(1))
-
-                    # Calculate undercut amount based on strategy
-                    undercut = self.calculate_undercut_amount(
-                        current_round, total_rounds
-                    )
-
-                    # Always try to beat the market's lowest offer
-                    new_price = max(min_offer - undercut, self.min_price)
-
-                    if new_price < self.current_price:
-                        # Only update if we can actually go lower
-                        old_price = self.current_price
-                        self.current_price = new_price
-                        reduction = old_price - self.current_price
-                        logger.info(
-                            f"   💚 {self.seller_id:9} [{self.strategy:12}] "
-                            f"${old_price:6.2f} → ${self.current_price:6.2f} "
-                            f"(-${reduction:.2f})"
-                        )
-                    else:
-                        # No change - already at or below our ability to compete
+        market = state.market_view
+        if market is not None:
+            current_round = market.round_number
+            total_rounds = market.total_rounds
+
+            # Previous round's lowest price, published as structured data
+            min_offer = market.min_offer
+            if min_offer is not None:
+                # Calculate undercut amount based on strategy
+                undercut = self.calculate_undercut_amount(current_round, total_rounds)
+
+                # Always try to beat the market's lowest offer
+                new_price = max(min_offer - undercut, self.min_price)
+
+                if new_price < self.current_price:
+                    # Only update if we can actually go lower
+                    old_price = self.current_price
+                    self.current_price = new_price
+                    if verbose:
                         logger.info(
                             f"   💚 {self.seller_id:9} [{self.strategy:12}] "
-                            f"${self.current_price:6.2f} (holding)"
+                            f"${old_price:6.2f} → ${new_price:6.2f} "
+                            f"(-${old_price - new_price:.2f})"
                         )
-                else:
-                    # First round - no market info yet
+                elif verbose:
+                    # No change - already at or below our ability to compete
                     logger.info(
                         f"   💚 {self.seller_id:9} [{self.strategy:12}] "
-                        f"${self.current_price:6.2f} (initial)"
+                        f"${self.current_price:6.2f} (holding)"
                     )
-            else:
+            elif verbose:
                 # First round - no market info yet
                 logger.info(
                     f"   💚 {self.seller_id:9} [{self.strategy:12}] "
@@ -310,20 +264,41 @@ class SimpleSellerAgent:
         )
 
 
-def start_server_background(server):
-    """Start a Shaket server in a background thread."""
+async def start_server_background(server, startup_timeout: float = 5.0):
+    """Start a Shaket server as a task on the running event loop.
 
-    def run_server():
-        uvicorn.run(
-            server.app.build(), host=server.host, port=server.port, log_level="warning"
-        )
+    Returns:
+        (uvicorn_server, server_task) - set uvicorn_server.should_exit and
+        await server_task to shut it down
+    """
+    # ShaketServer registers no startup/shutdown hooks, so skip the ASGI
+    # lifespan handshake
+    config = uvicorn.Config(
+        server.app.build(),
+        host=server.host,
+        port=server.port,
+        log_level="warning",
+        lifespan="off",
+    )
+    uvicorn_server = uvicorn.Server(config)
+    server_task = asyncio.create_task(uvicorn_server.serve())
 
-    server_thread = Thread(target=run_server, daemon=True)
-    server_thread.start()
+    # Wait for uvicorn to bind the socket instead of sleeping a fixed time
+    async def wait_started():
+        while not uvicorn_server.started:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(wait_started(), timeout=startup_timeout)
+    return uvicorn_server, server_task
 
 
 async def main(show_state: bool = False):
     """Run the power bank reverse auction."""
+    # Let short-lived coroutines (per-seller sends, state updates) run to
+    # completion inline instead of through the ready queue (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     print("\n" + "=" * 70)
     print("POWER BANK REVERSE AUCTION SIMULATION")
     print("=" * 70 + "\n")
@@ -400,12 +375,23 @@ async def main(show_state: bool = False):
             port=8001 + idx,
         )
 
-        start_server_background(server)
         servers.append(server)
 
-    await asyncio.sleep(2)
+    # All five sellers share this event loop - each is just a listening socket
+    # plus a uvicorn.Server task, no extra threads or loops
+    running = await asyncio.gather(*(start_server_background(s) for s in servers))
     print("✅ All 5 seller servers started\n")
 
+    try:
+        await run_auction(servers, sellers_config, power_bank_base, show_state)
+    finally:
+        for uvicorn_server, _ in running:
+            uvicorn_server.should_exit = True
+        await asyncio.gather(*(task for _, task in running))
+
+
+async def run_auction(servers, sellers_config, power_bank_base, show_state: bool):
+    """Run the buyer side of the auction against the started seller servers."""
     # Create buyer client
     buyer_agent = SimpleBuyerAgent(target_price=70)
 
@@ -428,8 +414,10 @@ async def main(show_state: bool = False):
 
             # Find best (lowest) offer
             if all_offers:
-                best_offer = min(all_offers, key=lambda o: o["price"])
-                best_price = best_offer["price"]
+                # min() over plain floats compares in C, no per-item lambda call
+                prices = [o["price"] for o in all_offers]
+                best_price = min(prices)
+                best_offer = all_offers[prices.index(best_price)]
                 # Get seller_id from metadata
                 seller_id = best_offer.get("metadata", {}).get(
                     "seller_id", "Unknown Seller"
@@ -471,30 +459,34 @@ async def main(show_state: bool = False):
         print(
             f"      • {config['id']}: ${config['initial_price']:.0f} (min: ${config['min_price']:.0f}, {config['strategy']}, aggr: {config['aggressiveness']})"
         )
-    print(f"\n   🔄 Rounds: 3 (5 seconds each)")
+    print(f"\n   🔄 Rounds: 3 (up to 5 seconds each)")
     print(f"\n{'='*70}\n")
 
-    result = await client.start_reverse_auction(
-        counterparty_endpoints=seller_endpoints,
-        items_per_counterparty=items_per_counterparty,
-        role="buyer",
-        rounds=3,
-        round_duration=5.0,  # 5 seconds per round
-    )
+    try:
+        result = await client.start_reverse_auction(
+            counterparty_endpoints=seller_endpoints,
+            items_per_counterparty=items_per_counterparty,
+            role="buyer",
+            rounds=3,
+            round_duration=5.0,  # at most 5 seconds per round
+        )
+    finally:
+        await client.close()
+        await ShaketClient.aclose_shared()
 
-    if not result["success"]:
-        logger.error(f"❌ Failed to start reverse auction: {result.get('error')}")
+    if not result.success:
+        logger.error(f"❌ Failed to start reverse auction: {result.error}")
         return
 
     # Auction is now complete (blocking call above)
     # Print detailed state if requested
     if show_state:
-        session_id = result.get("session_id")
+        session_id = result.session_id
         if session_id:
             print("\n" + "=" * 70)
             print("DETAILED STATE INFORMATION")
             print("=" * 70)
-            print_detailed_state(client, servers)
+            print_reverse_auction_details(client, servers)
 
 
 if __name__ == "__main__":
@@ -506,4 +498,11 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    asyncio.run(main(show_state=args.show_state))
+    log_listener = start_queue_logging()
+    try:
+        if uvloop:
+            uvloop.run(main(show_state=args.show_state))
+        else:
+            asyncio.run(main(show_state=args.show_state))
+    finally:
+        log_listener.stop()
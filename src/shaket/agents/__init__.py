@@ -14,6 +14,7 @@ from .actions import (
     SendOfferAction,
     AcceptOfferAction,
     SendDiscoveryAction,
+    parse_action,
     get_action_schemas,
     get_action_schemas_for_llm,
 )
@@ -28,6 +29,7 @@ __all__ = [
     "AcceptOfferAction",
     "SendDiscoveryAction",
     # Utilities
+    "parse_action",
     "get_action_schemas",
     "get_action_schemas_for_llm",
 ]
@@ -8,8 +8,10 @@ This enables:
 - Dynamic tool discovery and schema generation
 """
 
-from typing import Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field
+import copy
+from functools import cache
+from typing import Annotated, Optional, Dict, Any, Literal, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class SendOfferAction(BaseModel):
@@ -39,11 +41,13 @@ class SendOfferAction(BaseModel):
         ],
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "title": "Send Offer",
             "description": "Send a price offer to the counterparty with optional message and terms",
-        }
+        },
+    )
 
 
 class AcceptOfferAction(BaseModel):
@@ -68,11 +72,13 @@ class AcceptOfferAction(BaseModel):
         examples=["Deal!", "Sounds good to me", "Accepted"],
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "title": "Accept Offer",
             "description": "Accept the counterparty's offer and complete the negotiation",
-        }
+        },
+    )
 
 
 class SendDiscoveryAction(BaseModel):
@@ -100,27 +106,48 @@ class SendDiscoveryAction(BaseModel):
         ],
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "title": "Send Discovery",
             "description": "Send a discovery message to ask questions or share information",
-        }
+        },
+    )
 
 
-# Union type for all possible agent actions
-AgentAction = SendOfferAction | AcceptOfferAction | SendDiscoveryAction
+# Union type for all possible agent actions, tagged by the "action" field so
+# validation dispatches straight to the matching model
+AgentAction = Annotated[
+    Union[SendOfferAction, AcceptOfferAction, SendDiscoveryAction],
+    Field(discriminator="action"),
+]
 
+_ACTION_ADAPTER = TypeAdapter(AgentAction)
 
-def get_action_schemas() -> Dict[str, Dict[str, Any]]:
+
+def parse_action(data: Dict[str, Any]) -> AgentAction:
     """
-    Get JSON schemas for all agent actions.
+    Validate a raw action dict into the matching action model.
 
-    This enables LLMs to understand available actions and their parameters,
-    following the MCP pattern of dynamic tool discovery.
+    The "action" key selects the model directly (e.g. "send_offer" ->
+    SendOfferAction) instead of trying each model in turn.
+
+    Args:
+        data: Action fields including the "action" tag, e.g. parsed LLM
+            function-call arguments plus the function name
 
     Returns:
-        Dictionary mapping action names to their JSON schemas
+        SendOfferAction, AcceptOfferAction or SendDiscoveryAction
+
+    Raises:
+        pydantic.ValidationError: If the tag is unknown or fields are invalid
     """
+    return _ACTION_ADAPTER.validate_python(data)
+
+
+@cache
+def _action_schemas() -> Dict[str, Dict[str, Any]]:
+    """Build the action JSON schemas once; they only change with the code."""
     return {
         "send_offer": SendOfferAction.model_json_schema(),
         "accept": AcceptOfferAction.model_json_schema(),
@@ -128,17 +155,10 @@ def get_action_schemas() -> Dict[str, Dict[str, Any]]:
     }
 
 
-def get_action_schemas_for_llm() -> list[Dict[str, Any]]:
-    """
-    Get action schemas formatted for LLM function calling.
-
-    Returns schemas in OpenAI function calling format, compatible with
-    most LLM APIs (Claude, GPT-4, etc.)
-
-    Returns:
-        List of function definitions for LLM function calling
-    """
-    schemas = get_action_schemas()
+@cache
+def _action_schemas_for_llm() -> list[Dict[str, Any]]:
+    """Build the LLM function definitions once from the cached schemas."""
+    schemas = _action_schemas()
 
     return [
         {
@@ -157,3 +177,35 @@ def get_action_schemas_for_llm() -> list[Dict[str, Any]]:
             "parameters": schemas["send_discovery"],
         },
     ]
+
+
+def get_action_schemas() -> Dict[str, Dict[str, Any]]:
+    """
+    Get JSON schemas for all agent actions.
+
+    This enables LLMs to understand available actions and their parameters,
+    following the MCP pattern of dynamic tool discovery.
+
+    Schemas are generated once and cached; each call returns a deep copy,
+    so callers are free to modify the result.
+
+    Returns:
+        Dictionary mapping action names to their JSON schemas
+    """
+    return copy.deepcopy(_action_schemas())
+
+
+def get_action_schemas_for_llm() -> list[Dict[str, Any]]:
+    """
+    Get action schemas formatted for LLM function calling.
+
+    Returns schemas in OpenAI function calling format, compatible with
+    most LLM APIs (Claude, GPT-4, etc.)
+
+    Like get_action_schemas(), the result is built once and returned as a
+    deep copy.
+
+    Returns:
+        List of function definitions for LLM function calling
+    """
+    return copy.deepcopy(_action_schemas_for_llm())
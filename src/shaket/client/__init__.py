@@ -11,7 +11,9 @@ These tools can be integrated with any agent framework (LangChain, CrewAI, etc.)
 """
 
 from .client import ShaketClient
+from .types import StartResult
 
 __all__ = [
     "ShaketClient",
+    "StartResult",
 ]
@@ -8,36 +8,111 @@ Provides:
 4. Callback mechanism to notify interface agent when complete
 """
 
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Tuple, Awaitable
+from functools import cache
+import asyncio
+import copy
+import itertools
+import os
+import random
 import uuid
 import logging
 import json
+import weakref
 from pathlib import Path
+from types import MappingProxyType
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install shaket[speedups])
+    orjson = None
+
 from ..core.types import Item, SessionType, AgentRole
 from ..protocol.messages import (
     create_action_message,
     ActionType,
-    MessageType,
 )
 from ..shaket_layer import (
     MessageParser,
     ConnectionManager,
 )
-from ..state import StateManager, EventType
+from ..shaket_layer.connection_manager import (
+    RemoteAgentConnection,
+    create_httpx_client,
+)
+from ..state import StateManager, EventType, Event
 from ..coordinators import (
     NegotiationCoordinator,
     ReverseAuctionCoordinator,
 )
 from ..agents import NegotiationAgent, ReverseAuctionAgent
 from ..coordinators.base import CoordinatorResult
+from .types import StartResult
 from a2a.types import MessageSendParams, SendMessageRequest
 
 logger = logging.getLogger(__name__)
 
 
+# Session and request IDs only need to be unique, not unpredictable, so draw
+# them from a PRNG seeded once instead of calling os.urandom via uuid4 each time
+_rng = random.Random(os.urandom(16))
+if hasattr(os, "register_at_fork"):  # POSIX only
+    # Forked workers would otherwise all repeat the parent's ID sequence
+    os.register_at_fork(after_in_child=lambda: _rng.seed(os.urandom(16)))
+_request_ids = itertools.count(1)
+
+
+def _short_id(prefix: str) -> str:
+    """Generate a session ID like "neg-3fa9c01b2d4e" (48 random bits)."""
+    return f"{prefix}-{_rng.getrandbits(48):012x}"
+
+
+def _next_request_id() -> str:
+    """Next JSON-RPC request ID (only has to match a response to its request)."""
+    return str(next(_request_ids))
+
+
+# Accepted values for the role argument of the start_* methods
+_ROLE_MAP = MappingProxyType({"buyer": AgentRole.BUYER, "seller": AgentRole.SELLER})
+
+
+async def _settle_task(task: Optional[asyncio.Task]):
+    """
+    Make sure a helper task is finished and its outcome retrieved.
+
+    Used on exit paths where the task may never have been awaited (e.g. the
+    INIT failed): a still-running task is cancelled, and its result or
+    exception is consumed so asyncio doesn't report it as never retrieved.
+    """
+    if task is None:
+        return
+    if not task.done():
+        task.cancel()
+    await asyncio.wait([task])
+    if not task.cancelled():
+        task.exception()
+
+
+def _parse_role(role: str) -> AgentRole:
+    """Map a role string ("buyer"/"seller", any case) to AgentRole."""
+    try:
+        return _ROLE_MAP[role.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError(f"invalid role: {role!r} (expected 'buyer' or 'seller')")
+
+
+@cache
+def _load_tool_schemas() -> List[Dict[str, Any]]:
+    """Load the LLM tool schemas shipped with the package (read once)."""
+    schema_file = Path(__file__).parent / "llm_tool_schemas.json"
+    if orjson is not None:
+        return orjson.loads(schema_file.read_bytes())
+    with open(schema_file, "r") as f:
+        return json.load(f)
+
+
 class ShaketClient:
     """
     Shaket Client - Proactive agent for initiating negotiations and auctions.
@@ -89,8 +164,21 @@ class ShaketClient:
             }]
         )
         # LLM will orchestrate multiple negotiations automatically
+
+    Connection Pooling:
+        Unless an httpx_client is passed in, every ShaketClient on the same
+        event loop sends through one shared httpx.AsyncClient, so repeated
+        sessions against the same counterparties reuse warm connections.
+        Callers running many concurrent sessions should rely on this rather
+        than passing a fresh client per session.
     """
 
+    # Shared httpx clients, one per event loop (an AsyncClient cannot be
+    # used across loops)
+    _shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(
         self,
         name: str,
@@ -101,6 +189,8 @@ class ShaketClient:
         reverse_auction_agent: Optional[ReverseAuctionAgent] = None,
         state_manager: Optional[StateManager] = None,
         on_session_complete: Optional[Callable[[CoordinatorResult], None]] = None,
+        on_session_progress: Optional[Callable[[Event], None]] = None,
+        background_callbacks: bool = False,
     ):
         """
         Initialize Shaket Client.
@@ -110,19 +200,29 @@ class ShaketClient:
             description: Human-readable description
             remote_agent_urls: Optional list of remote agent URLs to connect to
                 Example: ["http://localhost:8001", "http://seller2:8002"]
-            httpx_client: Optional httpx client for A2A connections (created if None)
+            httpx_client: Optional httpx client for A2A connections. If None,
+                the pooled client shared by all ShaketClients on the running
+                event loop is used.
             negotiation_agent: Optional user-provided negotiation agent
             reverse_auction_agent: Optional user-provided reverse auction agent
             state_manager: Optional custom state manager (e.g. for persistence)
             on_session_complete: Callback when session completes
                 Signature: async def callback(result: CoordinatorResult)
+            on_session_progress: Optional callback for each session event
+                (offers, rounds, ...) while start_* is running
+                Signature: async def callback(event: Event)
+            background_callbacks: If True, start_* returns without waiting
+                for on_session_complete; the callback runs as a task that
+                close() waits for
         """
         self.uuid = str(uuid.uuid4())
         self.name = name
         self.description = description
 
         # Connection manager for remote agents
-        self.connection_manager = ConnectionManager(httpx_client=httpx_client)
+        self.connection_manager = ConnectionManager(
+            httpx_client=httpx_client or self._get_shared_client()
+        )
 
         # Store remote agent URLs for async initialization
         self._remote_agent_urls = remote_agent_urls or []
@@ -145,11 +245,46 @@ class ShaketClient:
             uuid=self.uuid,
         )
 
-        # Callback for session completion
+        # Callbacks for session completion and progress
         self.on_session_complete = on_session_complete
+        self.on_session_progress = on_session_progress
+        self._background_callbacks = background_callbacks
+        self._pending_callbacks: set[asyncio.Task] = set()
+
+    @classmethod
+    def _get_shared_client(cls) -> Optional[httpx.AsyncClient]:
+        """
+        Get the shared httpx client for the running event loop.
+
+        Returns:
+            The pooled client, created on first use, or None when called
+            outside of an event loop (the ConnectionManager then creates
+            its own client)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        client = cls._shared_clients.get(loop)
+        if client is None or client.is_closed:
+            client = create_httpx_client()
+            cls._shared_clients[loop] = client
+            logger.debug("[ShaketClient] Created shared httpx client")
+        return client
+
+    @classmethod
+    async def aclose_shared(cls):
+        """
+        Close the shared httpx client of the running event loop.
 
-        # Map context_id -> session_id for routing
-        self._context_to_session: Dict[str, str] = {}
+        Call this once on shutdown, after all clients are done. Individual
+        ShaketClient.close() calls leave the shared pool open.
+        """
+        client = cls._shared_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+            logger.debug("[ShaketClient] Closed shared httpx client")
 
     async def initialize(self):
         """
@@ -189,6 +324,8 @@ class ShaketClient:
         reverse_auction_agent: Optional[ReverseAuctionAgent] = None,
         state_manager: Optional[StateManager] = None,
         on_session_complete: Optional[Callable[[CoordinatorResult], None]] = None,
+        on_session_progress: Optional[Callable[[Event], None]] = None,
+        background_callbacks: bool = False,
     ) -> "ShaketClient":
         """
         Create and initialize a ShaketClient.
@@ -202,6 +339,8 @@ class ShaketClient:
             reverse_auction_agent: Optional reverse auction agent
             state_manager: Optional custom state manager
             on_session_complete: Optional completion callback
+            on_session_progress: Optional per-event progress callback
+            background_callbacks: Run on_session_complete without blocking start_*
 
         Returns:
             Initialized ShaketClient
@@ -215,10 +354,37 @@ class ShaketClient:
             reverse_auction_agent=reverse_auction_agent,
             state_manager=state_manager,
             on_session_complete=on_session_complete,
+            on_session_progress=on_session_progress,
+            background_callbacks=background_callbacks,
         )
         await client.initialize()
         return client
 
+    async def close(self):
+        """
+        Close all remote agent connections.
+
+        A client passed in as httpx_client, or the shared pooled client, is
+        left open; see aclose_shared(). Completion callbacks still running
+        in the background are awaited first.
+
+        The client can also be used as an async context manager:
+
+            async with await ShaketClient.create(...) as client:
+                await client.start_negotiation(...)
+        """
+        if self._pending_callbacks:
+            await asyncio.gather(*self._pending_callbacks, return_exceptions=True)
+        await self.connection_manager.close()
+        self._initialized = False
+        logger.info(f"[ShaketClient] Closed")
+
+    async def __aenter__(self) -> "ShaketClient":
+        return await self.initialize()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
     def list_remote_agents(self) -> List[Dict[str, Any]]:
         """
         List all connected remote agents.
@@ -238,6 +404,88 @@ class ShaketClient:
             )
         return agents
 
+    async def _connect(
+        self, endpoint: str
+    ) -> Tuple[RemoteAgentConnection, Optional[asyncio.Task]]:
+        """
+        Get the connection to an endpoint, adding it if needed.
+
+        A new connection is returned right away, with its agent card fetch
+        running as a background task, so the caller can send the INIT while
+        the card is in flight. Await the task before reading connection.card.
+
+        Args:
+            endpoint: A2A endpoint of the counterparty
+
+        Returns:
+            (connection, card fetch task or None if nothing to wait for)
+        """
+        connection = self.connection_manager.get_connection(endpoint)
+        if connection:
+            return connection, None
+
+        connection = await self.connection_manager.add_connection(agent_url=endpoint)
+        logger.info(f"[ShaketClient] Added connection to {endpoint}")
+        card_task = asyncio.create_task(self.connection_manager.fetch_card(connection))
+        return connection, card_task
+
+    async def _safe_callback(self, result: CoordinatorResult):
+        """Run on_session_complete, logging instead of raising on errors."""
+        try:
+            await self.on_session_complete(result)
+        except Exception as e:
+            logger.error(f"[ShaketClient] Error in completion callback: {e}")
+
+    async def _notify_complete(self, result: CoordinatorResult):
+        """Invoke on_session_complete, inline or as a tracked background task."""
+        if not self.on_session_complete:
+            return
+        if not self._background_callbacks:
+            await self._safe_callback(result)
+            return
+
+        task = asyncio.create_task(self._safe_callback(result))
+        self._pending_callbacks.add(task)
+        task.add_done_callback(self._pending_callbacks.discard)
+
+    async def _run_with_progress(
+        self, session_id: str, program: Awaitable[CoordinatorResult]
+    ) -> CoordinatorResult:
+        """
+        Run a coordinator program, streaming its events to on_session_progress.
+
+        The callback runs in a separate task fed from a StateManager
+        subscription, so slow callbacks never hold up the coordinator.
+        Events still queued when the program finishes are delivered before
+        this returns.
+
+        Args:
+            session_id: Session the program runs
+            program: Coordinator start() coroutine
+
+        Returns:
+            The program's CoordinatorResult
+        """
+        if not self.on_session_progress:
+            return await program
+
+        queue = self.state_manager.subscribe(session_id)
+
+        async def pump():
+            while (event := await queue.get()) is not None:
+                try:
+                    await self.on_session_progress(event)
+                except Exception as e:
+                    logger.error(f"[ShaketClient] Error in progress callback: {e}")
+
+        pump_task = asyncio.create_task(pump())
+        try:
+            return await program
+        finally:
+            self.state_manager.unsubscribe(session_id, queue)
+            queue.put_nowait(None)
+            await pump_task
+
     # ========================================================================
     # TOOL METHODS - Called by interface agent
     # ========================================================================
@@ -249,7 +497,7 @@ class ShaketClient:
         role: str,  # "buyer" or "seller"
         max_rounds: Optional[int] = None,
         timeout: Optional[float] = None,
-    ) -> Dict[str, Any]:
+    ) -> StartResult:
         """
         Start a 1-on-1 negotiation session and run it to completion.
 
@@ -267,40 +515,27 @@ class ShaketClient:
             timeout: Optional timeout in seconds
 
         Returns:
-            {
-                "success": bool,
-                "session_id": str,
-                "status": str,  # "completed", "cancelled", "failed"
-                "result": CoordinatorResult,
-                "message": str
-            }
+            StartResult with success, session_id, context_id, status,
+            result (CoordinatorResult) and message; on failure only success
+            and error are set. Use .to_dict() for a JSON-friendly form.
         """
+        card_task = None
         try:
-            session_id = f"neg-{uuid.uuid4().hex[:12]}"
-
-            # Get or create connection to counterparty
-            connection = self.connection_manager.get_connection(counterparty_endpoint)
-            if not connection:
-                # Connection not found - add it dynamically
-                connection = await self.connection_manager.add_connection(
-                    agent_url=counterparty_endpoint, fetch_card=True
-                )
-                logger.info(
-                    f"[ShaketClient] Added connection to {counterparty_endpoint}"
-                )
-
-            # Get agent name from card if available
-            agent_name = connection.card.name if connection.card else None
+            session_id = _short_id("neg")
+            agent_role = _parse_role(role)
 
             # Validate that item has seller_endpoint set
             if not item.seller_endpoint:
                 raise ValueError(f"Item must have seller_endpoint set to counterparty endpoint: {counterparty_endpoint}")
 
+            # Get or create connection to counterparty (card fetched alongside INIT)
+            connection, card_task = await self._connect(counterparty_endpoint)
+
             # Send init message
             action_data = {
                 "session_type": SessionType.NEGOTIATION.value,
                 "item": item.to_dict(),
-                "role": role,
+                "role": agent_role.value,
             }
 
             message = create_action_message(
@@ -308,10 +543,11 @@ class ShaketClient:
                 action_data=action_data,
             )
 
-            # Create A2A message request
+            # Create A2A message request (message is already a validated
+            # Message, so skip re-validating it)
             message_request = SendMessageRequest(
-                id=str(uuid.uuid4()),
-                params=MessageSendParams.model_validate({"message": message}),
+                id=_next_request_id(),
+                params=MessageSendParams.model_construct(message=message),
             )
 
             send_response = await connection.send_message(message_request)
@@ -319,23 +555,13 @@ class ShaketClient:
             # Extract context_id and counterparty uuid from ACK response using MessageParser
             context_id = None
             counterparty_uuid = None
-            if send_response:
-                # Parse response to get ACK message
-                parsed_messages = MessageParser.parse_response(send_response)
-                for parsed_msg in parsed_messages:
-                    if (
-                        parsed_msg.message_type == MessageType.ACTION
-                        and parsed_msg.action == ActionType.ACK.value
-                    ):
-                        # Extract context_id and uuid from action_data
-                        if parsed_msg.action_data:
-                            context_id = parsed_msg.action_data.get("context_id")
-                            counterparty_uuid = parsed_msg.action_data.get("uuid")
-                            if context_id:
-                                logger.info(
-                                    f"[ShaketClient] Extracted context_id from server: {context_id}"
-                                )
-                                break
+            ack = MessageParser.find_ack(send_response)
+            if ack:
+                context_id = ack.action_data["context_id"]
+                counterparty_uuid = ack.action_data.get("uuid")
+                logger.info(
+                    f"[ShaketClient] Extracted context_id from server: {context_id}"
+                )
 
             # Fallback: use session_id if context_id not found
             if not context_id:
@@ -345,8 +571,12 @@ class ShaketClient:
                 )
                 context_id = session_id
 
+            # Get agent name from card if available
+            if card_task:
+                await card_task
+            agent_name = connection.card.name if connection.card else None
+
             # Create session state with items_per_seller (single entry for negotiation)
-            agent_role = AgentRole.BUYER if role == "buyer" else AgentRole.SELLER
             items_per_seller = {counterparty_endpoint: item}
             state = self.state_manager.create_session(
                 session_id=session_id,
@@ -374,48 +604,44 @@ class ShaketClient:
                 data=counterparty_data,
                 context_id=context_id,
             )
-            self.state_manager.add_context_mapping(context_id, session_id)
-
-            # Map context for routing
-            self._context_to_session[context_id] = session_id
 
             logger.info(f"[ShaketClient] Starting negotiation: {session_id}")
 
             # Start coordinator and run negotiation loop (blocks until complete)
-            result = await self.negotiation_coordinator.start(
-                session_id=session_id,
-                config={
-                    "max_rounds": max_rounds,
-                    "timeout": timeout,
-                },
+            result = await self._run_with_progress(
+                session_id,
+                self.negotiation_coordinator.start(
+                    session_id=session_id,
+                    config={
+                        "max_rounds": max_rounds,
+                        "timeout": timeout,
+                    },
+                ),
             )
 
             # Call completion callback if provided
-            if self.on_session_complete:
-                try:
-                    await self.on_session_complete(result)
-                except Exception as e:
-                    logger.error(f"[ShaketClient] Error in completion callback: {e}")
+            await self._notify_complete(result)
 
             logger.info(
                 f"[ShaketClient] Negotiation completed: {session_id} - {result.status}"
             )
 
-            return {
-                "success": True,
-                "session_id": session_id,
-                "context_id": context_id,
-                "status": result.status,
-                "result": result,
-                "message": result.message,
-            }
+            return StartResult(
+                success=True,
+                session_id=session_id,
+                context_id=context_id,
+                status=result.status,
+                result=result,
+                message=result.message,
+            )
 
         except Exception as e:
             logger.error(f"[ShaketClient] Failed to start negotiation: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-            }
+            return StartResult(success=False, error=str(e))
+
+        finally:
+            # The card fetch is only awaited on the success path
+            await _settle_task(card_task)
 
     async def start_reverse_auction(
         self,
@@ -424,7 +650,7 @@ class ShaketClient:
         role: str,  # "buyer" or "seller"
         rounds: int = 1,
         round_duration: float = 60,
-    ) -> Dict[str, Any]:
+    ) -> StartResult:
         """
         Start a reverse auction session.
 
@@ -436,94 +662,106 @@ class ShaketClient:
             items_per_counterparty: Dict mapping endpoint to Item for that counterparty
             role: Your role ("buyer" or "seller")
             rounds: Number of rounds
-            round_duration: Duration per round in seconds
+            round_duration: Maximum duration per round in seconds (a round
+                closes early once every participant has made an offer)
 
         Returns:
-            {
-                "success": bool,
-                "session_id": str,
-                "participants": int,
-                "message": str
-            }
+            StartResult with success, session_id, status, result
+            (CoordinatorResult), participants and message; on failure only
+            success and error are set.
         """
         try:
-            session_id = f"reverse-auction-{uuid.uuid4().hex[:12]}"
-
-            contexts = []
-            for idx, endpoint in enumerate(counterparty_endpoints):
-                # Get seller-specific item
+            session_id = _short_id("reverse-auction")
+            agent_role = _parse_role(role)
+
+            # Validate and serialize items up front so no INIT is sent for an
+            # incomplete auction; participants sharing an Item share its dict
+            item_dicts: Dict[str, Dict[str, Any]] = {}
+            serialized: Dict[int, Dict[str, Any]] = {}
+            for endpoint in counterparty_endpoints:
                 seller_item = items_per_counterparty.get(endpoint)
                 if not seller_item:
                     raise ValueError(f"No item provided for seller endpoint: {endpoint}")
+                item_dict = serialized.get(id(seller_item))
+                if item_dict is None:
+                    item_dict = serialized[id(seller_item)] = seller_item.to_dict()
+                item_dicts[endpoint] = item_dict
+
+            # Only the item differs between participants
+            base_action_data = {
+                "session_type": SessionType.REVERSE_AUCTION.value,
+                "role": agent_role.value,
+                "session_config": {
+                    "rounds": rounds,
+                    "round_duration": round_duration,
+                },
+            }
 
-                # Get or create connection
-                connection = self.connection_manager.get_connection(endpoint)
-                if not connection:
-                    connection = await self.connection_manager.add_connection(
-                        agent_url=endpoint, fetch_card=True
-                    )
-                    logger.info(f"[ShaketClient] Added connection to {endpoint}")
-
-                # Send init with seller-specific item
-                action_data = {
-                    "session_type": SessionType.REVERSE_AUCTION.value,
-                    "item": seller_item.to_dict(),
-                    "role": role,
-                    "session_config": {
-                        "rounds": rounds,
-                        "round_duration": round_duration,
-                    },
-                }
-
-                message = create_action_message(
-                    action=ActionType.INIT,
-                    action_data=action_data,
-                )
+            async def _init_one(idx: int, endpoint: str):
+                # Get or create connection (card fetched alongside INIT)
+                connection, card_task = await self._connect(endpoint)
+                try:
 
-                # Create A2A message request
-                message_request = SendMessageRequest(
-                    id=str(uuid.uuid4()),
-                    params=MessageSendParams.model_validate({"message": message}),
-                )
+                    # Send init with seller-specific item; each INIT still needs
+                    # its own message_id, so the message itself is not shared
+                    message = create_action_message(
+                        action=ActionType.INIT,
+                        action_data={**base_action_data, "item": item_dicts[endpoint]},
+                    )
 
-                response = await connection.send_message(message_request)
-
-                # Extract context_id and counterparty uuid from ACK response
-                context_id = None
-                counterparty_uuid = None
-                if response:
-                    # Parse ACK response to extract context_id and uuid
-                    parsed_messages = MessageParser.parse_response(response)
-                    for parsed_msg in parsed_messages:
-                        if (
-                            parsed_msg.message_type == MessageType.ACTION
-                            and parsed_msg.action == ActionType.ACK.value
-                        ):
-                            if parsed_msg.action_data:
-                                context_id = parsed_msg.action_data.get("context_id")
-                                counterparty_uuid = parsed_msg.action_data.get("uuid")
-                                if context_id:
-                                    logger.info(
-                                        f"[ShaketClient] Extracted context_id from participant {idx}: {context_id}"
-                                    )
-                                    break
-
-                # Fallback if not extracted
-                if not context_id:
-                    context_id = f"{session_id}-{idx}"
-                    logger.warning(
-                        f"[ShaketClient] Could not extract context_id for participant {idx}, "
-                        f"using fallback: {context_id}"
+                    # Create A2A message request
+                    message_request = SendMessageRequest(
+                        id=_next_request_id(),
+                        params=MessageSendParams.model_construct(message=message),
                     )
 
-                contexts.append((context_id, counterparty_uuid))
+                    response = await connection.send_message(message_request)
+
+                    # Extract context_id and counterparty uuid from ACK response
+                    context_id = None
+                    counterparty_uuid = None
+                    ack = MessageParser.find_ack(response)
+                    if ack:
+                        context_id = ack.action_data["context_id"]
+                        counterparty_uuid = ack.action_data.get("uuid")
+                        logger.info(
+                            f"[ShaketClient] Extracted context_id from participant {idx}: {context_id}"
+                        )
+
+                    # Fallback if not extracted
+                    if not context_id:
+                        context_id = f"{session_id}-{idx}"
+                        logger.warning(
+                            f"[ShaketClient] Could not extract context_id for participant {idx}, "
+                            f"using fallback: {context_id}"
+                        )
+
+                    if card_task:
+                        await card_task
+                    return context_id, counterparty_uuid
+                finally:
+                    # Not awaited above if the INIT failed
+                    await _settle_task(card_task)
+
+            # INIT all participants concurrently; results come back in endpoint order
+            results = await asyncio.gather(
+                *(
+                    _init_one(idx, endpoint)
+                    for idx, endpoint in enumerate(counterparty_endpoints)
+                ),
+                return_exceptions=True,
+            )
 
-                # Map context for routing
-                self._context_to_session[context_id] = session_id
+            contexts = []
+            for endpoint, result in zip(counterparty_endpoints, results):
+                if isinstance(result, BaseException):
+                    raise RuntimeError(
+                        f"INIT failed for participant {endpoint}: {result}"
+                    ) from result
+                contexts.append(result)
 
             # Create session state for reverse auction
             # context_id is None for multi-party sessions - contexts are managed via counterparties
-            agent_role = AgentRole.BUYER if role == "buyer" else AgentRole.SELLER
             state = self.state_manager.create_session(
                 session_id=session_id,
                 context_id=None,  # No single context for multi-party reverse auction
@@ -536,9 +774,10 @@ class ShaketClient:
                 expected_participants=len(counterparty_endpoints),
             )
 
-            # Add counterparties via events
-            for idx, (endpoint, (context_id, counterparty_uuid)) in enumerate(
-                zip(counterparty_endpoints, contexts)
+            # Add counterparties via events (one batch for all participants)
+            joined_events = []
+            for endpoint, (context_id, counterparty_uuid) in zip(
+                counterparty_endpoints, contexts
             ):
                 # Get agent name from connection if available
                 connection = self.connection_manager.get_connection(endpoint)
@@ -554,47 +793,46 @@ class ShaketClient:
                 if counterparty_uuid:
                     counterparty_data["counterparty_uuid"] = counterparty_uuid
 
-                self.state_manager.emit_event(
-                    session_id=session_id,
-                    event_type=EventType.COUNTERPARTY_JOINED,
-                    data=counterparty_data,
-                    context_id=context_id,
+                joined_events.append(
+                    (EventType.COUNTERPARTY_JOINED, counterparty_data, context_id)
                 )
-                self.state_manager.add_context_mapping(context_id, session_id)
+
+            self.state_manager.emit_events(session_id, joined_events)
+            self.state_manager.add_context_mappings(
+                (context_id, session_id) for context_id, _ in contexts
+            )
 
             # Start coordinator and run reverse auction (blocks until complete)
-            result = await self.reverse_auction_coordinator.start(
-                session_id=session_id,
-                config={
-                    "rounds": rounds,
-                    "round_duration": round_duration,
-                    "participants": len(counterparty_endpoints),
-                    "role": role,
-                },
+            result = await self._run_with_progress(
+                session_id,
+                self.reverse_auction_coordinator.start(
+                    session_id=session_id,
+                    config={
+                        "rounds": rounds,
+                        "round_duration": round_duration,
+                        "participants": len(counterparty_endpoints),
+                        "role": agent_role.value,
+                    },
+                ),
             )
 
             # Call completion callback if provided
-            if self.on_session_complete:
-                try:
-                    await self.on_session_complete(result)
-                except Exception as e:
-                    logger.error(f"[ShaketClient] Error in completion callback: {e}")
+            await self._notify_complete(result)
 
             logger.info(f"[ShaketClient] Reverse auction completed: {session_id} - {result.status}")
 
-            return {
-                "success": result.status == "completed",
-                "session_id": session_id,
-                "participants": len(counterparty_endpoints),
-                "message": f"Reverse auction {result.status}",
-            }
+            return StartResult(
+                success=result.status == "completed",
+                session_id=session_id,
+                status=result.status,
+                result=result,
+                participants=len(counterparty_endpoints),
+                message=f"Reverse auction {result.status}",
+            )
 
         except Exception as e:
             logger.error(f"[ShaketClient] Failed to start reverse auction: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-            }
+            return StartResult(success=False, error=str(e))
 
     # ========================================================================
     # QUERY METHODS
@@ -659,7 +897,5 @@ class ShaketClient:
                 }]
             )
         """
-        # Load tool schemas from JSON file
-        schema_file = Path(__file__).parent / "llm_tool_schemas.json"
-        with open(schema_file, "r") as f:
-            return json.load(f)
+        # Callers may edit the returned schemas, so hand out a copy
+        return copy.deepcopy(_load_tool_schemas())
@@ -0,0 +1,53 @@
+"""
+Result types returned by ShaketClient tool methods.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from ..coordinators.base import CoordinatorResult
+
+
+@dataclass(slots=True, frozen=True)
+class StartResult:
+    """
+    Outcome of start_negotiation() / start_reverse_auction().
+
+    Fields that do not apply to a call are left as None; on failure only
+    success and error are set.
+    """
+
+    success: bool
+    session_id: Optional[str] = None
+    context_id: Optional[str] = None  # Negotiation only
+    status: Optional[str] = None  # "completed", "cancelled", "failed"
+    result: Optional[CoordinatorResult] = None
+    message: Optional[str] = None
+    participants: Optional[int] = None  # Reverse auction only
+    error: Optional[str] = None
+
+    # Read-only Mapping-style access, for callers written against the dict
+    # these methods returned before StartResult existed
+
+    def __getitem__(self, key: str) -> Any:
+        """Return field ``key`` (``result["success"]``); KeyError if unknown."""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return field ``key``, or ``default`` if it is unknown or unset."""
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def __contains__(self, key: object) -> bool:
+        """True if ``key`` is a field that is set (i.e. present in to_dict())."""
+        return key in self.__slots__ and getattr(self, key) is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict (for JSON tool results), omitting unset fields."""
+        return {
+            name: value
+            for name in self.__slots__
+            if (value := getattr(self, name)) is not None
+        }
@@ -427,6 +427,7 @@ class NegotiationCoordinator(Coordinator):
         if not offer_data:
             return None
 
+        # Parse before emitting so a malformed offer never reaches the event log
         offer = Offer.from_dict(offer_data)
 
         logger.info(
@@ -6,8 +6,7 @@ Executes multi-party reverse auction program automatically.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 from .base import Coordinator, ReverseAuctionAgent, CoordinatorResult
 from ..shaket_layer.message_parser import ParsedMessage
@@ -15,11 +14,25 @@ from ..shaket_layer import MessageParser, SessionMessenger
 from ..state.events import EventType
 from ..state.session_state import ReverseAuctionState
 from ..core.types import Offer, SessionType
-from ..protocol.messages import MessageType
+from ..protocol.messages import MessageType, iso_now
 from ..agents import SendDiscoveryAction
 
 logger = logging.getLogger(__name__)
 
+# Cap on concurrent discovery requests per round, so large auctions do not
+# exhaust the HTTP connection pool
+DEFAULT_MAX_CONCURRENT_REQUESTS = 64
+
+# Human-readable previous-round summary appended to the default round announcement
+_MARKET_INFO_TEMPLATE = (
+    "\n\nPrevious round (Round {prev_round}) market info:"
+    "\n- {count} offers received"
+    "\n- Lowest offer: ${min:.2f}"
+    "\n- Highest offer: ${max:.2f}"
+    "\n- Average offer: ${avg:.2f}"
+    "\n\nAdjust your price to be more competitive if needed."
+)
+
 
 class ReverseAuctionCoordinator(Coordinator):
     """
@@ -43,6 +56,7 @@ class ReverseAuctionCoordinator(Coordinator):
         connection_manager=None,
         state_manager=None,
         uuid: Optional[str] = None,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
     ):
         """
         Initialize reverse auction coordinator.
@@ -52,6 +66,7 @@ class ReverseAuctionCoordinator(Coordinator):
             connection_manager: Connection manager for accessing seller connections
             state_manager: Shared state manager (required)
             uuid: UUID of the client/server that owns this coordinator
+            max_concurrent_requests: Maximum discovery requests in flight per round
         """
         super().__init__(agent, state_manager, uuid)
 
@@ -61,6 +76,32 @@ class ReverseAuctionCoordinator(Coordinator):
             )
 
         self.connection_manager = connection_manager
+        self._max_concurrent_requests = max_concurrent_requests
+
+        # Sessions this coordinator is running, from start_session() until
+        # completion or cancellation (only ever holds ReverseAuctionState)
+        self._sessions: Dict[str, ReverseAuctionState] = {}
+
+        # One messenger per active session, reused across rounds
+        self._messengers: Dict[str, SessionMessenger] = {}
+
+        # Incoming message handlers by message type
+        self._dispatch = {
+            MessageType.DISCOVERY: self._handle_discovery,
+            MessageType.OFFER: self._handle_offer,
+            MessageType.ACTION: self._handle_action,  # cancel, etc.
+        }
+
+        # Set when the current round of a session can close early
+        # (every expected participant has offered, or the session was cancelled)
+        self._round_events: Dict[str, asyncio.Event] = {}
+
+        # OFFER_RECEIVED events of the open round, emitted together when it
+        # closes: (event_type, data, context_id) as taken by emit_events()
+        self._pending_offers: Dict[str, List[Tuple[EventType, Dict[str, Any], Optional[str]]]] = {}
+
+        # Context IDs of the sellers that have offered in the open round
+        self._round_senders: Dict[str, Set[str]] = {}
 
     async def start_session(
         self,
@@ -84,6 +125,8 @@ class ReverseAuctionCoordinator(Coordinator):
         state = self.state_manager.get_session(session_id)
         if not state:
             raise ValueError(f"Session {session_id} not found in StateManager")
+        if isinstance(state, ReverseAuctionState):
+            self._sessions[session_id] = state
 
         logger.debug(
             f"[ReverseAuctionCoordinator] Starting reverse auction session {session_id}: "
@@ -142,10 +185,23 @@ class ReverseAuctionCoordinator(Coordinator):
 
         return result
 
+    def _get_state(self, session_id: str) -> Optional[ReverseAuctionState]:
+        """
+        Look up a reverse auction session.
+
+        Sessions started by this coordinator are served from its own registry
+        without a type check; anything else falls back to the StateManager.
+        """
+        state = self._sessions.get(session_id)
+        if state is not None:
+            return state
+        state = self.state_manager.get_session(session_id)
+        return state if isinstance(state, ReverseAuctionState) else None
+
     async def _execute_reverse_auction(self, session_id: str) -> CoordinatorResult:
         """Execute all reverse auction rounds automatically and return result."""
-        state = self.state_manager.get_session(session_id)
-        if not state or not isinstance(state, ReverseAuctionState):
+        state = self._get_state(session_id)
+        if not state:
             logger.error(
                 f"[ReverseAuctionCoordinator] Invalid state for session {session_id}"
             )
@@ -168,6 +224,12 @@ class ReverseAuctionCoordinator(Coordinator):
             )
 
             # 1. Emit round started event FIRST (updates state.current_round)
+            # Emit anything still buffered from the previous round before
+            # opening this one, so it is neither lost nor counted again
+            self._flush_offers(session_id, close=True)
+            round_event = self._round_events[session_id] = asyncio.Event()
+            self._pending_offers[session_id] = []
+            self._round_senders[session_id] = set()
             self.state_manager.emit_event(
                 session_id=session_id,
                 event_type=EventType.BIDDING_ROUND_STARTED,
@@ -179,28 +241,38 @@ class ReverseAuctionCoordinator(Coordinator):
             )
 
             # 2. Consult agent for custom discovery message (if agent provided)
+            # (state is updated in place by emit_event, so no re-fetch is needed)
             custom_discovery = None
             if self.agent:
-                # Refresh state to get updated current_round
-                state = self.state_manager.get_session(session_id)
-                if state:
-                    try:
-                        action = await self.agent.decide_next_action(session_id, state)
-                        if isinstance(action, SendDiscoveryAction):
-                            custom_discovery = action
-                            logger.debug(
-                                f"[ReverseAuctionCoordinator] Agent provided custom discovery for round {round_num}"
-                            )
-                    except Exception as e:
-                        logger.warning(
-                            f"[ReverseAuctionCoordinator] Agent error, using default discovery: {e}"
+                try:
+                    action = await self.agent.decide_next_action(session_id, state)
+                    if isinstance(action, SendDiscoveryAction):
+                        custom_discovery = action
+                        logger.debug(
+                            f"[ReverseAuctionCoordinator] Agent provided custom discovery for round {round_num}"
                         )
+                except Exception as e:
+                    logger.warning(
+                        f"[ReverseAuctionCoordinator] Agent error, using default discovery: {e}"
+                    )
 
             # 3. Send discovery message to all sellers to trigger them to send offers
-            await self._request_offers_from_sellers(session_id, round_num, custom_discovery)
+            await self._request_offers_from_sellers(state, round_num, custom_discovery)
+
+            # Wait for round duration, or less once every participant has offered.
+            # Zero-length rounds only yield once so late replies can land.
+            if state.round_duration <= 0:
+                await asyncio.sleep(0)
+            elif not round_event.is_set():
+                try:
+                    await asyncio.wait_for(
+                        round_event.wait(), timeout=state.round_duration
+                    )
+                except asyncio.TimeoutError:
+                    pass
 
-            # Wait for round duration
-            await asyncio.sleep(state.round_duration)
+            # Record the round's offers in one batch
+            self._flush_offers(session_id)
 
             # Get offers for this round
             round_offers = state.offers_by_round.get(round_num, [])
@@ -227,48 +299,42 @@ class ReverseAuctionCoordinator(Coordinator):
                 logger.warning(f"[ReverseAuctionCoordinator] No offers received")
                 break
 
-        # Reverse auction complete - determine outcome and build result
-        state = self.state_manager.get_session(session_id)
-        if not state or not isinstance(state, ReverseAuctionState):
-            return self._complete_session(
-                session_id=session_id,
-                status="failed",
-                reason="Session not found",
-            )
+        self._round_events.pop(session_id, None)
+        self._round_senders.pop(session_id, None)
+        self._flush_offers(session_id, close=True)
 
-        all_offers = state.get_all_offers()
-
-        if not all_offers:
+        # Reverse auction complete - determine outcome and build result.
+        # The StateManager never replaces a session's state object, so the
+        # reference resolved before the loop is still current.
+        if not state.get_all_offers():
             # No offers received
             return self._complete_session(
-                session_id=session_id,
+                state,
                 status="completed",
                 reason="No offers received",
             )
 
         # All offers collected successfully
         return self._complete_session(
-            session_id=session_id,
+            state,
             status="completed",
             reason="Reverse auction complete - all offers collected",
         )
 
     async def _request_offers_from_sellers(
         self,
-        session_id: str,
+        state: ReverseAuctionState,
         round_num: int,
         custom_discovery: SendDiscoveryAction | None = None,
     ):
         """Send discovery messages to all sellers to request offers for this round (in parallel).
 
         Args:
-            session_id: Session ID
+            state: Reverse auction session state
             round_num: Current round number
             custom_discovery: Optional agent-provided discovery message
         """
-        state = self.state_manager.get_session(session_id)
-        if not state or not isinstance(state, ReverseAuctionState):
-            return
+        session_id = state.session_id
 
         if not self.connection_manager:
             logger.warning(
@@ -276,12 +342,15 @@ class ReverseAuctionCoordinator(Coordinator):
             )
             return
 
-        # Create SessionMessenger for this session
-        messenger = SessionMessenger(
-            session_id=session_id,
-            connection_manager=self.connection_manager,
-            state_manager=self.state_manager,
-        )
+        # Reuse this session's messenger across rounds
+        messenger = self._messengers.get(session_id)
+        if messenger is None:
+            messenger = self._messengers[session_id] = SessionMessenger(
+                session_id=session_id,
+                connection_manager=self.connection_manager,
+                state_manager=self.state_manager,
+            )
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
 
         # Use agent-provided discovery or generate default market info
         if custom_discovery:
@@ -292,22 +361,23 @@ class ReverseAuctionCoordinator(Coordinator):
             message = f"Round {round_num} started - please submit your offer."
             agent_data = {}
 
-            if round_num > 1:
-                prev_round_offers = state.offers_by_round.get(round_num - 1, [])
-                if prev_round_offers:
-                    prices = [o.price for o in prev_round_offers]
-                    min_price = min(prices)
-                    max_price = max(prices)
-                    avg_price = sum(prices) / len(prices)
-
-                    message += (
-                        f"\n\nPrevious round (Round {round_num - 1}) market info:"
-                        f"\n- {len(prices)} offers received"
-                        f"\n- Lowest offer: ${min_price:.2f}"
-                        f"\n- Highest offer: ${max_price:.2f}"
-                        f"\n- Average offer: ${avg_price:.2f}"
-                        f"\n\nAdjust your price to be more competitive if needed."
-                    )
+            # Previous round aggregates are kept up to date as offers arrive
+            prev_stats = state.round_stats.get(round_num - 1)
+            if prev_stats:
+                message += _MARKET_INFO_TEMPLATE.format(
+                    prev_round=round_num - 1,
+                    count=prev_stats.n,
+                    min=prev_stats.min,
+                    max=prev_stats.max,
+                    avg=prev_stats.avg,
+                )
+                # Structured copy of the same figures, so sellers don't
+                # have to parse them back out of the text
+                agent_data = {
+                    "prev_round_min": prev_stats.min,
+                    "prev_round_max": prev_stats.max,
+                    "prev_round_avg": prev_stats.avg,
+                }
 
         # Build discovery_data once (same for all sellers)
         discovery_data = {
@@ -322,47 +392,58 @@ class ReverseAuctionCoordinator(Coordinator):
             event_type=EventType.DISCOVERY_MESSAGE,
             data={"discovery_data": discovery_data, "emitter": self.uuid},
         )
+        # Every seller's copy of the announcement carries the same timestamp
+        sent_at = iso_now()
+
         async def request_offer_from_seller(context_id: str):
             """Helper to send request to a single seller."""
-            try:
-                # Emit event to record the discovery we're sending
-                self.state_manager.emit_event(
-                    session_id=session_id,
-                    event_type=EventType.DISCOVERY_SENT,
-                    data={"discovery_data": discovery_data, "emitter": self.uuid},
-                    context_id=context_id,
-                )
-
-                # Send discovery message to this seller (identified by context_id)
-                response = await messenger.send_discovery(
-                    discovery_data=discovery_data,
-                    context_id=context_id,
-                )
+            async with semaphore:
+                try:
+                    # Emit event to record the discovery we're sending
+                    self.state_manager.emit_event(
+                        session_id=session_id,
+                        event_type=EventType.DISCOVERY_SENT,
+                        data={"discovery_data": discovery_data, "emitter": self.uuid},
+                        context_id=context_id,
+                    )
 
-                logger.debug(
-                    f"[ReverseAuctionCoordinator] Requested offer from context {context_id[:8]}... for round {round_num}"
-                )
+                    # Send discovery message to this seller (identified by context_id)
+                    response = await messenger.send_discovery(
+                        discovery_data=discovery_data,
+                        context_id=context_id,
+                        timestamp=sent_at,
+                    )
 
-                # Handle the response (seller's offer)
-                if response:
-                    parsed_messages = MessageParser.parse_response(response)
-                    for parsed_msg in parsed_messages:
-                        if parsed_msg.message_type == MessageType.OFFER:
-                            await self._handle_offer(session_id, parsed_msg)
+                    # %-style args: only formatted when DEBUG is enabled
+                    logger.debug(
+                        "[ReverseAuctionCoordinator] Requested offer from context %.8s... for round %d",
+                        context_id,
+                        round_num,
+                    )
 
-            except Exception as e:
-                logger.error(
-                    f"[ReverseAuctionCoordinator] Error requesting offer from context {context_id[:8]}...: {e}"
-                )
+                    # Handle the response (seller's offer), parsing parts lazily
+                    if response:
+                        for parsed_msg in MessageParser.iter_response(response):
+                            if parsed_msg.message_type == MessageType.OFFER:
+                                await self._handle_offer(
+                                    state, parsed_msg, round_num, context_id
+                                )
+
+                except Exception as e:
+                    logger.error(
+                        "[ReverseAuctionCoordinator] Error requesting offer from context %.8s...: %s",
+                        context_id,
+                        e,
+                    )
 
-        # Send requests to all sellers in parallel
-        tasks = [
-            request_offer_from_seller(context_id)
-            for context_id in state.counterparties.keys()
-        ]
+        # Send requests to all sellers in parallel. The seller set is snapshot
+        # here, so a seller joining mid-round takes part from the next round
+        context_ids = tuple(state.counterparties)
+        tasks = [request_offer_from_seller(context_id) for context_id in context_ids]
 
-        # Wait for all requests to complete
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Wait for all requests to complete. request_offer_from_seller logs
+        # and swallows its own errors, so gather() has no exceptions to collect
+        await asyncio.gather(*tasks)
 
     async def handle_message(
         self,
@@ -370,7 +451,7 @@ class ReverseAuctionCoordinator(Coordinator):
         message: ParsedMessage,
     ) -> Optional[CoordinatorResult]:
         """Handle incoming message during reverse auction."""
-        state = self.state_manager.get_session(session_id)
+        state = self._get_state(session_id)
         if not state:
             logger.warning(f"[ReverseAuctionCoordinator] Unknown session {session_id}")
             return None
@@ -378,22 +459,17 @@ class ReverseAuctionCoordinator(Coordinator):
         if state.status != "active":
             return None
 
-        # Route by message type
-        if message.message_type == MessageType.DISCOVERY:
-            await self._handle_discovery(session_id, message)
-            return None
-
-        elif message.message_type == MessageType.OFFER:
-            await self._handle_offer(session_id, message)
-            return None
-
-        elif message.message_type == MessageType.ACTION:
-            # Actions during reverse auction (cancel, etc.)
-            return await self._handle_action(session_id, message)
+        # Route by message type; handlers get the already-resolved state.
+        # Only action handlers produce a result (e.g. cancel).
+        handler = self._dispatch.get(message.message_type)
+        if handler:
+            return await handler(state, message)
 
         return None
 
-    async def _handle_discovery(self, session_id: str, message: ParsedMessage):
+    async def _handle_discovery(
+        self, state: ReverseAuctionState, message: ParsedMessage
+    ):
         """
         Handle discovery message.
 
@@ -401,12 +477,12 @@ class ReverseAuctionCoordinator(Coordinator):
         Agent will see discovery data in state and can respond via SendDiscoveryAction.
         """
         logger.info(
-            f"[ReverseAuctionCoordinator] Discovery message received in {session_id}"
+            f"[ReverseAuctionCoordinator] Discovery message received in {state.session_id}"
         )
 
         # Emit event to store discovery message in state
         self.state_manager.emit_event(
-            session_id=session_id,
+            session_id=state.session_id,
             event_type=EventType.DISCOVERY_RECEIVED,
             data={
                 "discovery_data": message.discovery_data or {},
@@ -415,37 +491,98 @@ class ReverseAuctionCoordinator(Coordinator):
             context_id=message.context_id,
         )
 
-    async def _handle_offer(self, session_id: str, message: ParsedMessage):
-        """Handle incoming offer."""
-        state = self.state_manager.get_session(session_id)
-        if not state or not isinstance(state, ReverseAuctionState):
-            return
+    async def _handle_offer(
+        self,
+        state: ReverseAuctionState,
+        message: ParsedMessage,
+        round_number: Optional[int] = None,
+        context_id: Optional[str] = None,
+    ):
+        """
+        Handle incoming offer.
+
+        Args:
+            state: Reverse auction session state
+            message: Parsed OFFER message
+            round_number: Round the offer was requested for (defaults to the
+                current round, e.g. for unsolicited offers)
+            context_id: Seller context the offer was requested from (defaults
+                to the message's; offers returned in a response carry none)
+        """
+        session_id = state.session_id
+        context_id = context_id or message.context_id
 
         # Parse offer
         offer_data = message.offer_data
         if not offer_data:
             return
 
+        # Parse now so a malformed offer fails here rather than when the
+        # buffered event is applied at round close
         offer = Offer.from_dict(offer_data)
+        if round_number is None:
+            round_number = state.current_round
 
         logger.debug(f"[ReverseAuctionCoordinator] Received offer: ${offer.price}")
 
-        # Emit offer received event (this will auto-update state via apply_event)
-        # Agent will see this offer in state when decide_next_action() is called
-        self.state_manager.emit_event(
-            session_id=session_id,
-            event_type=EventType.OFFER_RECEIVED,
-            data={
-                "offer": offer.to_dict(),
-                "round": state.current_round,
-                "emitter": self.uuid,
-            },
-            context_id=message.context_id,
+        # Offer received event (applying it updates state). While a round is
+        # open, events are buffered and emitted together when it closes;
+        # agents only look at state between rounds. The event gets its own
+        # copy of the data rather than sharing the request's dicts.
+        event_data = {
+            "offer": offer.to_dict(),
+            "round": round_number,
+            "emitter": self.uuid,
+        }
+        pending = self._pending_offers.get(session_id)
+        if pending is None:
+            self.state_manager.emit_event(
+                session_id=session_id,
+                event_type=EventType.OFFER_RECEIVED,
+                data=event_data,
+                context_id=context_id,
+            )
+            return
+
+        pending.append((EventType.OFFER_RECEIVED, event_data, context_id))
+
+        # Close the round early once every expected participant has offered
+        # in it. Sellers are counted once, however many offers they send,
+        # and offers for an earlier round do not count.
+        senders = self._round_senders.get(session_id)
+        if senders is None or round_number != state.current_round:
+            return
+        if context_id:
+            senders.add(context_id)
+        round_event = self._round_events.get(session_id)
+        if (
+            round_event
+            and state.expected_participants
+            and len(senders) >= state.expected_participants
+        ):
+            round_event.set()
+
+    def _flush_offers(self, session_id: str, close: bool = False):
+        """
+        Emit the buffered OFFER_RECEIVED events of a session's open round.
+
+        Args:
+            session_id: Session ID
+            close: Also stop buffering (offers arriving later are emitted
+                immediately)
+        """
+        pending = (
+            self._pending_offers.pop(session_id, None)
+            if close
+            else self._pending_offers.get(session_id)
         )
+        if pending:
+            self.state_manager.emit_events(session_id, pending)
+            pending.clear()
 
     async def _handle_action(
         self,
-        session_id: str,
+        state: ReverseAuctionState,
         message: ParsedMessage,
     ) -> Optional[CoordinatorResult]:
         """Handle action (cancel, etc.)."""
@@ -453,10 +590,10 @@ class ReverseAuctionCoordinator(Coordinator):
 
         if action == "cancel":
             logger.info(
-                f"[ReverseAuctionCoordinator] Reverse auction {session_id} cancelled"
+                f"[ReverseAuctionCoordinator] Reverse auction {state.session_id} cancelled"
             )
             return self._complete_session(
-                session_id=session_id,
+                state,
                 status="cancelled",
                 reason="Cancelled by participant",
             )
@@ -465,26 +602,22 @@ class ReverseAuctionCoordinator(Coordinator):
 
     def _complete_session(
         self,
-        session_id: str,
+        state: ReverseAuctionState,
         status: str,
         reason: str,
     ) -> CoordinatorResult:
         """
         Complete reverse auction session and return results.
         """
-        state = self.state_manager.get_session(session_id)
-        if not state or not isinstance(state, ReverseAuctionState):
-            return CoordinatorResult(
-                status="failed",
-                session_id=session_id,
-                session_type=SessionType.REVERSE_AUCTION.value,
-                data={},
-                message="Session not found",
-            )
+        session_id = state.session_id
+        self._sessions.pop(session_id, None)
+        self._messengers.pop(session_id, None)
+        self._round_senders.pop(session_id, None)
+        self._flush_offers(session_id, close=True)
 
-        # Collect all offers
+        # Collect all offers, serialized once for both the event and the result
         all_offers = state.get_all_offers()
-        prices = [o.price for o in all_offers] if all_offers else []
+        offer_dicts = [o.to_dict() for o in all_offers]
 
         # Emit completion event with appropriate type and data
         if status == "completed":
@@ -492,7 +625,7 @@ class ReverseAuctionCoordinator(Coordinator):
             event_data = {
                 "reason": reason,
                 "total_offers": len(all_offers),
-                "all_offers": [o.to_dict() for o in all_offers],
+                "all_offers": offer_dicts,
                 "emitter": self.uuid,
             }
         elif status == "cancelled":
@@ -512,16 +645,19 @@ class ReverseAuctionCoordinator(Coordinator):
         result_data = {
             "rounds": state.current_round,
             "total_offers": len(all_offers),
-            "all_offers": [o.to_dict() for o in all_offers],
+            "all_offers": offer_dicts,
             "started_at": state.created_at.isoformat(),
-            "completed_at": datetime.now().isoformat(),
+            "completed_at": iso_now(),
         }
 
-        if prices:
+        # Overall price range from the per-round aggregates
+        round_stats = state.round_stats.values()
+        if round_stats:
+            count = sum(stats.n for stats in round_stats)
             result_data["price_range"] = {
-                "min": min(prices),
-                "max": max(prices),
-                "avg": sum(prices) / len(prices),
+                "min": min(stats.min for stats in round_stats),
+                "max": max(stats.max for stats in round_stats),
+                "avg": sum(stats.sum for stats in round_stats) / count,
             }
 
         # No winner selection - just collect all offers
@@ -541,8 +677,8 @@ class ReverseAuctionCoordinator(Coordinator):
 
     async def get_session_status(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get current reverse auction status."""
-        state = self.state_manager.get_session(session_id)
-        if not state or not isinstance(state, ReverseAuctionState):
+        state = self._get_state(session_id)
+        if not state:
             return None
 
         return {
@@ -565,6 +701,16 @@ class ReverseAuctionCoordinator(Coordinator):
             event_type=EventType.SESSION_CANCELLED,
             data={"reason": "Cancelled by user", "emitter": self.uuid},
         )
+        self._sessions.pop(session_id, None)
+        self._messengers.pop(session_id, None)
+        self._round_senders.pop(session_id, None)
+
+        # Keep offers already received, and wake the round loop so it
+        # notices the cancellation right away
+        self._flush_offers(session_id, close=True)
+        round_event = self._round_events.get(session_id)
+        if round_event:
+            round_event.set()
 
         logger.info(
             f"[ReverseAuctionCoordinator] Reverse auction {session_id} cancelled"
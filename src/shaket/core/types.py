@@ -25,12 +25,13 @@ class AgentRole(Enum):
     SELLER = "seller"
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """
     Item being traded.
 
     Represents any product, service, or asset being bought/sold.
+    Items are built per INIT request, so the class uses __slots__.
     """
 
     id: str
@@ -64,11 +65,13 @@ class Item:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Offer:
     """
     An offer in a commerce session.
 
+    Offers are immutable records; sessions can hold many of them, so the
+    class uses __slots__ instead of a per-instance __dict__.
     """
 
     offer_id: str
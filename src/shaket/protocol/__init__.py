@@ -8,7 +8,12 @@ from .messages import (
     create_discovery_message,
     create_offer_message,
     create_action_message,
+    build_discovery_payload,
+    build_offer_payload,
+    build_action_payload,
     parse_message,
+    iso_now,
+    new_data_part,
     MessageType,
     ActionType,
 )
@@ -17,7 +22,12 @@ __all__ = [
     "create_discovery_message",
     "create_offer_message",
     "create_action_message",
+    "build_discovery_payload",
+    "build_offer_payload",
+    "build_action_payload",
     "parse_message",
+    "iso_now",
+    "new_data_part",
     "MessageType",
     "ActionType",
 ]
\ No newline at end of file
@@ -11,25 +11,81 @@ Message Types:
 
 from typing import Dict, Any, Optional
 from enum import Enum
-from datetime import datetime
-import uuid
+from time import localtime, strftime, time_ns
+from uuid import uuid4
 
-from a2a import utils as a2a_utils
-from a2a.types import Message, DataPart
+from a2a.types import Message, DataPart, Part, Role
 
 from ..core.types import Offer, Item, SessionType
 
 
-class MessageType(Enum):
-    """Types of messages in Shaket protocol."""
+# (second, date/time prefix) of the last timestamp, reused until the second
+# changes; kept as one tuple so it is swapped atomically
+_iso_cache = (-1, "")
+
+
+def iso_now() -> str:
+    """
+    Current local time in the ISO 8601 format used for message timestamps.
+
+    Same result as datetime.now().isoformat(timespec="microseconds"); only
+    the microseconds are formatted per call.
+    """
+    global _iso_cache
+    second, nanos = divmod(time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_cache
+    if second != cached_second:
+        prefix = strftime("%Y-%m-%dT%H:%M:%S", localtime(second))
+        _iso_cache = (second, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+
+def new_data_part(data: Dict[str, Any]) -> DataPart:
+    """
+    Wrap Shaket message data in an A2A DataPart.
+
+    The data is built by this module (or the server) and is already plain
+    JSON-compatible, so the DataPart is constructed without re-validation.
+    """
+    return DataPart.model_construct(kind="data", data=data)
+
+
+def _new_agent_message(
+    message_data: Dict[str, Any],
+    context_id: Optional[str] = None,
+    task_id: Optional[str] = None,
+) -> Message:
+    """
+    Build an agent Message carrying message_data as its single DataPart.
+
+    Equivalent to a2a.utils.new_agent_parts_message(), but every field is
+    already known to be valid, so the Message and Part are constructed
+    without running pydantic validation.
+    """
+    return Message.model_construct(
+        kind="message",
+        role=Role.agent,
+        parts=[Part.model_construct(root=new_data_part(message_data))],
+        message_id=str(uuid4()),
+        task_id=task_id,
+        context_id=context_id,
+    )
+
+
+class MessageType(str, Enum):
+    """
+    Types of messages in Shaket protocol.
+
+    Members are also strings, so they compare equal to their wire values.
+    """
 
     DISCOVERY = "discovery"  # General conversation, info gathering
     OFFER = "offer"  # Price offer
     ACTION = "action"  # init, accept, cancel, ack
 
 
-class ActionType(Enum):
-    """Action types."""
+class ActionType(str, Enum):
+    """Action types (members compare equal to their wire values)."""
 
     INIT = "init"  # Initialize a commerce session
     ACCEPT = "accept"  # Accept an offer
@@ -37,9 +93,89 @@ class ActionType(Enum):
     ACK = "ack"  # Acknowledge a message
 
 
+def build_discovery_payload(
+    discovery_data: Dict[str, Any],
+    timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the Shaket data of a discovery message.
+
+    This is the dict create_discovery_message() wraps in a DataPart; use it
+    directly where only the data is needed (e.g. task artifacts).
+
+    Args:
+        discovery_data: Discovery data (see create_discovery_message)
+        timestamp: Optional ISO timestamp (defaults to now)
+
+    Returns:
+        Message data dict
+    """
+    return {
+        "message_id": str(uuid4()),
+        "timestamp": timestamp or iso_now(),
+        "type": MessageType.DISCOVERY.value,
+        "discovery_data": discovery_data,
+    }
+
+
+def build_offer_payload(
+    offer: Offer,
+    session_type: SessionType,
+    timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the Shaket data of an offer message.
+
+    This is the dict create_offer_message() wraps in a DataPart.
+
+    Args:
+        offer: Offer object
+        session_type: Type of session
+        timestamp: Optional ISO timestamp (defaults to now)
+
+    Returns:
+        Message data dict
+    """
+    return {
+        "message_id": str(uuid4()),
+        "timestamp": timestamp or iso_now(),
+        "type": MessageType.OFFER.value,
+        "session_type": session_type.value,
+        "offer": offer.to_dict(),
+    }
+
+
+def build_action_payload(
+    action: ActionType,
+    action_data: Optional[Dict[str, Any]] = None,
+    timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the Shaket data of an action message.
+
+    This is the dict create_action_message() wraps in a DataPart.
+
+    Args:
+        action: Action type (init, accept, cancel, ack)
+        action_data: Action-specific data (see create_action_message)
+        timestamp: Optional ISO timestamp (defaults to now)
+
+    Returns:
+        Message data dict
+    """
+    return {
+        "message_id": str(uuid4()),
+        "timestamp": timestamp or iso_now(),
+        "type": MessageType.ACTION.value,
+        "action": action.value,
+        "action_data": action_data or {},
+    }
+
+
 def create_discovery_message(
     discovery_data: Dict[str, Any],
     context_id: Optional[str] = None,
+    timestamp: Optional[str] = None,
 ) -> Message:
     """
     Create a discovery message.
@@ -56,6 +192,8 @@ def create_discovery_message(
             - topic: Topic of conversation
             - Any other conversational data
         context_id: Optional A2A context ID
+        timestamp: Optional ISO timestamp (defaults to now); pass one
+            iso_now() value to stamp a batch of messages alike
 
     Returns:
         A2A Message
@@ -66,15 +204,8 @@ def create_discovery_message(
             "topic": "item_condition"
         }
     """
-    message_data = {
-        "message_id": str(uuid.uuid4()),
-        "timestamp": datetime.now().isoformat(),
-        "type": MessageType.DISCOVERY.value,
-        "discovery_data": discovery_data,
-    }
-
-    parts = [DataPart(kind="data", data=message_data)]
-    return a2a_utils.new_agent_parts_message(parts=parts, context_id=context_id)
+    message_data = build_discovery_payload(discovery_data, timestamp)
+    return _new_agent_message(message_data, context_id=context_id)
 
 
 def create_offer_message(
@@ -82,6 +213,7 @@ def create_offer_message(
     session_type: SessionType,
     context_id: Optional[str] = None,
     task_id: Optional[str] = None,
+    timestamp: Optional[str] = None,
 ) -> Message:
     """
     Create an offer message.
@@ -91,24 +223,13 @@ def create_offer_message(
         session_type: Type of session
         context_id: A2A context ID
         task_id: Optional task ID
+        timestamp: Optional ISO timestamp (defaults to now)
 
     Returns:
         A2A Message
     """
-    message_data = {
-        "message_id": str(uuid.uuid4()),
-        "timestamp": datetime.now().isoformat(),
-        "type": MessageType.OFFER.value,
-        "session_type": session_type.value,
-        "offer": offer.to_dict(),
-    }
-
-    parts = [DataPart(kind="data", data=message_data)]
-    return a2a_utils.new_agent_parts_message(
-        parts=parts,
-        context_id=context_id,
-        task_id=task_id,
-    )
+    message_data = build_offer_payload(offer, session_type, timestamp)
+    return _new_agent_message(message_data, context_id=context_id, task_id=task_id)
 
 
 def create_action_message(
@@ -116,6 +237,7 @@ def create_action_message(
     action_data: Optional[Dict[str, Any]] = None,
     context_id: Optional[str] = None,
     task_id: Optional[str] = None,
+    timestamp: Optional[str] = None,
 ) -> Message:
     """
     Create an action message.
@@ -135,6 +257,7 @@ def create_action_message(
                 - message: Optional message string
         context_id: A2A context ID
         task_id: Optional task ID
+        timestamp: Optional ISO timestamp (defaults to now)
 
     Returns:
         A2A Message
@@ -153,20 +276,8 @@ def create_action_message(
             "reason": "Good price"
         }
     """
-    message_data = {
-        "message_id": str(uuid.uuid4()),
-        "timestamp": datetime.now().isoformat(),
-        "type": MessageType.ACTION.value,
-        "action": action.value,
-        "action_data": action_data or {},
-    }
-
-    parts = [DataPart(kind="data", data=message_data)]
-    return a2a_utils.new_agent_parts_message(
-        parts=parts,
-        context_id=context_id,
-        task_id=task_id,
-    )
+    message_data = build_action_payload(action, action_data, timestamp)
+    return _new_agent_message(message_data, context_id=context_id, task_id=task_id)
 
 
 def parse_message(message: Message) -> Optional[Dict[str, Any]]:
@@ -187,16 +298,16 @@ def parse_message(message: Message) -> Optional[Dict[str, Any]]:
 
         Returns None if invalid
     """
-    # Extract data parts using a2a-sdk utilities
-    data_parts = a2a_utils.get_data_parts(message.parts)
+    # Shaket data lives in the first DataPart; stop there instead of
+    # collecting every data part of the message
+    data = next(
+        (part.root.data for part in message.parts if isinstance(part.root, DataPart)),
+        None,
+    )
 
-    if not data_parts:
+    if data is None:
         return None
 
-    data = data_parts[0]
-
-    # Add context_id and task_id from message envelope
-    data["context_id"] = message.context_id
-    data["task_id"] = message.task_id
-
-    return data
+    # Add context_id and task_id from message envelope (on a copy, so the
+    # A2A message's own data is left untouched)
+    return {**data, "context_id": message.context_id, "task_id": message.task_id}
@@ -8,9 +8,13 @@ and respond to incoming A2A negotiation and auction requests.
 from .server import ShaketServer
 from .agent_card import generate_agent_card
 from .agent_executor import ShaketAgentExecutor
+from .micro_batcher import MicroBatcher
+from .task_store import BoundedTaskStore
 
 __all__ = [
     "ShaketServer",
     "generate_agent_card",
     "ShaketAgentExecutor",
+    "MicroBatcher",
+    "BoundedTaskStore",
 ]
\ No newline at end of file
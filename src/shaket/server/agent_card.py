@@ -11,6 +11,54 @@ from a2a.types import AgentCard, AgentCapabilities, AgentSkill
 from ..core.types import SessionType, AgentRole
 
 
+def _negotiate_skill(role_desc: List[str]) -> AgentSkill:
+    return AgentSkill(
+        id="negotiate",
+        name="One-on-One Negotiation",
+        description=f"Negotiate directly with another agent (can {' and '.join(role_desc)})",
+        tags=["negotiation", "shaket"] + role_desc,
+        examples=[
+            "Negotiate price for a product",
+            "Discuss terms with a counterparty",
+        ],
+    )
+
+
+# Skills are fixed per capability, so build them once and share them between
+# cards. Negotiation skills are keyed by (can_buy, can_sell).
+_NEGOTIATE_SKILLS = {
+    (can_buy, can_sell): _negotiate_skill(
+        [desc for desc, able in (("buy", can_buy), ("sell", can_sell)) if able]
+    )
+    for can_buy in (False, True)
+    for can_sell in (False, True)
+}
+
+_REVERSE_AUCTION_SELLER_SKILL = AgentSkill(
+    id="reverse_auction_seller",
+    name="Reverse Auction (Seller)",
+    description="Submit competitive offers to buyers in a reverse auction",
+    tags=["reverse-auction", "sell", "multi-party", "shaket"],
+    examples=[
+        "Submit offer in reverse auction",
+        "Compete with other sellers for best price",
+        "Adjust offers based on market feedback",
+    ],
+)
+
+_REVERSE_AUCTION_BUYER_SKILL = AgentSkill(
+    id="reverse_auction_buyer",
+    name="Reverse Auction (Buyer)",
+    description="Collect offers from multiple sellers and evaluate them",
+    tags=["reverse-auction", "buy", "multi-party", "shaket"],
+    examples=[
+        "Request offers from multiple sellers",
+        "Provide market feedback to sellers",
+        "Evaluate all offers after rounds complete",
+    ],
+)
+
+
 def generate_agent_card(
     name: str,
     description: str,
@@ -44,63 +92,25 @@ def generate_agent_card(
             supported_roles=[AgentRole.BUYER],
         )
     """
-    skills = []
+    supported_session_types = frozenset(supported_session_types)
+    supported_roles = frozenset(supported_roles)
 
     # Generate skills based on supported capabilities
     can_buy = AgentRole.BUYER in supported_roles
     can_sell = AgentRole.SELLER in supported_roles
 
+    skills = []
+
     # Negotiation skills
     if SessionType.NEGOTIATION in supported_session_types:
-        role_desc = []
-        if can_buy:
-            role_desc.append("buy")
-        if can_sell:
-            role_desc.append("sell")
-
-        skills.append(
-            AgentSkill(
-                id="negotiate",
-                name="One-on-One Negotiation",
-                description=f"Negotiate directly with another agent (can {' and '.join(role_desc)})",
-                tags=["negotiation", "shaket"] + role_desc,
-                examples=[
-                    "Negotiate price for a product",
-                    "Discuss terms with a counterparty",
-                ],
-            )
-        )
+        skills.append(_NEGOTIATE_SKILLS[can_buy, can_sell])
 
     # Reverse Auction skills
     if SessionType.REVERSE_AUCTION in supported_session_types:
         if can_sell:
-            skills.append(
-                AgentSkill(
-                    id="reverse_auction_seller",
-                    name="Reverse Auction (Seller)",
-                    description="Submit competitive offers to buyers in a reverse auction",
-                    tags=["reverse-auction", "sell", "multi-party", "shaket"],
-                    examples=[
-                        "Submit offer in reverse auction",
-                        "Compete with other sellers for best price",
-                        "Adjust offers based on market feedback",
-                    ],
-                )
-            )
+            skills.append(_REVERSE_AUCTION_SELLER_SKILL)
         if can_buy:
-            skills.append(
-                AgentSkill(
-                    id="reverse_auction_buyer",
-                    name="Reverse Auction (Buyer)",
-                    description="Collect offers from multiple sellers and evaluate them",
-                    tags=["reverse-auction", "buy", "multi-party", "shaket"],
-                    examples=[
-                        "Request offers from multiple sellers",
-                        "Provide market feedback to sellers",
-                        "Evaluate all offers after rounds complete",
-                    ],
-                )
-            )
+            skills.append(_REVERSE_AUCTION_BUYER_SKILL)
 
     # Build role description
     roles = []
@@ -13,7 +13,6 @@ from a2a.server.agent_execution.context import RequestContext
 from a2a.server.events.event_queue import EventQueue
 from a2a.server.tasks import TaskUpdater
 from a2a.types import (
-    DataPart,
     TaskState,
     TextPart,
     UnsupportedOperationError,
@@ -31,11 +30,13 @@ from ..state import (
 from ..protocol.messages import (
     ActionType,
     MessageType,
-    create_action_message,
-    create_offer_message,
-    create_discovery_message,
+    build_action_payload,
+    build_offer_payload,
+    build_discovery_payload,
+    new_data_part,
 )
 from ..core.types import SessionType, AgentRole, Offer, Item
+from .micro_batcher import MicroBatcher, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS
 from ..agents import (
     NegotiationAgent,
     ReverseAuctionAgent,
@@ -47,6 +48,17 @@ from ..agents import (
 
 logger = logging.getLogger(__name__)
 
+# Enum members and wire values compared on every request, resolved once
+_MT_ACTION = MessageType.ACTION
+_MT_OFFER = MessageType.OFFER
+_MT_DISCOVERY = MessageType.DISCOVERY
+_INIT = ActionType.INIT.value
+_ACCEPT = ActionType.ACCEPT.value
+_CANCEL = ActionType.CANCEL.value
+
+# Our role in a session, by the role the counterparty announces in INIT
+_OPPOSITE_ROLE = {"buyer": AgentRole.SELLER, "seller": AgentRole.BUYER}
+
 
 class ShaketAgentExecutor(AgentExecutor):
     """
@@ -63,30 +75,76 @@ class ShaketAgentExecutor(AgentExecutor):
     6. Executor executes the action and sends A2A response
     """
 
+    # Response action_data templates: per-call fields are filled in on a
+    # copy (key order here is the order on the wire)
+    _ACK_INIT_TEMPLATE = {
+        "context_id": None,
+        "uuid": None,
+        "status": "initialized",
+        "session_type": None,
+        "item": None,
+        "role": None,
+        "our_role": None,
+        "message": None,
+    }
+    _ACK_ACCEPT_TEMPLATE = {
+        "status": "completed",
+        "message": "Offer accepted. Deal complete!",
+        "offer_id": None,
+        "final_price": None,
+    }
+    _ACCEPT_TEMPLATE = {
+        "offer_id": None,
+        "message": None,
+        "status": "completed",
+    }
+
     def __init__(
         self,
         state_manager: StateManager,
-        context_to_session_map: Dict[str, str],
+        context_to_session_map: Optional[Dict[str, str]] = None,
         negotiation_agent: Optional[NegotiationAgent] = None,
         reverse_auction_agent: Optional[ReverseAuctionAgent] = None,
         uuid: Optional[str] = None,
+        micro_batching: bool = False,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
     ):
         """
         Initialize executor.
 
         Args:
             state_manager: Session state manager
-            context_to_session_map: Mapping of context_id to session_id
+            context_to_session_map: Unused - contexts are resolved through the
+                StateManager (kept for interface compatibility)
             negotiation_agent: Optional user-provided server negotiation agent
             reverse_auction_agent: Optional user-provided server reverse auction agent
             uuid: UUID of the server that owns this executor
+            micro_batching: Route parsed messages through a MicroBatcher
+            max_batch_size: Maximum messages per batch (micro_batching only)
+            max_wait_ms: Maximum wait for a batch to fill (micro_batching only)
         """
         self.state_manager = state_manager
-        self._context_to_session = context_to_session_map
         self.negotiation_agent = negotiation_agent
         self.reverse_auction_agent = reverse_auction_agent
         self.uuid = uuid
 
+        # State updates for incoming messages, by (message type, action)
+        self._state_updaters = {
+            (_MT_OFFER, None): self._on_offer,
+            (_MT_ACTION, _ACCEPT): self._on_accept,
+            (_MT_ACTION, _CANCEL): self._on_cancel,
+            (_MT_DISCOVERY, None): self._on_discovery,
+        }
+
+        self.batcher: Optional[MicroBatcher] = None
+        if micro_batching:
+            self.batcher = MicroBatcher(
+                self._handle_message,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+            )
+
     async def execute(
         self,
         context: RequestContext,
@@ -107,17 +165,15 @@ class ShaketAgentExecutor(AgentExecutor):
             event_queue: Queue for sending responses
         """
         logger.debug(
-            f"[ShaketAgentExecutor] execute called with task_id: {context.task_id}"
+            "[ShaketAgentExecutor] execute called with task_id: %s", context.task_id
         )
 
         # Create task updater
         updater = TaskUpdater(event_queue, context.task_id, context.context_id)
 
         try:
-            # Notify task submitted
-            if not context.current_task:
-                await updater.update_status(TaskState.submitted)
-
+            # A new task goes straight to working; a separate submitted
+            # update would just be overwritten by the next event
             await updater.update_status(TaskState.working)
 
             # Extract message
@@ -137,21 +193,26 @@ class ShaketAgentExecutor(AgentExecutor):
                 await updater.update_status(TaskState.failed, final=True)
                 return
 
-            logger.info(
-                f"[ShaketAgentExecutor] Parsed message: type={parsed.message_type}, "
-                f"action={parsed.action}, session_type={parsed.session_type}"
+            logger.debug(
+                "[ShaketAgentExecutor] Parsed message: type=%s, action=%s, session_type=%s",
+                parsed.message_type,
+                parsed.action,
+                parsed.session_type,
             )
 
             # Handle message with new unified approach
-            response_text = await self._handle_message(
-                parsed=parsed,
-                context_id=context.context_id,
-            )
+            if self.batcher:
+                response_text = await self.batcher.submit(parsed, context.context_id)
+            else:
+                response_text = await self._handle_message(
+                    parsed=parsed,
+                    context_id=context.context_id,
+                )
 
             # Send response
             if isinstance(response_text, dict):
                 # Structured response - add as DataPart
-                await updater.add_artifact([DataPart(kind="data", data=response_text)])
+                await updater.add_artifact([new_data_part(response_text)])
             else:
                 # Simple text response
                 await updater.add_artifact([TextPart(text=response_text)])
@@ -159,7 +220,7 @@ class ShaketAgentExecutor(AgentExecutor):
             await updater.update_status(TaskState.completed, final=True)
 
             logger.info(
-                f"[ShaketAgentExecutor] Task {context.task_id} completed successfully"
+                "[ShaketAgentExecutor] Task %s completed successfully", context.task_id
             )
 
         except Exception as e:
@@ -181,7 +242,8 @@ class ShaketAgentExecutor(AgentExecutor):
             event_queue: Queue for sending events
         """
         logger.info(
-            f"[ShaketAgentExecutor] Cancellation requested for context {context.context_id}"
+            "[ShaketAgentExecutor] Cancellation requested for context %s",
+            context.context_id,
         )
 
         raise ServerError(error=UnsupportedOperationError())
@@ -209,46 +271,42 @@ class ShaketAgentExecutor(AgentExecutor):
         """
         # Special handling for INIT - creates session
         if (
-            parsed.message_type == MessageType.ACTION
-            and parsed.action == ActionType.INIT.value
+            parsed.message_type == _MT_ACTION
+            and parsed.action == _INIT
         ):
             return await self._handle_init(parsed, context_id, context_id)
 
-        # For other messages, get session
+        # For other messages, get session. The state is looked up once per
+        # request; emitted events update this same object in place.
         try:
-            session_id = self._get_session_id(context_id)
+            state = self._get_session(context_id)
         except ValueError as e:
             logger.error(f"[ShaketAgentExecutor] {e}")
             return str(e)
+        session_id = state.session_id
 
         # Update state from incoming message
         await self._update_state_from_message(session_id, parsed, context_id)
 
         # Check if this is an ACCEPT action - handle without asking agent
         if (
-            parsed.message_type == MessageType.ACTION
-            and parsed.action == ActionType.ACCEPT.value
+            parsed.message_type == _MT_ACTION
+            and parsed.action == _ACCEPT
         ):
-            response = await self._handle_accept(session_id, parsed, context_id)
+            response = await self._handle_accept(state, parsed, context_id)
             if response:
                 return response
             # If validation failed, continue to normal flow (edge case)
 
         # Get agent for this session
-        agent = self._get_agent_for_session(session_id)
+        agent = self._get_agent_for_session(state)
         if not agent:
-            state = self.state_manager.get_session(session_id)
-            session_type = state.session_type.value if state else "unknown"
+            session_type = state.session_type.value
             logger.warning(
                 f"[ShaketAgentExecutor] No agent configured for {session_type}"
             )
             return f"No agent configured for {session_type}"
 
-        # Get current state
-        state = self.state_manager.get_session(session_id)
-        if not state:
-            return "Error: Session not found"
-
         # Ask agent to decide next action
         try:
             action = await agent.decide_next_action(session_id, state)
@@ -259,24 +317,25 @@ class ShaketAgentExecutor(AgentExecutor):
             return f"Error: Agent failed to decide action: {str(e)}"
 
         # Execute agent's action and return response
-        return await self._execute_action(session_id, action, context_id)
+        return await self._execute_action(state, action, context_id)
 
-    def _get_session_id(self, context_id: str) -> str:
+    def _get_session(self, context_id: str) -> SessionState:
         """
-        Get session ID from context ID.
+        Get session state from context ID.
 
         Args:
             context_id: A2A context ID
 
         Returns:
-            Session ID
+            Session state
 
         Raises:
             ValueError: If no session found for context
         """
-        session_id = self._context_to_session.get(context_id)
-        if session_id:
-            return session_id
+        # create_session() maps the session's context in the StateManager
+        state = self.state_manager.get_session_by_context(context_id)
+        if state:
+            return state
 
         raise ValueError(f"No session found for context {context_id}")
 
@@ -297,76 +356,79 @@ class ShaketAgentExecutor(AgentExecutor):
             parsed: ParsedMessage
             context_id: A2A context ID
         """
-        if parsed.message_type == MessageType.OFFER:
-            # Store incoming offer
-            offer_data = parsed.offer_data
-            if offer_data:
-                offer = Offer.from_dict(offer_data)
-
-                # Update framework state
-                self.state_manager.emit_event(
-                    session_id=session_id,
-                    event_type=EventType.OFFER_RECEIVED,
-                    data={"offer": offer.to_dict(), "emitter": self.uuid},
-                    context_id=context_id,
-                )
-                logger.info(
-                    f"[ShaketAgentExecutor] Stored offer: ${offer.price} in session {session_id}"
-                )
-
-        elif parsed.message_type == MessageType.ACTION:
-            if parsed.action == ActionType.ACCEPT.value:
-                # Store acceptance
-                self.state_manager.emit_event(
-                    session_id=session_id,
-                    event_type=EventType.OFFER_ACCEPTED,
-                    data={"action_data": parsed.action_data, "emitter": self.uuid},
-                    context_id=context_id,
-                )
-                logger.info(
-                    f"[ShaketAgentExecutor] Offer accepted in session {session_id}"
-                )
-
-            elif parsed.action == ActionType.CANCEL.value:
-                # Store cancellation
-                self.state_manager.emit_event(
-                    session_id=session_id,
-                    event_type=EventType.SESSION_CANCELLED,
-                    data={
-                        "reason": (
-                            parsed.action_data.get(
-                                "reason", "Cancelled by counterparty"
-                            )
-                            if parsed.action_data
-                            else "Cancelled"
-                        ),
-                        "emitter": self.uuid,
-                    },
-                    context_id=context_id,
-                )
-                logger.info(f"[ShaketAgentExecutor] Session {session_id} cancelled")
-
-        elif parsed.message_type == MessageType.DISCOVERY:
-            # Store discovery message in state
+        # Actions are keyed by (type, action), everything else by (type, None)
+        message_type = parsed.message_type
+        handler = self._state_updaters.get(
+            (message_type, parsed.action if message_type == _MT_ACTION else None)
+        )
+        if handler:
+            handler(session_id, parsed, context_id)
+
+    def _on_offer(self, session_id: str, parsed, context_id: str):
+        """Store an incoming offer."""
+        offer_data = parsed.offer_data
+        if offer_data:
+            # Parse before emitting so a malformed offer never reaches the
+            # event log; the event gets its own copy of the data
+            offer = Offer.from_dict(offer_data)
+
+            # Update framework state
             self.state_manager.emit_event(
                 session_id=session_id,
-                event_type=EventType.DISCOVERY_RECEIVED,
-                data={
-                    "discovery_data": parsed.discovery_data or {},
-                    "emitter": self.uuid,
-                },
+                event_type=EventType.OFFER_RECEIVED,
+                data={"offer": offer.to_dict(), "emitter": self.uuid},
                 context_id=context_id,
             )
             logger.info(
-                f"[ShaketAgentExecutor] Discovery message received in session {session_id}"
+                "[ShaketAgentExecutor] Stored offer: $%s in session %s",
+                offer.price,
+                session_id,
             )
 
-    def _get_agent_for_session(self, session_id: str):
-        """Get the appropriate agent for this session."""
-        state = self.state_manager.get_session(session_id)
-        if not state:
-            return None
+    def _on_accept(self, session_id: str, parsed, context_id: str):
+        """Store an acceptance from the counterparty."""
+        self.state_manager.emit_event(
+            session_id=session_id,
+            event_type=EventType.OFFER_ACCEPTED,
+            data={"action_data": parsed.action_data, "emitter": self.uuid},
+            context_id=context_id,
+        )
+        logger.info("[ShaketAgentExecutor] Offer accepted in session %s", session_id)
+
+    def _on_cancel(self, session_id: str, parsed, context_id: str):
+        """Store a cancellation from the counterparty."""
+        self.state_manager.emit_event(
+            session_id=session_id,
+            event_type=EventType.SESSION_CANCELLED,
+            data={
+                "reason": (
+                    parsed.action_data.get("reason", "Cancelled by counterparty")
+                    if parsed.action_data
+                    else "Cancelled"
+                ),
+                "emitter": self.uuid,
+            },
+            context_id=context_id,
+        )
+        logger.info("[ShaketAgentExecutor] Session %s cancelled", session_id)
 
+    def _on_discovery(self, session_id: str, parsed, context_id: str):
+        """Store an incoming discovery message."""
+        self.state_manager.emit_event(
+            session_id=session_id,
+            event_type=EventType.DISCOVERY_RECEIVED,
+            data={
+                "discovery_data": parsed.discovery_data or {},
+                "emitter": self.uuid,
+            },
+            context_id=context_id,
+        )
+        logger.info(
+            "[ShaketAgentExecutor] Discovery message received in session %s", session_id
+        )
+
+    def _get_agent_for_session(self, state: SessionState):
+        """Get the appropriate agent for this session."""
         if state.session_type == SessionType.NEGOTIATION:
             return self.negotiation_agent
         elif state.session_type == SessionType.REVERSE_AUCTION:
@@ -376,7 +438,7 @@ class ShaketAgentExecutor(AgentExecutor):
 
     async def _execute_action(
         self,
-        session_id: str,
+        state: SessionState,
         action,
         context_id: str,
     ):
@@ -386,16 +448,14 @@ class ShaketAgentExecutor(AgentExecutor):
         This is where the framework does the work based on agent's decision.
 
         Args:
-            session_id: Session ID
+            state: Session state
             action: AgentAction from agent
             context_id: A2A context ID
 
         Returns:
             Response data (dict or string)
         """
-        state = self.state_manager.get_session(session_id)
-        if not state:
-            return "Error: Session not found"
+        session_id = state.session_id
 
         # Handle different action types
         if isinstance(action, SendOfferAction):
@@ -415,17 +475,11 @@ class ShaketAgentExecutor(AgentExecutor):
                 context_id=context_id,
             )
 
-            logger.info(f"[ShaketAgentExecutor] Sending offer: ${offer.price}")
+            logger.info("[ShaketAgentExecutor] Sending offer: $%s", offer.price)
 
-            # Create offer message using helper function (same as client)
-            message = create_offer_message(
-                offer=offer,
-                session_type=state.session_type,
-                context_id=context_id,
-            )
-            # Extract data from Message for Task artifact
-            # Part has a 'root' attribute which is the DataPart
-            return message.parts[0].root.data if message.parts else {}
+            # Offer message data for the Task artifact (same layout as the
+            # client's create_offer_message)
+            return build_offer_payload(offer, state.session_type)
 
         elif isinstance(action, AcceptOfferAction):
             # Accept offer
@@ -443,20 +497,13 @@ class ShaketAgentExecutor(AgentExecutor):
                 data={"reason": "Offer accepted", "emitter": self.uuid},
             )
 
-            logger.info(f"[ShaketAgentExecutor] Accepting offer: {action.offer_id}")
+            logger.info("[ShaketAgentExecutor] Accepting offer: %s", action.offer_id)
 
-            # Return A2A ACCEPT action message
-            message = create_action_message(
-                action=ActionType.ACCEPT,
-                action_data={
-                    "offer_id": action.offer_id,
-                    "message": action.message or "Deal!",
-                    "status": "completed",
-                },
-                context_id=context_id,
-            )
-            # Part has a 'root' attribute which is the DataPart
-            return message.parts[0].root.data if message.parts else {}
+            # Return A2A ACCEPT action message data
+            accept_data = self._ACCEPT_TEMPLATE.copy()
+            accept_data["offer_id"] = action.offer_id
+            accept_data["message"] = action.message or "Deal!"
+            return build_action_payload(ActionType.ACCEPT, accept_data)
 
         elif isinstance(action, SendDiscoveryAction):
             # Send discovery message
@@ -472,15 +519,9 @@ class ShaketAgentExecutor(AgentExecutor):
                 context_id=context_id,
             )
 
-            logger.info(f"[ShaketAgentExecutor] Sending discovery: {action.message}")
-
-            message = create_discovery_message(
-                discovery_data=discovery_data,
-                context_id=context_id,
-            )
+            logger.info("[ShaketAgentExecutor] Sending discovery: %s", action.message)
 
-            # Part has a 'root' attribute which is the DataPart
-            return message.parts[0].root.data if message.parts else {}
+            return build_discovery_payload(discovery_data)
 
         else:
             return f"Unknown action type: {type(action)}"
@@ -503,8 +544,9 @@ class ShaketAgentExecutor(AgentExecutor):
         )
 
         logger.info(
-            f"[ShaketAgentExecutor] INIT request for {session_type.value} "
-            f"(context: {context_id})"
+            "[ShaketAgentExecutor] INIT request for %s (context: %s)",
+            session_type.value,
+            context_id,
         )
 
         # Parse item from action_data (includes seller_endpoint if set)
@@ -513,7 +555,7 @@ class ShaketAgentExecutor(AgentExecutor):
 
         # Determine our role (opposite of theirs)
         their_role = action_data.get("role", "buyer")
-        our_role = AgentRole.SELLER if their_role == "buyer" else AgentRole.BUYER
+        our_role = _OPPOSITE_ROLE.get(their_role, AgentRole.BUYER)
 
         # Create items_per_seller mapping
         # Use seller_endpoint from item as key (this is our own endpoint)
@@ -542,39 +584,29 @@ class ShaketAgentExecutor(AgentExecutor):
         # Set this seller's item (for easy reference when creating offers)
         state.item = item
 
-        self._context_to_session[context_id] = session_id
-
         logger.info(
-            f"[ShaketAgentExecutor] Created session {session_id}, "
-            f"our_role={our_role.value}, their_role={their_role}"
+            "[ShaketAgentExecutor] Created session %s, our_role=%s, their_role=%s",
+            session_id,
+            our_role.value,
+            their_role,
         )
 
         # Return ACK action message with context_id
-        ack_data = {
-            "context_id": context_id,
-            "uuid": self.uuid,
-            "status": "initialized",
-            "session_type": session_type.value,
-            "item": item.name,
-            "role": their_role,
-            "our_role": our_role.value,
-            "message": f"Session initialized. Ready to {session_type.value}!",
-        }
+        ack_data = self._ACK_INIT_TEMPLATE.copy()
+        ack_data["context_id"] = context_id
+        ack_data["uuid"] = self.uuid
+        ack_data["session_type"] = session_type.value
+        ack_data["item"] = item.name
+        ack_data["role"] = their_role
+        ack_data["our_role"] = our_role.value
+        ack_data["message"] = f"Session initialized. Ready to {session_type.value}!"
 
         # Return the message data structure (will be wrapped in DataPart by executor)
-        message = create_action_message(
-            action=ActionType.ACK,
-            action_data=ack_data,
-            context_id=context_id,
-        )
-
-        # Extract the data part for returning
-        # Part has a 'root' attribute which is the DataPart
-        return message.parts[0].root.data if message.parts else ack_data
+        return build_action_payload(ActionType.ACK, ack_data)
 
     async def _handle_accept(
         self,
-        session_id: str,
+        state: SessionState,
         parsed,
         context_id: str,
     ):
@@ -585,63 +617,50 @@ class ShaketAgentExecutor(AgentExecutor):
         then returns an ACK without asking the agent.
 
         Args:
-            session_id: Session ID
+            state: Session state
             parsed: ParsedMessage containing ACCEPT action
             context_id: A2A context ID
 
         Returns:
             ACK response dict, or None if validation fails
         """
-        state = self.state_manager.get_session(session_id)
-        if not state:
-            logger.warning(
-                f"[ShaketAgentExecutor] Session {session_id} not found for ACCEPT"
-            )
-            return None
-
         # Extract offer_id from ACCEPT action
         offer_id = parsed.action_data.get("offer_id") if parsed.action_data else None
-        if not offer_id:
-            logger.warning("[ShaketAgentExecutor] ACCEPT action missing offer_id")
-            return None
+        last_sent = state.last_offer_sent
 
-        # Validate that this offer_id matches an offer we sent
-        if not state.last_offer_sent or state.last_offer_sent.offer_id != offer_id:
-            logger.warning(
-                f"[ShaketAgentExecutor] ACCEPT for unknown offer_id: {offer_id}. "
-                f"Our last offer: {state.last_offer_sent.offer_id if state.last_offer_sent else 'None'}"
+        # Valid acceptance of the offer we sent last - mark session as completed
+        if offer_id and last_sent is not None and last_sent.offer_id == offer_id:
+            final_price = last_sent.price
+            logger.info(
+                "[ShaketAgentExecutor] ✅ Offer %s ($%s) accepted (context: %s)",
+                offer_id,
+                final_price,
+                context_id,
             )
-            return None
 
-        # Valid acceptance - mark session as completed
-        logger.info(
-            f"[ShaketAgentExecutor] ✅ Offer {offer_id} (${state.last_offer_sent.price}) "
-            f"accepted (context: {context_id})"
-        )
-
-        self.state_manager.emit_event(
-            session_id=session_id,
-            event_type=EventType.SESSION_COMPLETED,
-            data={
-                "reason": "Offer accepted by counterparty",
-                "final_price": state.last_offer_sent.price,
-                "accepted_offer_id": offer_id,
-                "emitter": self.uuid,
-            },
-        )
-
-        # Create ACK response
-        ack_data = {
-            "status": "completed",
-            "message": "Offer accepted. Deal complete!",
-            "offer_id": offer_id,
-            "final_price": state.last_offer_sent.price,
-        }
+            self.state_manager.emit_event(
+                session_id=state.session_id,
+                event_type=EventType.SESSION_COMPLETED,
+                data={
+                    "reason": "Offer accepted by counterparty",
+                    "final_price": final_price,
+                    "accepted_offer_id": offer_id,
+                    "emitter": self.uuid,
+                },
+            )
 
-        message = create_action_message(
-            action=ActionType.ACK,
-            action_data=ack_data,
-            context_id=context_id,
-        )
+            # Create ACK response
+            ack_data = self._ACK_ACCEPT_TEMPLATE.copy()
+            ack_data["offer_id"] = offer_id
+            ack_data["final_price"] = final_price
+            return build_action_payload(ActionType.ACK, ack_data)
 
-        return message.parts[0].root.data if message.parts else ack_data
+        if not offer_id:
+            logger.warning("[ShaketAgentExecutor] ACCEPT action missing offer_id")
+        else:
+            logger.warning(
+                "[ShaketAgentExecutor] ACCEPT for unknown offer_id: %s. Our last offer: %s",
+                offer_id,
+                last_sent.offer_id if last_sent else "None",
+            )
+        return None
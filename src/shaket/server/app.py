@@ -0,0 +1,90 @@
+"""
+Starlette application used by ShaketServer.
+
+A thin A2AStarletteApplication subclass that serves the agent card from
+bytes rendered once at startup, instead of re-serializing the card on every
+discovery request, and encodes JSON-RPC responses with orjson when it is
+installed.
+
+Both overrides are private A2AStarletteApplication hooks, so a2a-sdk is
+pinned to <0.4 and tests/test_app.py checks the responses against the stock
+application.
+"""
+
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from a2a.extensions.common import HTTP_EXTENSION_HEADER
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.context import ServerCallContext
+from a2a.types import JSONRPCErrorResponse
+from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install shaket[speedups])
+    orjson = None
+
+
+if orjson is not None:
+
+    class _JSONResponse(JSONResponse):
+        """JSONResponse rendered with orjson (same compact UTF-8 output)."""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+    _JSONResponse = JSONResponse
+
+
+class ShaketStarletteApplication(A2AStarletteApplication):
+    """A2AStarletteApplication with a pre-rendered agent card and orjson responses."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize the application (same arguments as A2AStarletteApplication)."""
+        super().__init__(*args, **kwargs)
+
+        # The card is fixed for the server's lifetime; render it exactly as
+        # the base class would (same fields, same JSON encoding)
+        self._agent_card_body = JSONResponse(
+            self.agent_card.model_dump(exclude_none=True, by_alias=True)
+        ).body
+
+    async def _handle_get_agent_card(self, request: Request) -> Response:
+        """Serve the cached agent card, or defer to the base class.
+
+        The base class still handles cards with a card_modifier and the
+        deprecated well-known path (which logs a warning).
+        """
+        if self.card_modifier or request.url.path != AGENT_CARD_WELL_KNOWN_PATH:
+            return await super()._handle_get_agent_card(request)
+
+        return Response(content=self._agent_card_body, media_type="application/json")
+
+    def _create_response(self, context: ServerCallContext, handler_result) -> Response:
+        """Create the response for a handler result, as the base class does.
+
+        Mirrors A2AStarletteApplication._create_response branch for branch
+        (same headers, same model_dump arguments); only the JSON encoder of
+        non-streaming responses differs. Streaming responses are left to the
+        base class.
+        """
+        if isinstance(handler_result, AsyncGenerator):
+            return super()._create_response(context, handler_result)
+
+        headers = {}
+        if exts := context.activated_extensions:
+            headers[HTTP_EXTENSION_HEADER] = ", ".join(sorted(exts))
+        if isinstance(handler_result, JSONRPCErrorResponse):
+            return _JSONResponse(
+                handler_result.model_dump(mode="json", exclude_none=True),
+                headers=headers,
+            )
+
+        return _JSONResponse(
+            handler_result.root.model_dump(mode="json", exclude_none=True),
+            headers=headers,
+        )
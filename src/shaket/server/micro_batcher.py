@@ -0,0 +1,174 @@
+"""
+Micro-batching of inbound Shaket messages for ShaketAgentExecutor.
+
+Opt-in via ShaketServer(micro_batching=True). Requests arriving close
+together are collected into one batch (up to max_batch_size, or until the
+oldest has waited max_wait_ms) and dispatched in a single pass of the
+batcher loop, instead of each request scheduling its own work.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..shaket_layer import ParsedMessage
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_MAX_WAIT_MS = 10.0
+
+
+@dataclass(slots=True)
+class PendingRequest:
+    """A parsed inbound message waiting for its response."""
+
+    parsed: ParsedMessage
+    context_id: str
+    future: asyncio.Future
+
+
+class MicroBatcher:
+    """
+    Collects inbound messages into small batches before handling them.
+
+    Within a batch, messages are grouped by context_id (one context maps to
+    one session). Each group is handled serially, so a session's events are
+    applied in arrival order, while distinct sessions run concurrently. A
+    group also waits for the previous group of the same context, so ordering
+    holds across batches too.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[ParsedMessage, str], Awaitable[Any]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ):
+        """
+        Initialize micro-batcher.
+
+        Args:
+            handler: Coroutine function handling one message,
+                called as handler(parsed=..., context_id=...)
+            max_batch_size: Maximum messages per batch
+            max_wait_ms: Maximum time the oldest message waits for a batch to fill
+        """
+        self._handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+        # Last scheduled group per context, awaited by the next one
+        self._tails: Dict[str, asyncio.Task] = {}
+
+    async def submit(self, parsed: ParsedMessage, context_id: str) -> Any:
+        """
+        Queue a message and wait for the handler's response.
+
+        The batcher loop is started on first use, since ShaketServer is
+        constructed before uvicorn starts the event loop.
+
+        Args:
+            parsed: ParsedMessage from MessageParser
+            context_id: A2A context ID
+
+        Returns:
+            The handler's response for this message
+        """
+        if self._loop_task is None or self._loop_task.done():
+            self._queue = asyncio.Queue()
+            self._loop_task = asyncio.create_task(self._run_loop())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(PendingRequest(parsed, context_id, future))
+        return await future
+
+    async def close(self):
+        """Stop the batcher loop and fail any requests still queued."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+
+        while self._queue is not None and not self._queue.empty():
+            pending = self._queue.get_nowait()
+            if not pending.future.done():
+                pending.future.set_exception(RuntimeError("MicroBatcher closed"))
+
+    async def _run_loop(self):
+        """Collect batches from the queue and dispatch them."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            try:
+                while len(batch) < self.max_batch_size:
+                    # Take whatever is already queued before considering a wait
+                    if not queue.empty():
+                        batch.append(queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # close() while a batch was filling: its requests are no
+                # longer in the queue, so fail them here
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(RuntimeError("MicroBatcher closed"))
+                raise
+
+            logger.debug("[MicroBatcher] Dispatching batch of %d", len(batch))
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[PendingRequest]):
+        """Schedule one task per context in the batch."""
+        groups: Dict[str, List[PendingRequest]] = {}
+        for pending in batch:
+            groups.setdefault(pending.context_id, []).append(pending)
+
+        for context_id, items in groups.items():
+            task = asyncio.create_task(
+                self._run_group(self._tails.get(context_id), items)
+            )
+            self._tails[context_id] = task
+            task.add_done_callback(
+                lambda t, key=context_id: (
+                    self._tails.pop(key, None) if self._tails.get(key) is t else None
+                )
+            )
+
+    async def _run_group(
+        self, previous: Optional[asyncio.Task], items: List[PendingRequest]
+    ):
+        """Handle one context's messages in order, after its previous group."""
+        if previous is not None:
+            await asyncio.wait([previous])
+
+        for pending in items:
+            if pending.future.done():  # caller went away
+                continue
+            try:
+                response = await self._handler(
+                    parsed=pending.parsed, context_id=pending.context_id
+                )
+            except Exception as e:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+            else:
+                if not pending.future.done():
+                    pending.future.set_result(response)
@@ -6,15 +6,16 @@ Provides tools for LLM agents to respond to incoming negotiation and auction req
 
 import logging
 import uuid
-from typing import Optional, List, Dict
+from typing import Optional, List
 
 import uvicorn
-from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
 
 from .agent_card import generate_agent_card
+from .app import ShaketStarletteApplication
 from .agent_executor import ShaketAgentExecutor
+from .micro_batcher import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS
+from .task_store import BoundedTaskStore, DEFAULT_MAX_TASKS, DEFAULT_TASK_TTL_SECONDS
 from ..core.types import SessionType, AgentRole
 from ..agents import NegotiationAgent, ReverseAuctionAgent
 from ..state import StateManager
@@ -54,6 +55,11 @@ class ShaketServer:
         version: str = "1.0.0",
         streaming: bool = False,
         state_manager: Optional[StateManager] = None,
+        micro_batching: bool = False,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        max_stored_tasks: int = DEFAULT_MAX_TASKS,
+        task_ttl_seconds: Optional[float] = DEFAULT_TASK_TTL_SECONDS,
     ):
         """
         Initialize ShaketServer.
@@ -70,6 +76,13 @@ class ShaketServer:
             version: Agent version
             streaming: Whether to support streaming responses
             state_manager: Optional custom state manager
+            micro_batching: Collect concurrent inbound messages into small
+                batches before handling them (see MicroBatcher)
+            max_batch_size: Maximum messages per batch (micro_batching only)
+            max_wait_ms: Maximum wait for a batch to fill (micro_batching only)
+            max_stored_tasks: Number of A2A tasks kept before finished ones are evicted
+            task_ttl_seconds: Age after which a stored A2A task is evicted
+                (None to disable)
         """
         self.uuid = str(uuid.uuid4())
         self.name = name
@@ -90,18 +103,20 @@ class ShaketServer:
         self.state_manager = state_manager or StateManager()
 
         # A2A server components
-        self.task_store = InMemoryTaskStore()
-
-        # Map context_id -> session_id for session lookup
-        self._context_to_session: Dict[str, str] = {}
+        self.task_store = BoundedTaskStore(
+            max_entries=max_stored_tasks,
+            ttl_seconds=task_ttl_seconds,
+        )
 
         # Create agent executor with explicit dependencies
         self.executor = ShaketAgentExecutor(
             state_manager=self.state_manager,
-            context_to_session_map=self._context_to_session,
             negotiation_agent=negotiation_agent,
             reverse_auction_agent=reverse_auction_agent,
             uuid=self.uuid,
+            micro_batching=micro_batching,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
         )
 
         # Create request handler
@@ -122,7 +137,7 @@ class ShaketServer:
         )
 
         # Create A2A application
-        self.app = A2AStarletteApplication(
+        self.app = ShaketStarletteApplication(
             agent_card=self.agent_card,
             http_handler=self.request_handler,
         )
@@ -139,6 +154,10 @@ class ShaketServer:
 
         This blocks until the server is stopped (Ctrl+C).
 
+        uvicorn's default loop="auto" / http="auto" pick uvloop and httptools
+        when they are installed (the "speedups" extra), falling back to
+        asyncio and h11 otherwise.
+
         Args:
             **kwargs: Additional arguments to pass to uvicorn.run()
         """
@@ -166,3 +185,5 @@ class ShaketServer:
     async def shutdown(self):
         """Clean up resources."""
         logger.info(f"[ShaketServer] Shutting down server for '{self.name}'")
+        if self.executor.batcher:
+            await self.executor.batcher.close()
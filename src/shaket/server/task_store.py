@@ -0,0 +1,108 @@
+"""
+Bounded A2A task store for ShaketServer.
+
+InMemoryTaskStore keeps every task for the lifetime of the server. Shaket
+tasks are short-lived (one per request), so finished tasks only need to be
+kept long enough for clients to fetch them.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import Task, TaskState
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TASKS = 10_000
+DEFAULT_TASK_TTL_SECONDS = 3600.0
+
+# States after which a task is never updated again
+_TERMINAL_STATES = frozenset(
+    {TaskState.completed, TaskState.canceled, TaskState.failed, TaskState.rejected}
+)
+
+
+class BoundedTaskStore(InMemoryTaskStore):
+    """
+    InMemoryTaskStore with size- and age-based eviction.
+
+    Eviction runs on save():
+    - tasks not saved for ttl_seconds are dropped, whatever their state
+    - past max_entries, the least recently saved finished tasks are dropped
+      (tasks still in progress are never evicted for size)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_TASKS,
+        ttl_seconds: Optional[float] = DEFAULT_TASK_TTL_SECONDS,
+    ):
+        """
+        Initialize task store.
+
+        Args:
+            max_entries: Number of tasks above which finished tasks are evicted
+            ttl_seconds: Age (since last save) after which a task is evicted,
+                or None to keep tasks until evicted for size
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        # task_id -> time of last save, oldest first
+        self._saved_at: OrderedDict[str, float] = OrderedDict()
+
+    async def save(
+        self, task: Task, context: Optional[ServerCallContext] = None
+    ) -> None:
+        """Save or update a task, then evict expired and excess finished tasks."""
+        now = time.monotonic()
+        async with self.lock:
+            self.tasks[task.id] = task
+            self._saved_at[task.id] = now
+            self._saved_at.move_to_end(task.id)
+            self._evict(now)
+
+    async def delete(
+        self, task_id: str, context: Optional[ServerCallContext] = None
+    ) -> None:
+        """Delete a task by ID."""
+        await super().delete(task_id, context)
+        self._saved_at.pop(task_id, None)
+
+    def _evict(self, now: float):
+        """Drop expired tasks, then finished tasks beyond max_entries (lock held)."""
+        saved_at = self._saved_at
+        evicted = 0
+
+        if self.ttl_seconds is not None:
+            cutoff = now - self.ttl_seconds
+            while saved_at:
+                task_id, saved = next(iter(saved_at.items()))
+                if saved >= cutoff:
+                    break
+                saved_at.popitem(last=False)
+                self.tasks.pop(task_id, None)
+                evicted += 1
+
+        excess = len(self.tasks) - self.max_entries
+        if excess > 0:
+            victims = []
+            for task_id in saved_at:
+                task = self.tasks.get(task_id)
+                if task is None or task.status.state in _TERMINAL_STATES:
+                    victims.append(task_id)
+                    if len(victims) == excess:
+                        break
+            for task_id in victims:
+                del saved_at[task_id]
+                self.tasks.pop(task_id, None)
+            evicted += len(victims)
+
+        if evicted:
+            logger.debug("[BoundedTaskStore] Evicted %d tasks", evicted)
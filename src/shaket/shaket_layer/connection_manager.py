@@ -7,7 +7,9 @@ participants in auction, etc.).
 Based on the Google ADK RemoteAgentConnections pattern.
 """
 
+import importlib.util
 import logging
+import socket
 from typing import Dict, Optional
 
 import httpx
@@ -16,6 +18,45 @@ from a2a.types import AgentCard, SendMessageRequest, SendMessageResponse
 
 logger = logging.getLogger(__name__)
 
+# Pool sizing for the httpx clients Shaket creates (a ConnectionManager's own,
+# and the one ShaketClients share per loop). An auction fans out one request
+# per participant per round, so keep enough idle connections alive to reuse
+# them across rounds instead of reconnecting.
+DEFAULT_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=64, keepalive_expiry=30.0
+)
+
+# Action messages are small request/response pairs, so disable Nagle's
+# algorithm rather than let the kernel hold back partial segments
+DEFAULT_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+# Multiplex concurrent requests to the same host over one connection when h2
+# is installed (pip install shaket[http2]). httpx negotiates HTTP/2 via ALPN,
+# so plain-http and HTTP/1.1-only counterparties keep working unchanged.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_httpx_client(timeout: float = 30) -> httpx.AsyncClient:
+    """
+    Create an httpx client configured for Shaket traffic.
+
+    Uses DEFAULT_HTTP_LIMITS, TCP_NODELAY, and HTTP/2 when h2 is installed.
+
+    Args:
+        timeout: Request timeout in seconds
+
+    Returns:
+        New httpx.AsyncClient (the caller closes it)
+    """
+    # Limits go on the transport; the client ignores them once a custom
+    # transport is supplied
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=DEFAULT_HTTP_LIMITS,
+        socket_options=DEFAULT_SOCKET_OPTIONS,
+    )
+    return httpx.AsyncClient(timeout=timeout, transport=transport)
+
 
 class RemoteAgentConnection:
     """
@@ -110,9 +151,12 @@ class ConnectionManager:
         Initialize connection manager.
 
         Args:
-            httpx_client: Optional shared httpx client (created if None)
+            httpx_client: Optional shared httpx client (created if None).
+                A client passed in is owned by the caller and is not closed
+                by close().
         """
-        self._httpx_client = httpx_client or httpx.AsyncClient(timeout=30)
+        self._owns_client = httpx_client is None
+        self._httpx_client = httpx_client or create_httpx_client()
         self._connections: Dict[str, RemoteAgentConnection] = {}
         logger.debug("[ConnectionManager] Initialized")
 
@@ -146,20 +190,38 @@ class ConnectionManager:
         )
 
         if fetch_card and not agent_card:
-            try:
-                await connection.fetch_agent_card()
-                logger.debug(
-                    f"[ConnectionManager] Fetched card for {agent_url}: "
-                    f"{connection.card.name if connection.card else 'Unknown'}"
-                )
-            except Exception as e:
-                logger.warning(
-                    f"[ConnectionManager] Failed to fetch card from {agent_url}: {e}"
-                )
+            await self.fetch_card(connection)
 
         self._connections[agent_url] = connection
         return connection
 
+    async def fetch_card(
+        self, connection: RemoteAgentConnection
+    ) -> Optional[AgentCard]:
+        """
+        Fetch a connection's agent card, logging instead of raising on failure.
+
+        Lets callers start the fetch as a background task alongside the
+        first message instead of waiting for it up front.
+
+        Args:
+            connection: Connection whose card to fetch
+
+        Returns:
+            The agent card, or None if it could not be fetched
+        """
+        try:
+            await connection.fetch_agent_card()
+            logger.debug(
+                f"[ConnectionManager] Fetched card for {connection.agent_url}: "
+                f"{connection.card.name if connection.card else 'Unknown'}"
+            )
+        except Exception as e:
+            logger.warning(
+                f"[ConnectionManager] Failed to fetch card from {connection.agent_url}: {e}"
+            )
+        return connection.card
+
     def get_connection(self, agent_url: str) -> Optional[RemoteAgentConnection]:
         """
         Get existing connection to a remote agent.
@@ -183,6 +245,7 @@ class ConnectionManager:
 
     async def close(self):
         """Close all connections and cleanup."""
-        await self._httpx_client.aclose()
+        if self._owns_client:
+            await self._httpx_client.aclose()
         self._connections.clear()
         logger.debug("[ConnectionManager] Closed all connections")
@@ -4,19 +4,25 @@ Message Parser for Shaket Layer.
 Parses Shaket protocol messages from various A2A formats.
 """
 
+import json
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 
 from a2a.types import Message, SendMessageResponse, Task, DataPart, TextPart
 
-from ..protocol.messages import parse_message, MessageType
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install shaket[speedups])
+    orjson = None
+
+from ..protocol.messages import parse_message, MessageType, ActionType
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedMessage:
     """
     Parsed message with routing information.
@@ -26,6 +32,7 @@ class ParsedMessage:
     are parsed into this format.
 
     Agent identification is handled via context_id (A2A routing).
+    One is created per message, so the class uses __slots__.
     """
     message_id: str
     message_type: MessageType
@@ -94,10 +101,24 @@ class MessageParser:
         Returns:
             List of ParsedMessage objects found in response
         """
-        messages = []
+        return list(MessageParser.iter_response(response))
+
+    @staticmethod
+    def iter_response(response: SendMessageResponse) -> Iterator[ParsedMessage]:
+        """
+        Lazily parse Shaket messages from A2A SendMessageResponse.
+
+        Same as parse_response(), but parts are only parsed as the caller
+        consumes them, so a caller looking for one message can stop early.
 
+        Args:
+            response: A2A SendMessageResponse from send_message()
+
+        Yields:
+            ParsedMessage objects in response order
+        """
         if not response or not response.root:
-            return messages
+            return
 
         result = response.root.result
 
@@ -110,15 +131,39 @@ class MessageParser:
                         for part in artifact.parts:
                             parsed = MessageParser._parse_part(part)
                             if parsed:
-                                messages.append(parsed)
+                                yield parsed
 
         elif isinstance(result, Message):
             # Less common: Direct message reply
             parsed = MessageParser.parse_a2a_message(result)
             if parsed:
-                messages.append(parsed)
+                yield parsed
 
-        return messages
+    @staticmethod
+    def find_ack(response: SendMessageResponse) -> Optional[ParsedMessage]:
+        """
+        Find the first ACK carrying a context_id in an A2A response.
+
+        Stops parsing at the first match; for INIT responses the ACK is
+        normally the first part.
+
+        Args:
+            response: A2A SendMessageResponse from send_message()
+
+        Returns:
+            The ACK ParsedMessage, or None if the response has none
+        """
+        return next(
+            (
+                parsed
+                for parsed in MessageParser.iter_response(response)
+                if parsed.message_type == MessageType.ACTION
+                and parsed.action == ActionType.ACK.value
+                and parsed.action_data
+                and parsed.action_data.get("context_id")
+            ),
+            None,
+        )
 
     @staticmethod
     def parse_message_data(data: Dict[str, Any]) -> Optional[ParsedMessage]:
@@ -210,10 +255,9 @@ class MessageParser:
         # TextPart might contain JSON-serialized message
         if isinstance(part, TextPart) and hasattr(part, 'text'):
             try:
-                import json
-                data = json.loads(part.text)
+                data = orjson.loads(part.text) if orjson else json.loads(part.text)
                 return MessageParser.parse_message_data(data)
-            except (json.JSONDecodeError, ValueError, TypeError):
+            except (ValueError, TypeError):  # includes JSON decode errors
                 # Not valid JSON or not a dict
                 pass
 
@@ -139,6 +139,7 @@ class SessionMessenger:
         self,
         discovery_data: Dict[str, Any],
         context_id: Optional[str] = None,
+        timestamp: Optional[str] = None,
     ) -> SendMessageResponse:
         """
         Send a discovery/chat message in this session.
@@ -147,6 +148,7 @@ class SessionMessenger:
             discovery_data: Discovery data (questions, etc.)
             context_id: Optional context ID to send to (for multi-context scenarios like auctions).
                        If None, uses session's primary context.
+            timestamp: Optional message timestamp (e.g. shared by a broadcast)
 
         Returns:
             A2A SendMessageResponse from server
@@ -162,6 +164,7 @@ class SessionMessenger:
         discovery_msg = create_discovery_message(
             discovery_data=discovery_data,
             context_id=target_context_id,
+            timestamp=timestamp,
         )
 
         response = await self._send_message(discovery_msg, target_context_id)
@@ -212,10 +215,11 @@ class SessionMessenger:
                 f"No connection found for endpoint {target_endpoint}"
             )
 
-        # Create A2A message request
+        # Create A2A message request (message comes from the protocol
+        # builders and is already a validated Message)
         message_request = SendMessageRequest(
             id=str(uuid.uuid4()),
-            params=MessageSendParams.model_validate({"message": message}),
+            params=MessageSendParams.model_construct(message=message),
         )
 
         # Send and return response
@@ -8,7 +8,13 @@ Provides:
 """
 
 from .events import Event, EventType
-from .session_state import SessionState, NegotiationState, ReverseAuctionState
+from .session_state import (
+    SessionState,
+    NegotiationState,
+    ReverseAuctionState,
+    MarketView,
+    RoundStats,
+)
 from .state_manager import StateManager
 
 __all__ = [
@@ -19,6 +25,8 @@ __all__ = [
     "SessionState",
     "NegotiationState",
     "ReverseAuctionState",
+    "MarketView",
+    "RoundStats",
     # Manager
     "StateManager",
 ]
@@ -6,9 +6,10 @@ Different session types (negotiation, auction, etc.) have their own state classe
 """
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Any
 
 from ..core.types import SessionType, AgentRole, Item, Offer
 
@@ -441,6 +442,66 @@ class NegotiationState(SessionState):
         }
 
 
+class RoundStats(NamedTuple):
+    """Running price aggregates for one reverse auction round."""
+
+    min: float
+    max: float
+    sum: float
+    n: int
+
+    @property
+    def avg(self) -> float:
+        """Average offer price in the round."""
+        return self.sum / self.n
+
+    def add(self, price: float) -> "RoundStats":
+        """Return the stats with one more offer folded in."""
+        return RoundStats(
+            min(self.min, price), max(self.max, price), self.sum + price, self.n + 1
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class MarketView:
+    """
+    Typed view of the latest round announcement in a reverse auction.
+
+    Built once when a discovery message arrives, so agents read plain
+    attributes instead of walking the raw discovery payload every decision.
+    Market figures are None when the announcement did not include them
+    (e.g. round 1, before any offers exist).
+    """
+
+    round_number: int
+    total_rounds: int
+    message: str = ""
+    min_offer: Optional[float] = None
+    max_offer: Optional[float] = None
+    avg_offer: Optional[float] = None
+
+    @classmethod
+    def from_discovery(
+        cls, data: Dict[str, Any], round_number: int, total_rounds: int
+    ) -> "MarketView":
+        """
+        Build a view from a discovery payload.
+
+        Args:
+            data: discovery_data dict from the DISCOVERY_RECEIVED event
+            round_number: Fallback round if the payload carries none
+            total_rounds: Fallback round count if the payload carries none
+        """
+        return cls(
+            round_number=data.get("round_number", round_number),
+            total_rounds=data.get("total_rounds", total_rounds),
+            message=data.get("message", ""),
+            min_offer=data.get("prev_round_min"),
+            max_offer=data.get("prev_round_max"),
+            avg_offer=data.get("prev_round_avg"),
+        )
+
+
 @dataclass
 class ReverseAuctionState(SessionState):
     """
@@ -485,9 +546,11 @@ class ReverseAuctionState(SessionState):
     # OFFER TRACKING
     # ========================================================================
 
-    offers_by_round: Dict[int, List[Offer]] = field(default_factory=dict)
+    offers_by_round: Dict[int, List[Offer]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
     """
-    Offers organized by round.
+    Offers organized by round, in arrival order (a defaultdict(list)).
     Format: {round_number: [offers]}
 
     Example:
@@ -501,6 +564,12 @@ class ReverseAuctionState(SessionState):
     all_offers: List[Offer] = field(default_factory=list)
     """All offers received across all rounds"""
 
+    round_stats: Dict[int, RoundStats] = field(default_factory=dict)
+    """
+    Price aggregates per round (min, max, sum, count), maintained as offers
+    arrive so round summaries don't rescan offers_by_round.
+    """
+
     # ========================================================================
     # DISCOVERY TRACKING
     # ========================================================================
@@ -511,6 +580,9 @@ class ReverseAuctionState(SessionState):
     Each entry: {"sender": str, "data": dict, "timestamp": datetime}
     """
 
+    market_view: Optional[MarketView] = None
+    """Structured view of the most recent discovery message (round announcement)"""
+
     # ========================================================================
     # METHODS
     # ========================================================================
@@ -536,8 +608,7 @@ class ReverseAuctionState(SessionState):
         elif event.event_type == EventType.BIDDING_ROUND_STARTED:
             self.current_round = event.data.get("round_number", self.current_round + 1)
             self.round_start_time = event.timestamp
-            if self.current_round not in self.offers_by_round:
-                self.offers_by_round[self.current_round] = []
+            self.offers_by_round.setdefault(self.current_round, [])
 
         elif event.event_type == EventType.BIDDING_ROUND_ENDED:
             # Round ended marker
@@ -561,6 +632,9 @@ class ReverseAuctionState(SessionState):
                 "context_id": event.context_id,
             }
             self.discovery_messages.append(discovery_entry)
+            self.market_view = MarketView.from_discovery(
+                discovery_entry["data"], self.current_round, self.total_rounds
+            )
 
     def add_offer(self, offer: Offer, round_number: Optional[int] = None):
         """
@@ -577,10 +651,14 @@ class ReverseAuctionState(SessionState):
         self.all_offers.append(offer)
 
         # Add to round-specific tracking
-        if round_number not in self.offers_by_round:
-            self.offers_by_round[round_number] = []
         self.offers_by_round[round_number].append(offer)
 
+        stats = self.round_stats.get(round_number)
+        price = offer.price
+        self.round_stats[round_number] = (
+            stats.add(price) if stats else RoundStats(price, price, price, 1)
+        )
+
         self.updated_at = datetime.now()
 
     def get_all_offers(self) -> List[Offer]:
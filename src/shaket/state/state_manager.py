@@ -4,8 +4,9 @@ Hybrid state manager with event logging.
 Combines mutable state (working memory) with immutable event log (audit trail).
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Type, Any
+from typing import Dict, List, Optional, Type, Any, Iterable, Tuple
 from datetime import datetime, timedelta
 
 from .events import Event, EventType
@@ -43,6 +44,9 @@ class StateManager:
         # One context -> one session, but one session can have many contexts
         self._context_to_session: Dict[str, str] = {}
 
+        # Live event subscribers per session (see subscribe())
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+
         # State class registry
         self._state_classes: Dict[SessionType, Type[SessionState]] = {
             SessionType.NEGOTIATION: NegotiationState,
@@ -168,6 +172,15 @@ class StateManager:
         """
         self._context_to_session[context_id] = session_id
 
+    def add_context_mappings(self, mappings: Iterable[Tuple[str, str]]):
+        """
+        Map several contexts to sessions at once.
+
+        Args:
+            mappings: (context_id, session_id) pairs
+        """
+        self._context_to_session.update(mappings)
+
     def list_sessions(
         self,
         status: Optional[str] = None,
@@ -209,9 +222,10 @@ class StateManager:
         for ctx in contexts:
             self._context_to_session.pop(ctx, None)
 
-        # Delete state and events
+        # Delete state, events and subscriptions
         self._states.pop(session_id, None)
         self._events.pop(session_id, None)
+        self._subscribers.pop(session_id, None)
 
         logger.info(f"[StateManager] Deleted session {session_id}")
 
@@ -277,8 +291,83 @@ class StateManager:
         if state:
             state.apply_event(event)
 
+        for queue in self._subscribers.get(session_id, ()):
+            queue.put_nowait(event)
+
         return event
 
+    def emit_events(
+        self,
+        session_id: str,
+        events: Iterable[Tuple[EventType, Optional[Dict[str, Any]], Optional[str]]],
+    ) -> List[Event]:
+        """
+        Emit several events for one session in order.
+
+        Equivalent to calling emit_event() for each entry, but the event log
+        and state are looked up once for the whole batch.
+
+        Args:
+            session_id: Session ID
+            events: (event_type, data, context_id) tuples
+
+        Returns:
+            Created events
+        """
+        created = [
+            Event.create(
+                session_id=session_id,
+                event_type=event_type,
+                data=data or {},
+                context_id=context_id,
+            )
+            for event_type, data, context_id in events
+        ]
+
+        self._events.setdefault(session_id, []).extend(created)
+
+        state = self._states.get(session_id)
+        if state:
+            for event in created:
+                state.apply_event(event)
+
+        for queue in self._subscribers.get(session_id, ()):
+            for event in created:
+                queue.put_nowait(event)
+
+        return created
+
+    def subscribe(self, session_id: str) -> asyncio.Queue:
+        """
+        Receive a session's events as they are emitted.
+
+        Every event emitted for the session after this call is also put on
+        the returned queue (after it has been applied to state).
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Unbounded queue of Event objects; pass it to unsubscribe() when done
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(session_id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, session_id: str, queue: asyncio.Queue):
+        """
+        Stop delivering a session's events to a queue from subscribe().
+
+        Args:
+            session_id: Session ID
+            queue: Queue returned by subscribe()
+        """
+        queues = self._subscribers.get(session_id)
+        if queues and queue in queues:
+            queues.remove(queue)
+            if not queues:
+                del self._subscribers[session_id]
+
     def get_events(
         self,
         session_id: str,
@@ -0,0 +1,138 @@
+"""
+Tests for ShaketStarletteApplication.
+
+The application overrides private A2AStarletteApplication methods, so these
+run against the a2a-sdk range pinned in pyproject.toml and compare its
+responses with the stock application's.
+"""
+
+import pytest
+from a2a.extensions.common import HTTP_EXTENSION_HEADER
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.context import ServerCallContext
+from a2a.types import (
+    GetTaskResponse,
+    GetTaskSuccessResponse,
+    JSONRPCErrorResponse,
+    Task,
+    TaskNotFoundError,
+    TaskState,
+    TaskStatus,
+)
+from a2a.utils.constants import (
+    AGENT_CARD_WELL_KNOWN_PATH,
+    PREV_AGENT_CARD_WELL_KNOWN_PATH,
+)
+from sse_starlette.sse import EventSourceResponse
+from starlette.testclient import TestClient
+
+from shaket.core.types import AgentRole, SessionType
+from shaket.server import ShaketServer
+
+
+@pytest.fixture
+def server():
+    return ShaketServer(
+        name="Test Seller",
+        description="Seller used by the app tests",
+        supported_session_types=[SessionType.NEGOTIATION],
+        supported_roles=[AgentRole.SELLER],
+    )
+
+
+def _stock_client(server, **kwargs):
+    app = A2AStarletteApplication(
+        agent_card=server.agent_card,
+        http_handler=server.request_handler,
+        **kwargs,
+    )
+    return TestClient(app.build())
+
+
+@pytest.mark.parametrize(
+    "path", [AGENT_CARD_WELL_KNOWN_PATH, PREV_AGENT_CARD_WELL_KNOWN_PATH]
+)
+def test_agent_card_matches_stock_app(server, path):
+    response = TestClient(server.app.build()).get(path)
+    expected = _stock_client(server).get(path)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == expected.headers["content-type"]
+    assert response.content == expected.content
+    assert response.json()["name"] == "Test Seller"
+
+
+def test_agent_card_modifier_is_applied(server):
+    def modifier(card):
+        return card.model_copy(update={"description": "modified"})
+
+    app = type(server.app)(
+        agent_card=server.agent_card,
+        http_handler=server.request_handler,
+        card_modifier=modifier,
+    )
+    response = TestClient(app.build()).get(AGENT_CARD_WELL_KNOWN_PATH)
+
+    assert response.status_code == 200
+    assert response.json()["description"] == "modified"
+
+
+def _stock_app(server):
+    return A2AStarletteApplication(
+        agent_card=server.agent_card, http_handler=server.request_handler
+    )
+
+
+_TASK = Task(
+    id="task-1",
+    context_id="ctx-1",
+    status=TaskStatus(state=TaskState.completed),
+    metadata={"note": "prix réduit €"},
+)
+
+
+@pytest.mark.parametrize(
+    "handler_result",
+    [
+        GetTaskResponse(root=GetTaskSuccessResponse(id=1, result=_TASK)),
+        GetTaskResponse(root=JSONRPCErrorResponse(id=2, error=TaskNotFoundError())),
+        JSONRPCErrorResponse(id=None, error=TaskNotFoundError()),
+    ],
+    ids=["success", "wrapped-error", "error"],
+)
+@pytest.mark.parametrize("extensions", [set(), {"ext-b", "ext-a"}])
+def test_create_response_matches_stock_app(server, handler_result, extensions):
+    context = ServerCallContext(activated_extensions=extensions)
+
+    response = server.app._create_response(context, handler_result)
+    expected = _stock_app(server)._create_response(context, handler_result)
+
+    assert response.status_code == expected.status_code
+    assert response.body == expected.body
+    assert dict(response.headers) == dict(expected.headers)
+    if extensions:
+        assert response.headers[HTTP_EXTENSION_HEADER] == "ext-a, ext-b"
+
+
+def test_create_response_leaves_streaming_to_base_class(server):
+    async def stream():
+        yield  # never consumed
+
+    response = server.app._create_response(ServerCallContext(), stream())
+
+    assert isinstance(response, EventSourceResponse)
+
+
+def test_jsonrpc_error_through_app(server):
+    request = {
+        "jsonrpc": "2.0",
+        "id": 7,
+        "method": "tasks/get",
+        "params": {"id": "missing"},
+    }
+    response = TestClient(server.app.build()).post("/", json=request)
+    expected = _stock_client(server).post("/", json=request)
+
+    assert response.status_code == expected.status_code == 200
+    assert response.content == expected.content
+    assert response.json()["error"]["code"] == TaskNotFoundError().code
@@ -0,0 +1,38 @@
+"""
+Tests for the client's session ID generation.
+"""
+
+import os
+
+import pytest
+
+from shaket.client.client import _short_id
+
+
+def test_short_id_format():
+    session_id = _short_id("neg")
+
+    prefix, suffix = session_id.split("-")
+    assert prefix == "neg"
+    assert len(suffix) == 12
+    int(suffix, 16)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_children_do_not_repeat_ids():
+    def child_id() -> str:
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # child
+            os.close(read_fd)
+            os.write(write_fd, _short_id("neg").encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            value = pipe.read()
+        os.waitpid(pid, 0)
+        return value
+
+    ids = {child_id() for _ in range(3)}
+
+    assert len(ids) == 3
@@ -0,0 +1,159 @@
+"""
+Tests for MicroBatcher.
+
+Handlers here take plain strings in place of ParsedMessage; the batcher
+never looks inside the messages it carries.
+"""
+
+import asyncio
+import time
+
+from shaket.server.micro_batcher import MicroBatcher
+
+
+class RecordingHandler:
+    """Handler recording (context_id, message) in call order."""
+
+    def __init__(self, delays=None):
+        self.calls = []
+        self.delays = delays or {}
+
+    async def __call__(self, parsed, context_id):
+        await asyncio.sleep(self.delays.get(parsed, 0))
+        self.calls.append((context_id, parsed))
+        return f"done:{parsed}"
+
+
+def test_batch_dispatches_once_full():
+    async def main():
+        handler = RecordingHandler()
+        batcher = MicroBatcher(handler, max_batch_size=3, max_wait_ms=10_000)
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(batcher.submit(f"m{i}", f"ctx-{i}") for i in range(3))
+        )
+        elapsed = time.monotonic() - started
+        await batcher.close()
+        return results, elapsed
+
+    results, elapsed = asyncio.run(main())
+
+    assert results == ["done:m0", "done:m1", "done:m2"]
+    # A full batch does not wait for max_wait_ms
+    assert elapsed < 1.0
+
+
+def test_partial_batch_dispatches_after_max_wait():
+    async def main():
+        batcher = MicroBatcher(RecordingHandler(), max_batch_size=100, max_wait_ms=50)
+        started = time.monotonic()
+        result = await batcher.submit("m0", "ctx")
+        elapsed = time.monotonic() - started
+        await batcher.close()
+        return result, elapsed
+
+    result, elapsed = asyncio.run(main())
+
+    assert result == "done:m0"
+    assert 0.04 <= elapsed < 1.0
+
+
+def test_messages_of_one_context_are_handled_in_order():
+    async def main():
+        # Earlier messages are slower, so any reordering would show up
+        handler = RecordingHandler(delays={"a0": 0.03, "a1": 0.02, "a2": 0.01})
+        batcher = MicroBatcher(handler, max_batch_size=2, max_wait_ms=1)
+        await asyncio.gather(
+            batcher.submit("a0", "ctx-a"),
+            batcher.submit("b0", "ctx-b"),
+            batcher.submit("a1", "ctx-a"),
+            batcher.submit("a2", "ctx-a"),
+        )
+        await batcher.close()
+        return handler.calls
+
+    calls = asyncio.run(main())
+
+    assert [m for ctx, m in calls if ctx == "ctx-a"] == ["a0", "a1", "a2"]
+    # The other context is not held up behind the slow one
+    assert calls.index(("ctx-b", "b0")) < calls.index(("ctx-a", "a0"))
+
+
+def test_handler_errors_reach_only_their_caller():
+    async def handler(parsed, context_id):
+        if parsed == "bad":
+            raise ValueError("bad message")
+        return parsed
+
+    async def main():
+        batcher = MicroBatcher(handler, max_batch_size=3, max_wait_ms=10)
+        results = await asyncio.gather(
+            batcher.submit("ok1", "ctx"),
+            batcher.submit("bad", "ctx"),
+            batcher.submit("ok2", "ctx"),
+            return_exceptions=True,
+        )
+        await batcher.close()
+        return results
+
+    ok1, bad, ok2 = asyncio.run(main())
+
+    assert (ok1, ok2) == ("ok1", "ok2")
+    assert isinstance(bad, ValueError)
+
+
+def test_close_fails_requests_still_waiting_for_a_batch():
+    async def main():
+        batcher = MicroBatcher(
+            RecordingHandler(), max_batch_size=100, max_wait_ms=10_000
+        )
+        waiters = [
+            asyncio.create_task(batcher.submit(f"m{i}", "ctx")) for i in range(2)
+        ]
+        await asyncio.sleep(0.01)  # let the loop pick them up
+        await batcher.close()
+        return await asyncio.wait_for(
+            asyncio.gather(*waiters, return_exceptions=True), timeout=1
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_server_shutdown_closes_batcher():
+    from shaket.core.types import AgentRole, SessionType
+    from shaket.server import ShaketServer
+
+    server = ShaketServer(
+        name="Batching Seller",
+        description="Seller with micro-batching",
+        supported_session_types=[SessionType.NEGOTIATION],
+        supported_roles=[AgentRole.SELLER],
+        micro_batching=True,
+    )
+    batcher = server.executor.batcher
+
+    async def main():
+        batcher._handler = RecordingHandler()
+        await batcher.submit("m0", "ctx")
+        loop_task = batcher._loop_task
+        await server.shutdown()
+        return loop_task
+
+    loop_task = asyncio.run(main())
+
+    assert loop_task.cancelled()
+    assert batcher._loop_task is None
+
+
+def test_batcher_restarts_after_close():
+    async def main():
+        batcher = MicroBatcher(RecordingHandler(), max_wait_ms=1)
+        first = await batcher.submit("m0", "ctx")
+        await batcher.close()
+        second = await batcher.submit("m1", "ctx")
+        await batcher.close()
+        return first, second
+
+    assert asyncio.run(main()) == ("done:m0", "done:m1")
@@ -0,0 +1,101 @@
+"""
+Tests for ReverseAuctionCoordinator round handling.
+"""
+
+import asyncio
+import time
+
+from a2a.types import (
+    Artifact,
+    DataPart,
+    Part,
+    SendMessageResponse,
+    SendMessageSuccessResponse,
+    Task,
+    TaskState,
+    TaskStatus,
+)
+
+from shaket.coordinators.reverse_auction import ReverseAuctionCoordinator
+from shaket.core.types import AgentRole, Offer, SessionType
+from shaket.protocol.messages import build_offer_payload
+from shaket.state import StateManager
+from shaket.state.events import EventType
+
+
+ROUND_DURATION = 5.0
+
+
+class FakeConnection:
+    """Seller connection that answers every discovery with one offer."""
+
+    def __init__(self, price: float):
+        self.price = price
+
+    async def send_message(self, request):
+        offer = Offer(offer_id=f"offer-{self.price}", price=self.price, item_id="pb-1")
+        payload = build_offer_payload(offer, SessionType.REVERSE_AUCTION)
+        task = Task(
+            id="task",
+            context_id="ctx",
+            status=TaskStatus(state=TaskState.completed),
+            # Offers come back in artifacts, without a context_id of their own
+            artifacts=[
+                Artifact(artifact_id="offer", parts=[Part(root=DataPart(data=payload))])
+            ],
+        )
+        return SendMessageResponse(root=SendMessageSuccessResponse(id=1, result=task))
+
+
+class FakeConnectionManager:
+    def __init__(self, connections):
+        self.connections = connections
+
+    def get_connection(self, endpoint):
+        return self.connections.get(endpoint)
+
+
+def _run_auction(prices, rounds=2):
+    state_manager = StateManager()
+    endpoints = [f"http://seller-{i}" for i in range(len(prices))]
+    state = state_manager.create_session(
+        session_id="ra-test",
+        context_id=None,
+        session_type=SessionType.REVERSE_AUCTION,
+        role=AgentRole.BUYER,
+        total_rounds=rounds,
+        round_duration=ROUND_DURATION,
+        expected_participants=len(prices),
+    )
+    for i, endpoint in enumerate(endpoints):
+        state.add_counterparty(endpoint=endpoint, context_id=f"ctx-{i}")
+
+    coordinator = ReverseAuctionCoordinator(
+        connection_manager=FakeConnectionManager(
+            {e: FakeConnection(p) for e, p in zip(endpoints, prices)}
+        ),
+        state_manager=state_manager,
+    )
+    started = time.monotonic()
+    result = asyncio.run(coordinator.start("ra-test"))
+    return state_manager, state, result, time.monotonic() - started
+
+
+def test_rounds_close_once_every_seller_has_offered():
+    _, state, result, elapsed = _run_auction([90.0, 85.0, 80.0], rounds=2)
+
+    assert result.status == "completed"
+    assert [len(state.offers_by_round[r]) for r in (1, 2)] == [3, 3]
+    # Both rounds closed early instead of waiting out round_duration
+    assert elapsed < ROUND_DURATION / 2
+
+
+def test_offer_events_are_attributed_to_the_seller_context():
+    state_manager, state, _, _ = _run_auction([90.0, 85.0], rounds=1)
+
+    offer_events = [
+        event
+        for event in state_manager.get_events(state.session_id)
+        if event.event_type == EventType.OFFER_RECEIVED
+    ]
+    assert sorted(event.context_id for event in offer_events) == ["ctx-0", "ctx-1"]
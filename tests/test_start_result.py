@@ -0,0 +1,74 @@
+"""
+Tests for StartResult, including the dict-style access kept for callers
+written against the dicts start_*() used to return.
+"""
+
+import pytest
+
+from shaket.client import StartResult
+
+
+def _negotiation_result():
+    return StartResult(
+        success=True,
+        session_id="neg-1",
+        context_id="ctx-1",
+        status="completed",
+        message="Deal reached",
+    )
+
+
+def test_attribute_access():
+    result = _negotiation_result()
+
+    assert result.success is True
+    assert result.session_id == "neg-1"
+    assert result.participants is None
+    assert result.error is None
+
+
+def test_dict_style_access():
+    result = _negotiation_result()
+
+    assert result["success"] is True
+    assert result["session_id"] == "neg-1"
+    # Unset fields read as missing through get(), as absent dict keys did
+    assert result.get("status") == "completed"
+    assert result.get("participants") is None
+    assert result.get("participants", 0) == 0
+    assert result.get("not_a_field", "fallback") == "fallback"
+
+
+def test_unknown_key_raises_key_error():
+    with pytest.raises(KeyError):
+        _negotiation_result()["not_a_field"]
+
+
+def test_contains_only_set_fields():
+    result = _negotiation_result()
+
+    assert "session_id" in result
+    assert "participants" not in result
+    assert "not_a_field" not in result
+
+
+def test_to_dict_omits_unset_fields():
+    failed = StartResult(success=False, error="connection refused")
+
+    assert failed.to_dict() == {"success": False, "error": "connection refused"}
+    assert _negotiation_result().to_dict() == {
+        "success": True,
+        "session_id": "neg-1",
+        "context_id": "ctx-1",
+        "status": "completed",
+        "message": "Deal reached",
+    }
+
+
+def test_false_values_are_kept():
+    result = StartResult(success=False, participants=0)
+
+    assert result["success"] is False
+    assert result.get("success", True) is False
+    assert result.get("participants", 5) == 0
+    assert "participants" in result
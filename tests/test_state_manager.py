@@ -0,0 +1,163 @@
+"""
+Tests for StateManager event subscriptions and batched emission.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from shaket.client import ShaketClient
+from shaket.core.types import AgentRole, Offer, SessionType
+from shaket.state import EventType, StateManager
+
+
+def _negotiation(manager: StateManager, session_id: str = "neg-1"):
+    return manager.create_session(
+        session_id=session_id,
+        context_id=f"ctx-{session_id}",
+        session_type=SessionType.NEGOTIATION,
+        role=AgentRole.BUYER,
+    )
+
+
+def _offer_event(price: float):
+    offer = Offer(offer_id=f"offer-{price}", price=price, item_id="pb-1")
+    return (EventType.OFFER_SENT, {"offer": offer.to_dict()}, "ctx-neg-1")
+
+
+def _drain(queue: asyncio.Queue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+def test_subscribers_get_events_after_state_is_applied():
+    async def main():
+        manager = StateManager()
+        state = _negotiation(manager)
+        queue = manager.subscribe("neg-1")
+
+        # Record what the state looked like when each event was delivered
+        seen_rounds = []
+        put_nowait = queue.put_nowait
+
+        def recording_put(event):
+            seen_rounds.append(state.current_round)
+            put_nowait(event)
+
+        queue.put_nowait = recording_put
+
+        manager.emit_event(
+            "neg-1", EventType.NEGOTIATION_ROUND_STARTED, {"round_number": 3}
+        )
+        return seen_rounds, _drain(queue)
+
+    seen_rounds, events = asyncio.run(main())
+
+    assert seen_rounds == [3]
+    assert [e.event_type for e in events] == [EventType.NEGOTIATION_ROUND_STARTED]
+
+
+def test_only_events_after_subscribe_are_delivered():
+    async def main():
+        manager = StateManager()
+        _negotiation(manager)  # SESSION_CREATED is emitted before subscribing
+        _negotiation(manager, "neg-2")
+        queue = manager.subscribe("neg-1")
+        manager.emit_event("neg-2", EventType.NEGOTIATION_ROUND_STARTED)
+        manager.emit_event("neg-1", EventType.NEGOTIATION_ROUND_STARTED)
+        return _drain(queue)
+
+    events = asyncio.run(main())
+
+    assert [(e.session_id, e.event_type) for e in events] == [
+        ("neg-1", EventType.NEGOTIATION_ROUND_STARTED)
+    ]
+
+
+def test_unsubscribe_stops_delivery():
+    async def main():
+        manager = StateManager()
+        _negotiation(manager)
+        queue = manager.subscribe("neg-1")
+        other = manager.subscribe("neg-1")
+        manager.unsubscribe("neg-1", queue)
+        manager.emit_event("neg-1", EventType.NEGOTIATION_ROUND_STARTED)
+        # Unsubscribing twice is harmless
+        manager.unsubscribe("neg-1", queue)
+        return _drain(queue), _drain(other)
+
+    events, other_events = asyncio.run(main())
+
+    assert events == []
+    assert len(other_events) == 1
+
+
+def test_delete_session_stops_delivery():
+    async def main():
+        manager = StateManager()
+        _negotiation(manager)
+        queue = manager.subscribe("neg-1")
+        manager.delete_session("neg-1")
+        manager.emit_event("neg-1", EventType.NEGOTIATION_ROUND_STARTED)
+        return _drain(queue)
+
+    assert asyncio.run(main()) == []
+
+
+def test_emit_events_matches_repeated_emit_event():
+    entries = [_offer_event(90.0), _offer_event(85.0), _offer_event(80.0)]
+
+    async def run(batched: bool):
+        manager = StateManager()
+        state = _negotiation(manager)
+        queue = manager.subscribe("neg-1")
+        if batched:
+            returned = manager.emit_events("neg-1", entries)
+        else:
+            returned = [
+                manager.emit_event("neg-1", event_type, data, context_id)
+                for event_type, data, context_id in entries
+            ]
+        return manager, state, returned, _drain(queue)
+
+    def summary(events):
+        return [(e.event_type, e.data, e.context_id) for e in events]
+
+    one_by_one = asyncio.run(run(batched=False))
+    batched = asyncio.run(run(batched=True))
+
+    for manager, state, returned, delivered in (one_by_one, batched):
+        assert summary(returned) == entries
+        assert summary(delivered) == summary(returned)
+        assert summary(manager.get_events("neg-1"))[1:] == summary(returned)
+        assert list(state.offers_sent) == ["offer-90.0", "offer-85.0", "offer-80.0"]
+        assert state.last_offer_sent.price == 80.0
+
+
+def test_progress_pump_delivers_every_event_before_returning():
+    async def main():
+        manager = StateManager()
+        _negotiation(manager)
+        received = []
+
+        async def on_progress(event):
+            await asyncio.sleep(0)  # a slow callback must not lose events
+            received.append(event.event_type)
+
+        async def program():
+            for _ in range(3):
+                manager.emit_event("neg-1", EventType.NEGOTIATION_ROUND_STARTED)
+                await asyncio.sleep(0)
+            return "result"
+
+        client = SimpleNamespace(state_manager=manager, on_session_progress=on_progress)
+        result = await ShaketClient._run_with_progress(client, "neg-1", program())
+        return result, received, manager._subscribers
+
+    result, received, subscribers = asyncio.run(main())
+
+    assert result == "result"
+    assert received == [EventType.NEGOTIATION_ROUND_STARTED] * 3
+    # The pump's subscription is removed once the program finishes
+    assert "neg-1" not in subscribers
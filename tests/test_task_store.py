@@ -0,0 +1,106 @@
+"""
+Tests for BoundedTaskStore eviction.
+"""
+
+import asyncio
+
+from a2a.types import Task, TaskState, TaskStatus
+
+from shaket.server import task_store as task_store_module
+from shaket.server.task_store import BoundedTaskStore
+
+
+def _task(task_id: str, state: TaskState = TaskState.completed) -> Task:
+    return Task(id=task_id, context_id="ctx", status=TaskStatus(state=state))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_finished_tasks_are_evicted_past_max_entries():
+    store = BoundedTaskStore(max_entries=2, ttl_seconds=None)
+
+    async def main():
+        for i in range(3):
+            await store.save(_task(f"t{i}"))
+        return [await store.get(f"t{i}") for i in range(3)]
+
+    oldest, *rest = asyncio.run(main())
+
+    # The least recently saved task is gone, get() reports it as missing
+    assert oldest is None
+    assert [t.id for t in rest] == ["t1", "t2"]
+
+
+def test_running_tasks_are_not_evicted_for_size():
+    store = BoundedTaskStore(max_entries=2, ttl_seconds=None)
+
+    async def main():
+        await store.save(_task("running", TaskState.working))
+        await store.save(_task("done"))
+        await store.save(_task("done-2"))
+        return {t: await store.get(t) for t in ("running", "done", "done-2")}
+
+    tasks = asyncio.run(main())
+
+    assert tasks["running"] is not None
+    assert tasks["done"] is None
+    assert tasks["done-2"] is not None
+
+
+def test_resaving_a_task_refreshes_its_position():
+    store = BoundedTaskStore(max_entries=2, ttl_seconds=None)
+
+    async def main():
+        await store.save(_task("t0"))
+        await store.save(_task("t1"))
+        await store.save(_task("t0"))  # t1 is now the least recently saved
+        await store.save(_task("t2"))
+        return await store.get("t0"), await store.get("t1")
+
+    t0, t1 = asyncio.run(main())
+
+    assert t0 is not None
+    assert t1 is None
+
+
+def test_tasks_expire_after_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(task_store_module.time, "monotonic", clock)
+    store = BoundedTaskStore(max_entries=100, ttl_seconds=60)
+
+    async def main():
+        await store.save(_task("old", TaskState.working))
+        clock.now += 30
+        await store.save(_task("recent"))
+        clock.now += 45  # "old" is now 75s old, "recent" 45s
+        await store.save(_task("new"))
+        return {t: await store.get(t) for t in ("old", "recent", "new")}
+
+    tasks = asyncio.run(main())
+
+    # Expired tasks go whatever their state
+    assert tasks["old"] is None
+    assert tasks["recent"] is not None
+    assert tasks["new"] is not None
+
+
+def test_delete_forgets_the_task():
+    store = BoundedTaskStore(max_entries=1, ttl_seconds=None)
+
+    async def main():
+        await store.save(_task("t0"))
+        await store.delete("t0")
+        await store.save(_task("t1"))
+        return await store.get("t0"), await store.get("t1")
+
+    t0, t1 = asyncio.run(main())
+
+    assert t0 is None
+    assert t1 is not None
+    assert list(store._saved_at) == ["t1"]